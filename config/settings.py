@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
 from pathlib import Path
+import os
 from datetime import timedelta
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -89,6 +90,30 @@ DATABASES = {
 
 AUTH_USER_MODEL="users.User"
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# 캐시 version(study/cache.py)은 모든 worker가 같은 값을 봐야 하므로 공유 backend(redis, memcached)를 사용한다.
+# CACHE_BACKEND / CACHE_LOCATION / CACHE_KEY_PREFIX 환경 변수로 변경할 수 있다.
+
+CACHES = {
+    "default": {
+        "BACKEND": os.environ.get("CACHE_BACKEND", "django.core.cache.backends.redis.RedisCache"),
+        "LOCATION": os.environ.get("CACHE_LOCATION", "redis://127.0.0.1:6379/1"),
+        "KEY_PREFIX": os.environ.get("CACHE_KEY_PREFIX", "ringle"),
+    }
+}
+
+# 테스트 / benchmark처럼 임시 DB를 사용할 때의 프로세스별 캐시 (공유 캐시에 임시 DB 기준 값이 섞이지 않도록)
+# TEST_RUNNER와 benchmark command가 CACHES 대신 사용한다.
+ISOLATED_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "ringle",
+    }
+}
+
+TEST_RUNNER = "config.test_runner.IsolatedCacheTestRunner"
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -102,6 +127,33 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# 비밀번호 hash (users/hashers.py)
+# manage.py calibrate_hasher로 서버에서 목표 시간에 맞는 값을 측정해 설정한다.
+PASSWORD_HASHING = {
+    "ALGORITHM": "scrypt",  # "scrypt" 또는 "pbkdf2_sha256"
+    "PBKDF2_ITERATIONS": 1_000_000,
+    "SCRYPT_WORK_FACTOR": 2 ** 14,
+    "SCRYPT_BLOCK_SIZE": 8,
+    "SCRYPT_PARALLELISM": 1,
+}
+
+# 첫 번째 hasher로 저장, 나머지는 이전 hash 검증용 (로그인 시 첫 번째 hasher로 다시 저장된다.)
+_PASSWORD_HASHER_CLASSES = {
+    "scrypt": "users.hashers.TunedScryptPasswordHasher",
+    "pbkdf2_sha256": "users.hashers.TunedPBKDF2PasswordHasher",
+}
+PASSWORD_HASHERS = [
+    _PASSWORD_HASHER_CLASSES[PASSWORD_HASHING["ALGORITHM"]],
+    *(path for name, path in _PASSWORD_HASHER_CLASSES.items() if name != PASSWORD_HASHING["ALGORITHM"]),
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+]
+
+# 사용자 일괄 가입 API(/user/import/)의 비밀번호 hash process 수
+# 0이면 요청 process에서 계산 (web worker에서 요청마다 process pool을 만들지 않도록 기본값은 0)
+# 대량 가입은 process pool을 사용하는 import_users command로 실행
+USER_IMPORT_WORKERS = 0
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
 
@@ -126,7 +178,8 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        # token의 role claim으로 인증 (User 조회 없음), User row가 필요한 API는 JWTAuthentication을 직접 지정
+        'users.authentication.JWTClaimsAuthentication',
     ),
 }
 
@@ -138,6 +191,25 @@ SIMPLE_JWT = {
     "ROTATE_REFRESH_TOKENS": False,
     # True로 설정될 경우, 기존에 있던 refresh token은 blacklist가된다.
     "BLACKLIST_AFTER_ROTATION": False,
+    # role, is_staff claim 포함 (users/tokens.py)
+    "AUTH_TOKEN_CLASSES": ("users.tokens.AccessToken",),
+    # 폐기된 refresh token은 RevokedToken으로 확인 (users/revocation.py)
+    "TOKEN_REFRESH_SERIALIZER": "users.serializers.CustomTokenRefreshSerializer",
+}
+
+# refresh token 폐기 목록 Bloom filter (users/revocation.py)
+TOKEN_REVOCATION = {
+    "BLOOM_CAPACITY": 1_000_000,
+    "BLOOM_ERROR_RATE": 0.001,
+    "SYNC_SECONDS": 5,  # 다른 process의 로그아웃 반영 주기
+    "REBUILD_SECONDS": 60 * 60,  # 만료된 jti를 filter에서 비우는 주기
+}
+
+# 수업 자동 매칭 (study/matching.py)
+CLASS_MATCHING = {
+    # 앞의 ranker 점수가 같으면 다음 ranker로 비교 (scores(candidates, start_time)를 구현한 class)
+    "RANKERS": ("study.matching.LeastLoadedRanker",),
+    "MAX_ATTEMPTS": 20,
 }
 
 # swagger config
@@ -1,33 +1,61 @@
 # study/apis.py
 
-from django.conf import settings
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, authentication_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
-from users.permissions import IsTutor, IsStudent
+from users.permissions import IsTutor, IsStudent, IsTutorOrStaff
 
-from .serializers import TutorClassSerializer, StudentClassSerializer
-from .models import TutorClass, StudentClass
+from .serializers import (
+    TutorClassSerializer, StudentClassSerializer,
+    TutorClassSlotSerializer, TutorClassRecurrenceSerializer, TutorClassTemplateSerializer,
+    TutorClassReadSerializer, StudentClassReadSerializer, WaitlistEntryReadSerializer, format_datetime,
+)
+from .models import TutorClass, StudentClass, TutorDayOccupancy, TutorClassTemplate, SlotSupply, WaitlistEntry
+from .availability import (
+    SLOTS_PER_DAY, day_origin, slot_index, slot_time, slot_count, interval_mask,
+    free_start_indexes, expand_recurrence, day_masks, class_mask, MAX_BOOKING_DAYS, booking_horizon,
+)
+from . import cache as availability_cache
+from .pagination import ClassCursorPagination, CursorError, parse_bound
+from . import exports
+from . import matching
+from .timeutils import localize, format_slot_indexes
 
-from datetime import datetime, timedelta, time
-import pytz
+from datetime import datetime, timedelta
+import json
 
 from django.utils import timezone
 from django.shortcuts import get_object_or_404
-from django.db import IntegrityError
+from django.http import StreamingHttpResponse
+from django.db import IntegrityError, transaction
+from django.db.models import Q
 from django.contrib.auth import get_user_model
 User = get_user_model()
 
+MAX_RANGE_DAYS = 31
+HORIZON_MESSAGE = f"오늘부터 {MAX_BOOKING_DAYS}일 이후의 날짜는 조회 / 신청할 수 없습니다."
+
+# 수업 목록 조회 공통 query parameter (study/pagination.py)
+PAGINATION_PARAMETERS = [
+    openapi.Parameter("cursor", openapi.IN_QUERY, description="이전 응답의 next_cursor", type=openapi.TYPE_STRING),
+    openapi.Parameter("limit", openapi.IN_QUERY, description="페이지 크기 (기본 50, 최대 200)", type=openapi.TYPE_INTEGER),
+    openapi.Parameter("from", openapi.IN_QUERY, description="수업 시작 시간 하한 (YYYY-MM-DD 또는 YYYY-MM-DDTHH:MM)", type=openapi.TYPE_STRING),
+    openapi.Parameter("to", openapi.IN_QUERY, description="수업 시작 시간 상한, 미포함 (YYYY-MM-DD 또는 YYYY-MM-DDTHH:MM)", type=openapi.TYPE_STRING),
+    openapi.Parameter("upcoming_only", openapi.IN_QUERY, description="true이면 지금 이후 수업만 조회", type=openapi.TYPE_BOOLEAN),
+]
+
 class TutorClassAPI(APIView):
     permission_classes = [IsTutor]
 
     @swagger_auto_schema(
+        manual_parameters=PAGINATION_PARAMETERS,
         responses = {
             200:openapi.Response(
                 description="나의 수업 리스트 조회 완료",
@@ -41,7 +69,8 @@ class TutorClassAPI(APIView):
                                 "start_time": "2025-06-07T13:00:00+09:00",
                                 "duration": 30
                             }
-                        ]
+                        ],
+                        "next_cursor": "MjAyNS0wNi0wN1QwNDowMDowMCswMDowMHwxMw"
                     }
                 }
             ), 
@@ -52,16 +81,22 @@ class TutorClassAPI(APIView):
         """
             나의 수업 리스트를 조회 합니다.
 
-            나의 수업 리스트를 조회 합니다.
+            시작 시간 순서로 limit개씩 조회하며, 다음 페이지는 응답의 next_cursor를 cursor로 넘겨 조회합니다.
+            (마지막 페이지이면 next_cursor는 null)
         """
-        tutor = request.user
-        available_slots = tutor.open_class_times.all()
+        try:
+            available_slots, next_cursor = ClassCursorPagination().paginate(
+                TutorClassReadSerializer.values(TutorClass.objects.filter(tutor_id=request.user.id)), request.query_params
+            )
+        except CursorError as e:
+            return Response({"message": str(e)}, status=400)
 
-        serializer = TutorClassSerializer(available_slots, many=True)
+        serializer = TutorClassReadSerializer(available_slots)
 
         data = {
             "message": "수업 리스트 조회 완료", 
-            "data": serializer.data
+            "data": serializer.data,
+            "next_cursor": next_cursor,
         }
         return Response(data, status=status.HTTP_200_OK)
     
@@ -94,7 +129,9 @@ class TutorClassAPI(APIView):
 
         if serializer.is_valid():
             try:
-                serializer.save(tutor=request.user)
+                # post_save signal의 점유 / 슬롯 현황 갱신과 대기자 배정까지 같은 transaction에서 처리
+                with transaction.atomic():
+                    serializer.save(tutor_id=request.user.id)
             except IntegrityError:
                 return Response({"message":"이미 해당 시간에 등록된 수업이 있습니다."}, status=400)
             
@@ -130,7 +167,7 @@ class TutorClassAPI(APIView):
 
         instance = get_object_or_404(TutorClass, pk=class_id)
 
-        if instance.tutor != request.user:
+        if instance.tutor_id != request.user.id:
             return Response({"message":"권한이 없는 수업입니다."}, status=status.HTTP_403_FORBIDDEN)
 
         if not instance.status:
@@ -139,11 +176,227 @@ class TutorClassAPI(APIView):
         else:
             return Response({"message":"수강생이 존재하는 수업입니다. 삭제할 수 없습니다."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+class TutorClassBulkAPI(APIView):
+    permission_classes = [IsTutor]
+
+    MAX_SLOTS = 500
+
+    @swagger_auto_schema(
+        request_body = openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                "slots":openapi.Schema(
+                    type=openapi.TYPE_ARRAY,
+                    items=openapi.Schema(
+                        type=openapi.TYPE_OBJECT,
+                        properties={
+                            "start_time":openapi.Schema(type=openapi.TYPE_STRING, format=openapi.FORMAT_DATETIME, example="2025-06-07T13:00:00"),
+                            "duration":openapi.Schema(type=openapi.TYPE_INTEGER, example=30),
+                        }
+                    )
+                ),
+                "recurrence":openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "start_date":openapi.Schema(type=openapi.TYPE_STRING, example="2025-06-02"),
+                        "end_date":openapi.Schema(type=openapi.TYPE_STRING, example="2025-06-08"),
+                        "weekdays":openapi.Schema(type=openapi.TYPE_ARRAY, items=openapi.Schema(type=openapi.TYPE_INTEGER), example=[0, 2]),
+                        "start":openapi.Schema(type=openapi.TYPE_STRING, example="19:00"),
+                        "end":openapi.Schema(type=openapi.TYPE_STRING, example="22:00"),
+                        "duration":openapi.Schema(type=openapi.TYPE_INTEGER, example=30),
+                    }
+                ),
+            }
+        ),
+        responses = {
+            201:openapi.Response(
+                description="수업 일괄 생성 결과",
+                examples={
+                    "application/json": {
+                        "message": "수업이 생성되었습니다.",
+                        "accepted": [
+                            {"index": 0, "id": 13, "start_time": "2025-06-07T13:00:00", "duration": 30}
+                        ],
+                        "rejected": [
+                            {"index": 1, "start_time": "2025-06-07T13:00:00", "duration": 30, "errors": {"message": ["이미 겹치는 수업이 존재합니다."]}}
+                        ]
+                    }
+                }
+            ),
+            400:"수업 생성 실패."
+        }
+    )
+    def post(self, request):
+        """
+            여러 수업을 한 번에 생성합니다.
+
+            slots (start_time, duration 목록) 또는 recurrence (요일 반복 규칙) 중 하나를 입력합니다.
+            수업별로 생성 여부(accepted / rejected)를 반환합니다.
+        """
+        if "recurrence" in request.data:
+            recurrence = TutorClassRecurrenceSerializer(data=request.data["recurrence"])
+            if not recurrence.is_valid():
+                return Response(recurrence.errors, status=400)
+
+            rule = recurrence.validated_data
+            items = [
+                {"start_time": start.isoformat(), "duration": rule["duration"]}
+                for start in expand_recurrence(
+                    rule["start_date"], rule["end_date"], rule["weekdays"],
+                    rule["start"], rule["end"], rule["duration"],
+                )
+            ]
+        else:
+            items = request.data.get("slots")
+            if not isinstance(items, list) or not items:
+                return Response({"message": "slots 또는 recurrence를 입력하세요."}, status=400)
+
+        if len(items) > self.MAX_SLOTS:
+            return Response({"message": f"한 번에 최대 {self.MAX_SLOTS}개의 수업만 생성할 수 있습니다."}, status=400)
+
+        slot_serializers = [TutorClassSlotSerializer(data=item) for item in items]
+        valid = [serializer.is_valid() for serializer in slot_serializers]
+
+        candidates = [
+            (serializer.validated_data["start_time"], serializer.validated_data["duration"])
+            for serializer, is_valid in zip(slot_serializers, valid) if is_valid
+        ]
+
+        accepted = []
+        rejected = []
+        slots = []
+
+        with transaction.atomic():
+            # 기존 수업 점유 상태를 한 번에 조회 후 요청된 수업끼리도 같은 mask 위에서 검증
+            fits = iter(TutorDayOccupancy.objects.fit(request.user.id, candidates))
+
+            for index, (serializer, is_valid) in enumerate(zip(slot_serializers, valid)):
+                item = serializer.initial_data if isinstance(serializer.initial_data, dict) else {}
+                result = {"index": index, "start_time": item.get("start_time"), "duration": item.get("duration")}
+
+                if not is_valid:
+                    rejected.append({**result, "errors": serializer.errors})
+                    continue
+
+                if not next(fits):
+                    rejected.append({**result, "errors": {"message": ["이미 겹치는 수업이 존재합니다."]}})
+                    continue
+
+                accepted.append(result)
+                slots.append((serializer.validated_data["start_time"], serializer.validated_data["duration"]))
+
+            try:
+                with transaction.atomic():
+                    classes = TutorClass.objects.bulk_open(request.user.id, slots)
+            except IntegrityError:
+                return Response({"message":"이미 해당 시간에 등록된 수업이 있습니다."}, status=400)
+
+        for result, tutor_class in zip(accepted, classes):
+            result["id"] = tutor_class.id
+
+        data = {
+            "message": "수업이 생성되었습니다." if accepted else "생성된 수업이 없습니다.",
+            "accepted": accepted,
+            "rejected": rejected,
+        }
+        return Response(data, status=status.HTTP_201_CREATED if accepted else 400)
+
+class TutorClassTemplateAPI(APIView):
+    permission_classes = [IsTutor]
+
+    @swagger_auto_schema(
+        responses = {
+            200:openapi.Response(
+                description="나의 반복 수업 템플릿 리스트",
+                schema=TutorClassTemplateSerializer(many=True)
+            )
+        }
+    )
+    def get(self, request):
+        """
+            나의 반복 수업 템플릿을 조회합니다.
+
+            나의 반복 수업 템플릿을 조회합니다.
+        """
+        templates = TutorClassTemplate.objects.filter(tutor_id=request.user.id)
+        serializer = TutorClassTemplateSerializer(templates, many=True)
+
+        return Response({"message": "템플릿 리스트 조회 완료", "data": serializer.data}, status=status.HTTP_200_OK)
+
+    @swagger_auto_schema(
+        request_body = openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            required=["weekday", "start_time", "end_time", "duration"],
+            properties={
+                "weekday":openapi.Schema(type=openapi.TYPE_INTEGER, description="요일 (월=0 ~ 일=6)", example=0),
+                "start_time":openapi.Schema(type=openapi.TYPE_STRING, example="19:00"),
+                "end_time":openapi.Schema(type=openapi.TYPE_STRING, example="22:00"),
+                "duration":openapi.Schema(type=openapi.TYPE_INTEGER, example=30),
+            }
+        ),
+        responses = {
+            201:openapi.Response("템플릿이 생성되었습니다."),
+            400:"템플릿 생성 실패."
+        }
+    )
+    def post(self, request):
+        """
+            매주 반복되는 수업 템플릿을 생성합니다.
+
+            입력한 요일의 start_time ~ end_time을 duration 단위로 나눈 수업이 열립니다. ("현지 시간" 기준)
+            수업은 해당 날짜가 조회될 때 생성되며, 이미 있는 수업과 겹치는 시간은 제외됩니다.
+        """
+        serializer = TutorClassTemplateSerializer(data=request.data, context={"request": request})
+
+        if serializer.is_valid():
+            serializer.save(tutor_id=request.user.id)
+            availability_cache.bump(availability_cache.TEMPLATE_SCOPE)
+            return Response({"message":"템플릿이 생성되었습니다.", "data": serializer.data}, status=status.HTTP_201_CREATED)
+
+        return Response(serializer.errors, status=400)
+
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter(
+                "template_id", openapi.IN_QUERY,
+                description="삭제할 템플릿의 ID",
+                type=openapi.TYPE_INTEGER,
+                required=True,
+                example=1
+            )
+        ],
+        responses={
+            200:openapi.Response("템플릿이 삭제되었습니다."),
+            403:"권한이 없는 템플릿입니다.",
+            404:"존재하지 않는 템플릿입니다.",
+        }
+    )
+    def delete(self, request):
+        """
+            반복 수업 템플릿을 삭제합니다.
+
+            템플릿으로 생성된 수업 중 신청되지 않은 앞으로의 수업도 함께 삭제됩니다.
+        """
+        template_id = request.query_params.get("template_id")
+
+        instance = get_object_or_404(TutorClassTemplate, pk=template_id)
+
+        if instance.tutor_id != request.user.id:
+            return Response({"message":"권한이 없는 템플릿입니다."}, status=status.HTTP_403_FORBIDDEN)
+
+        with transaction.atomic():
+            instance.classes.filter(status=False, start_time__gte=timezone.now()).delete()
+            instance.delete()
+        availability_cache.bump(availability_cache.TEMPLATE_SCOPE)
+
+        return Response({"message":"템플릿이 삭제되었습니다."}, status=status.HTTP_200_OK)
+
 class StudentClassAPI(APIView):
 
     permission_classes = [IsAuthenticated]
 
     @swagger_auto_schema(
+        manual_parameters=PAGINATION_PARAMETERS,
         responses={
             200:openapi.Response(
                 description="신청한 수업 리스트",
@@ -155,15 +408,26 @@ class StudentClassAPI(APIView):
         """
             내가 신청한 수업을 조회합니다.
 
-            내가 신청한 수업을 조회합니다.
+            수업 시작 시간 순서로 limit개씩 조회하며, 다음 페이지는 응답의 next_cursor를 cursor로 넘겨 조회합니다.
+            (마지막 페이지이면 next_cursor는 null)
         """
-        student = request.user
+        # 정렬 기준(tutor_class__start_time)이 JOIN한 column이므로 페이지마다 내 신청 전체를 읽어 정렬한다. (study/pagination.py)
+        pagination = ClassCursorPagination(start_field="tutor_class__start_time", id_field="tutor_class_id")
+        try:
+            classes, next_cursor = pagination.paginate(
+                StudentClassReadSerializer.values(
+                    StudentClass.objects.filter(student_id=request.user.id), "tutor_class__start_time"
+                ),
+                request.query_params,
+            )
+        except CursorError as e:
+            return Response({"message": str(e)}, status=400)
 
-        classes = StudentClass.objects.filter(student=student)
-        serializer = StudentClassSerializer(classes, many=True)
+        serializer = StudentClassReadSerializer(classes)
 
         data = {
-            "data" : serializer.data
+            "data" : serializer.data,
+            "next_cursor": next_cursor,
         }
 
         return Response(data, status=status.HTTP_200_OK)
@@ -178,8 +442,8 @@ class StudentClassAPI(APIView):
         ),
         responses={
             201:"수업 신청 완료", 
-            400:"신청 실패", 
-            404:"존재하지 않는 수업입니다."
+            404:"존재하지 않는 수업입니다.",
+            409:"이미 신청된 수업입니다."
         }
     )
     def post(self, request):
@@ -189,12 +453,18 @@ class StudentClassAPI(APIView):
             선택한 수업을 신청합니다.
         """
         class_id = request.data.get("class_id")
-        tutor_class = get_object_or_404(TutorClass, id=class_id)
 
-        if tutor_class.status:  # 이미 신청된 수업
-            return Response({"message":"이미 신청된 수업입니다."}, status=400)
+        try:
+            student_class = StudentClass.objects.book(request.user.id, class_id)
+        except IntegrityError:  # status와 신청 row가 어긋난 경우
+            student_class = None
 
-        StudentClass.objects.create(student=request.user, tutor_class=tutor_class)
+        if student_class is None:
+            if not TutorClass.objects.filter(id=class_id).exists():
+                return Response({"message":"존재하지 않는 수업입니다."}, status=status.HTTP_404_NOT_FOUND)
+
+            # 이미 신청된 수업 (동시에 신청한 경우 먼저 처리된 한 명만 성공)
+            return Response({"message":"이미 신청된 수업입니다."}, status=status.HTTP_409_CONFLICT)
 
         return Response({"message":"수업신청이 완료되었습니다."}, status=201)
 
@@ -223,14 +493,319 @@ class StudentClassAPI(APIView):
 
         class_id = request.query_params.get("class_id")
 
-        instance = get_object_or_404(StudentClass, pk=class_id)
+        # 취소 후 캐시 무효화에 수업 시간이 필요하므로 함께 조회
+        instance = get_object_or_404(StudentClass.objects.select_related("tutor_class"), pk=class_id)
 
-        if instance.student != request.user:
+        if instance.student_id != request.user.id:
             return Response({"message": "권한이 없는 수업입니다."}, status=status.HTTP_403_FORBIDDEN)
 
         instance.delete()
         return Response({"message": "수업이 취소되었습니다."}, status=status.HTTP_200_OK)
 
+def booking_slot(request):
+    """
+        자동 신청 / 대기 등록 요청의 start_time, duration 검증
+
+        ((start_time, duration), None) 또는 (None, 에러 Response)를 반환한다.
+        반복 템플릿 수업을 해당 날짜까지 생성하고, 내가 신청한 다른 수업과 겹치는 시간이면 409를 반환한다.
+    """
+    try:
+        start_time = timezone.localtime(localize(datetime.fromisoformat(str(request.data.get("start_time")))))
+    except (ValueError, OverflowError):  # OverflowError: TIME_ZONE으로 변환하면 날짜 범위(1 ~ 9999년)를 넘는 경우
+        return None, Response({"message": "start_time 형식이 올바르지 않습니다. 예: 2025-04-27T13:00:00"}, status=400)
+
+    try:
+        duration = int(request.data.get("duration"))
+        if duration not in (30, 60):
+            raise ValueError
+    except (TypeError, ValueError):
+        return None, Response({"message": "duration은 30 또는 60만 가능합니다."}, status=400)
+
+    if start_time < timezone.now():
+        return None, Response({"message": "이미 지난 시간입니다."}, status=400)
+
+    local_date = start_time.date()
+    if local_date > booking_horizon():
+        return None, Response({"message": HORIZON_MESSAGE}, status=400)
+
+    # 반복 템플릿 수업을 해당 날짜까지 생성
+    availability_cache.materialize_templates(local_date, local_date)
+
+    # 내가 신청한 다른 수업과 겹치는 시간이면 신청하지 않는다.
+    origin = day_origin(local_date)
+    if availability_cache.student_mask(request.user.id, local_date) & class_mask(start_time, duration, origin):
+        return None, Response({"message": "이미 신청한 수업과 시간이 겹칩니다."}, status=status.HTTP_409_CONFLICT)
+
+    return (start_time, duration), None
+
+class StudentClassAutoBookAPI(APIView):
+
+    permission_classes = [IsStudent]
+
+    @swagger_auto_schema(
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            required=["start_time", "duration"],
+            properties={
+                "start_time": openapi.Schema(type=openapi.TYPE_STRING, format=openapi.FORMAT_DATETIME, description="수업 시작 시간", example="2025-06-07T13:00:00"),
+                "duration": openapi.Schema(type=openapi.TYPE_INTEGER, description="수업 길이 (30 또는 60분)", example=30),
+            }
+        ),
+        responses={
+            201: openapi.Response(
+                description="수업 신청 완료",
+                examples={
+                    "application/json": {"message": "수업신청이 완료되었습니다.", "class_id": 13, "tutor": 5}
+                }
+            ),
+            400: "잘못된 입력 형식",
+            404: "신청 가능한 수업이 없습니다.",
+            409: "이미 신청한 수업과 시간이 겹칩니다.",
+        }
+    )
+    def post(self, request):
+        """
+            시작 시간과 수업 길이로 tutor를 자동으로 골라 수업을 신청합니다.
+
+            신청 가능한 수업을 ranker(settings.CLASS_MATCHING) 순서로 정렬해 앞에서부터 신청을 시도합니다. (study/matching.py)
+            다른 학생이 먼저 신청한 수업은 기다리지 않고 다음 수업으로 넘어갑니다.
+        """
+        slot, error = booking_slot(request)
+        if error is not None:
+            return error
+        start_time, duration = slot
+
+        booked = matching.auto_book(request.user.id, start_time, duration)
+        if booked is None:
+            return Response({"message": "신청 가능한 수업이 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+
+        data = {
+            "message": "수업신청이 완료되었습니다.",
+            "class_id": booked.class_id,
+            "tutor": booked.tutor_id,
+        }
+        return Response(data, status=201)
+
+WAITLIST_ENTRY_EXAMPLE = {
+    "id": 3,
+    "start_time": "2025-06-07T19:00:00+09:00",
+    "duration": 30,
+    "status": "waiting",
+    "position": 2,
+    "class_id": None,
+    "created_at": "2025-06-01T10:12:45.123456+09:00",
+}
+
+def waitlist_version(student_id):
+    """대기 상태가 바뀔 때마다 바뀌는 값 (캐시 version, DB 조회 없음)"""
+    return str(availability_cache.versions(availability_cache.waitlist_scope(student_id))[0])
+
+class WaitlistAPI(APIView):
+
+    permission_classes = [IsStudent]
+
+    @swagger_auto_schema(
+        responses={
+            200: openapi.Response(
+                description="나의 대기 목록 (지금 이후 시간)",
+                examples={
+                    "application/json": {"data": [WAITLIST_ENTRY_EXAMPLE], "version": "1717200000000000000"}
+                }
+            )
+        }
+    )
+    def get(self, request):
+        """
+            나의 대기 목록과 대기 순번을 조회합니다.
+
+            status: waiting(대기, position = 순번) / assigned(배정, class_id = 신청된 수업) / cancelled(취소)
+            version은 대기 상태가 바뀔 때만 바뀌므로 /study/async/waitlist/?version=...&wait=30 으로 변경을 기다릴 수 있습니다.
+        """
+        entries = WaitlistEntryReadSerializer.values(WaitlistEntry.objects.for_student(request.user.id))
+
+        data = {
+            "data": WaitlistEntryReadSerializer(entries).data,
+            "version": waitlist_version(request.user.id),
+        }
+        return Response(data, status=status.HTTP_200_OK)
+
+    @swagger_auto_schema(
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            required=["start_time", "duration"],
+            properties={
+                "start_time": openapi.Schema(type=openapi.TYPE_STRING, format=openapi.FORMAT_DATETIME, description="대기할 수업 시작 시간", example="2025-06-07T19:00:00"),
+                "duration": openapi.Schema(type=openapi.TYPE_INTEGER, description="수업 길이 (30 또는 60분)", example=30),
+            }
+        ),
+        responses={
+            201: openapi.Response(description="대기 등록 완료", examples={"application/json": {"message": "대기 등록이 완료되었습니다.", "data": WAITLIST_ENTRY_EXAMPLE}}),
+            400: "잘못된 입력 형식",
+            409: "이미 대기 중이거나 신청한 수업과 시간이 겹침",
+        }
+    )
+    def post(self, request):
+        """
+            수업이 모두 신청된 시간에 대기 등록합니다.
+
+            신청이 취소되거나 같은 시간에 수업이 생기면 먼저 등록한 순서대로 자동으로 신청됩니다.
+            등록 시점에 신청 가능한 수업이 있고 앞선 대기자가 없으면 바로 신청됩니다. (status: assigned)
+        """
+        slot, error = booking_slot(request)
+        if error is not None:
+            return error
+        start_time, duration = slot
+
+        try:
+            with transaction.atomic():
+                entry = WaitlistEntry.objects.create(student_id=request.user.id, start_time=start_time, duration=duration)
+                availability_cache.bump(availability_cache.waitlist_scope(request.user.id))
+                WaitlistEntry.objects.assign(start_time, duration)
+        except IntegrityError:
+            return Response({"message": "이미 대기 중인 시간입니다."}, status=status.HTTP_409_CONFLICT)
+
+        entries = WaitlistEntryReadSerializer.values(WaitlistEntry.objects.for_student(request.user.id).filter(id=entry.id))
+
+        data = {
+            "message": "대기 등록이 완료되었습니다.",
+            "data": WaitlistEntryReadSerializer(entries).data[0],
+        }
+        return Response(data, status=201)
+
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter("id", openapi.IN_QUERY, description="취소할 대기 ID", type=openapi.TYPE_INTEGER, required=True, example=3)
+        ],
+        responses={
+            200: "대기가 취소되었습니다.",
+            404: "대기 중인 항목이 없습니다.",
+        }
+    )
+    def delete(self, request):
+        """
+            대기를 취소합니다.
+
+            대기를 취소합니다. (이미 배정된 수업은 수업 취소 API로 취소합니다.)
+        """
+        try:
+            entry = WaitlistEntry.objects.filter(
+                id=int(request.query_params.get("id", "")), student_id=request.user.id, status=WaitlistEntry.Status.WAITING
+            ).first()
+        except ValueError:
+            entry = None
+
+        if entry is None:
+            return Response({"message": "대기 중인 항목이 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+
+        WaitlistEntry.objects.close(entry, WaitlistEntry.Status.CANCELLED)
+        return Response({"message": "대기가 취소되었습니다."}, status=status.HTTP_200_OK)
+
+def first_slot_index(date, now, origin):
+    """오늘(TIME_ZONE 기준)이라면 현재 시간 기준 30분 이후부터 시작 => 현재 18:10 일경우 18:30 부터 시작"""
+    now = timezone.localtime(now)
+    if date != now.date():
+        return 0
+
+    start = now.replace(minute=0, second=0, microsecond=0) + timedelta(minutes=((now.minute // 30) + 1) * 30)
+    return max(slot_index(start, origin), 0)
+
+# available-time / available-class 공통 검증 / 계산 (sync view와 async_apis.py에서 함께 사용, DB 조회 없음)
+
+class ParamError(ValueError):
+    """query parameter 검증 실패 (메시지를 그대로 400 응답으로 보낸다.)"""
+
+
+def available_time_params(params, now):
+    """available-time의 date, duration 검증 => (date, duration)"""
+    date_str = params.get("date")
+    duration_str = params.get("duration")
+
+    if not date_str or not duration_str:
+        raise ParamError("날짜와 duration을 입력하세요.")
+
+    try:
+        date = datetime.strptime(date_str, "%Y-%m-%d").date()
+    except ValueError:
+        raise ParamError("날짜 형식이 잘못되었습니다. (YYYY-MM-DD 형식)")
+
+    try:
+        duration = int(duration_str)
+        if duration not in (30, 60):
+            raise ValueError
+    except ValueError:
+        raise ParamError("duration은 30 또는 60만 가능합니다.")
+
+    if date < timezone.localdate(now):
+        raise ParamError("이미 지난 날짜입니다.")
+
+    if date > booking_horizon():
+        raise ParamError(HORIZON_MESSAGE)
+
+    return date, duration
+
+
+def tutor_free_slots(mask, date, duration, now):
+    """tutor 점유 mask => 수업을 생성할 수 있는 시작 slot index (23:30 이전에 끝나는 수업만 생성 가능)"""
+    origin = day_origin(date)
+    return free_start_indexes(mask, duration, first=first_slot_index(date, now, origin), last=SLOTS_PER_DAY - 1)
+
+
+def student_open_slots(classes, mask, duration):
+    """날짜별 신청 가능 수업(open_classes) 중 내 신청 mask와 겹치지 않는 시작 slot index"""
+    span = slot_count(duration)
+    return [i for i in classes if not mask & interval_mask(i, i + span)]
+
+
+def available_time_data(role, slots, date):
+    return {
+        "message": f"{role} 사용 가능한 시간대입니다.",
+        "available_times": format_slot_indexes(slots, day_origin(date)),
+    }
+
+
+def available_class_params(params):
+    """available-class의 start_time, duration 검증 => (TIME_ZONE 기준 start_time, duration)"""
+    start_time_str = params.get("start_time")
+    duration = params.get("duration")
+
+    if not start_time_str or not duration:
+        raise ParamError("start_time과 duration은 필수입니다.")
+
+    try:
+        # 입력 문자열을 TIME_ZONE 시간대로 파싱 (다른 offset이 있으면 TIME_ZONE 시간으로 변환)
+        start_time = timezone.localtime(localize(datetime.fromisoformat(start_time_str)))
+    except (ValueError, OverflowError):  # OverflowError: 변환한 날짜가 1 ~ 9999년을 넘는 경우
+        raise ParamError("start_time 형식이 올바르지 않습니다. 예: 2025-04-27T13:00:00")
+
+    try:
+        duration = int(duration)
+    except ValueError:
+        raise ParamError("duration은 정수여야 합니다.")
+
+    if start_time.date() > booking_horizon():
+        raise ParamError(HORIZON_MESSAGE)
+
+    return start_time, duration
+
+
+def class_slot_index(start_time):
+    """start_time이 해당 날짜의 slot 경계이면 slot index, 아니면 None"""
+    origin = day_origin(start_time.date())
+    index = slot_index(start_time, origin)
+    return index if slot_time(index, origin) == start_time else None
+
+
+def available_class_data(classes, start_time, duration):
+    """[(class id, tutor id)] => 응답 데이터 (TutorClassSerializer와 같은 형식)"""
+    local_start_time = format_datetime(start_time)
+    return {
+        "message": "신청 가능한 수업 목록입니다.",
+        "available_classes": [
+            {"id": class_id, "tutor": tutor_id, "start_time": local_start_time, "duration": duration}
+            for class_id, tutor_id in classes
+        ],
+    }
+
 @swagger_auto_schema(
     method="get",
     manual_parameters=[
@@ -279,19 +854,95 @@ def available_time(request):
         student : 해당 날짜에 duration길이의 신청 가능한 수업 시간대
                 tutor가 생성한 수업이 해당 날짜에 없을경우 빈 list가 return 된다.
     """
-    date_str = request.GET.get("date")
-    duration_str = request.GET.get("duration")
+    user = request.user
+    now = timezone.now()
 
-    if not date_str or not duration_str:
-        return Response({"message": "날짜와 duration을 입력하세요."}, status=400)
+    try:
+        date, duration = available_time_params(request.GET, now)
+    except ParamError as e:
+        return Response({"message": str(e)}, status=400)
+
+    # 반복 템플릿 수업을 해당 날짜까지 생성
+    availability_cache.materialize_templates(date, date, tutor_id=user.id if user.role == "tutor" else None)
+
+    available_slots = []
+
+    match user.role:
+
+        case "tutor":
+
+            available_slots = tutor_free_slots(availability_cache.tutor_mask(user.id, date), date, duration, now)
+
+        case "student":
+
+            # 캐시된 날짜별 신청 가능 수업 위에 내 신청 mask만 적용
+            available_slots = student_open_slots(
+                availability_cache.open_classes(date, duration), availability_cache.student_mask(user.id, date), duration
+            )
+
+    return Response(available_time_data(user.role, available_slots, date), status=200)
+
+@swagger_auto_schema(
+    method="get",
+    manual_parameters=[
+        openapi.Parameter(
+            "start_date",
+            openapi.IN_QUERY,
+            description="조회 시작 날짜 (YYYY-MM-DD)",
+            type=openapi.TYPE_STRING,
+            required=True,
+            example="2025-04-27"
+        ),
+        openapi.Parameter(
+            "end_date",
+            openapi.IN_QUERY,
+            description="조회 종료 날짜 (YYYY-MM-DD, 시작 날짜 포함 최대 31일)",
+            type=openapi.TYPE_STRING,
+            required=True,
+            example="2025-05-03"
+        ),
+        openapi.Parameter(
+            "duration",
+            openapi.IN_QUERY,
+            description="수업 길이 (30 또는 60분)",
+            type=openapi.TYPE_INTEGER,
+            required=True,
+            example=30
+        )
+    ],
+    responses={
+        200: openapi.Response(
+            description="날짜별 사용 가능한 시간대 목록",
+            examples={
+                "application/json": {
+                    "message": "사용 가능한 시간대입니다.",
+                    "available_times": {
+                        "2025-04-27": ["2025-04-27 13:30", "2025-04-27 14:00"],
+                        "2025-04-28": [],
+                    }
+                }
+            }
+        ),
+        400: "잘못된 날짜 또는 파라미터 오류",
+    }
+)
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def available_time_range(request):
+    """
+        기간(start_date ~ end_date) 동안 날짜별로 가능한 시간대를 한 번에 조회합니다.
 
+        available-time과 같은 기준으로 계산하며, 최대 31일까지 조회할 수 있습니다.
+        결과는 날짜 순서대로 나누어 전송(streaming)됩니다.
+    """
     try:
-        date = datetime.strptime(date_str, "%Y-%m-%d").date()
+        start_date = datetime.strptime(request.GET.get("start_date", ""), "%Y-%m-%d").date()
+        end_date = datetime.strptime(request.GET.get("end_date", ""), "%Y-%m-%d").date()
     except ValueError:
-        return Response({"message": "날짜 형식이 잘못되었습니다. (YYYY-MM-DD 형식)"}, status=400)
+        return Response({"message": "start_date, end_date를 YYYY-MM-DD 형식으로 입력하세요."}, status=400)
 
     try:
-        duration = int(duration_str)
+        duration = int(request.GET.get("duration", ""))
         if duration not in (30, 60):
             raise ValueError
     except ValueError:
@@ -300,66 +951,78 @@ def available_time(request):
     user = request.user
     now = timezone.now()
 
-    if date < now.date():
+    if start_date < timezone.localdate(now):
         return Response({"message": "이미 지난 날짜입니다."}, status=400)
-    
-    start_of_day = timezone.make_aware(datetime.combine(date, time.min))
-    end_of_day = timezone.make_aware(datetime.combine(date, time(hour=23, minute=30)))
 
-    # 오늘이라면 현재 시간 기준 30분 이후부터 시작 => 현재 18:10 일경우 18:30 부터 시작
-    if date == now.date():
-        minute = ((now.minute // 30) + 1) * 30
-        hour = now.hour + (minute // 60)
-        minute %= 60
-        start_of_day = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if not 0 <= (end_date - start_date).days < MAX_RANGE_DAYS:
+        return Response({"message": f"end_date는 start_date부터 {MAX_RANGE_DAYS}일 이내여야 합니다."}, status=400)
 
-    # 30분 단위 시간대 생성
-    total_slots = int((end_of_day - start_of_day).total_seconds() // (30 * 60))
-    all_slots = [start_of_day + timedelta(minutes=30 * i) for i in range(total_slots + 1)]
+    if end_date > booking_horizon():
+        return Response({"message": HORIZON_MESSAGE}, status=400)
 
-    available_slots = []
+    # 반복 템플릿 수업을 기간 끝까지 생성
+    availability_cache.materialize_templates(start_date, end_date, tutor_id=user.id if user.role == "tutor" else None)
+
+    dates = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+    range_start = day_origin(start_date)
+    range_end = day_origin(end_date) + timedelta(days=1)
 
     match user.role:
 
         case "tutor":
 
-            my_classes = TutorClass.objects.filter(tutor=user, start_time__date=date)
-
-            for i in range(len(all_slots)):
-                slot = all_slots[i]
-                end_slot = slot + timedelta(minutes=duration)
-
-                if end_slot > end_of_day:
-                    continue
+            # 기간 전체의 점유 mask를 한 번에 조회
+            masks = TutorDayOccupancy.objects.masks(user.id, dates)
 
-                conflict = any(
-                    cls.start_time < end_slot and cls.end_time > slot
-                    for cls in my_classes
+            def day_slots(date, origin):
+                return free_start_indexes(
+                    masks[date], duration,
+                    first=first_slot_index(date, now, origin),
+                    last=SLOTS_PER_DAY - 1,
                 )
-                if not conflict:
-                    available_slots.append(timezone.localtime(slot))
 
         case "student":
 
-            classes = TutorClass.objects.filter(start_time__date=date, status=False, duration=duration)
-            my_classes = StudentClass.objects.filter(student=user)
-            my_times = [(sc.tutor_class.start_time, sc.tutor_class.end_time) for sc in my_classes]
-
-            for tutor_class in classes:
-                conflict = any(
-                    my_start < tutor_class.end_time and my_end > tutor_class.start_time
-                    for my_start, my_end in my_times
-                )
-                if not conflict:
-                    available_slots.append(timezone.localtime(tutor_class.start_time))
-    
-    available_slots = sorted(set(available_slots))
-
-    data = {
-        "message": f"{user.role} 사용 가능한 시간대입니다.",
-        "available_times": [slot.strftime("%Y-%m-%d %H:%M") for slot in available_slots]
-    }
-    return Response(data, status=200)
+            # 기간 전체의 신청 가능한 수업 / 겹칠 수 있는 내 신청을 각각 한 번에 조회
+            open_starts = {}
+            classes = TutorClass.objects.filter(
+                start_time__gte=range_start,
+                start_time__lt=range_end,
+                status=False,
+                duration=duration,
+            ).values_list("start_time", flat=True)
+            for start_time in classes:
+                open_starts.setdefault(timezone.localtime(start_time).date(), set()).add(start_time)
+
+            busy = {}
+            my_times = StudentClass.objects.filter(
+                student_id=user.id,
+                tutor_class__start_time__gt=range_start - timedelta(minutes=TutorClass.MAX_DURATION),
+                tutor_class__start_time__lt=range_end + timedelta(minutes=TutorClass.MAX_DURATION),
+            ).values_list("tutor_class__start_time", "tutor_class__duration")
+            for start_time, my_duration in my_times:
+                for date, mask in day_masks(start_time, my_duration):
+                    busy[date] = busy.get(date, 0) | mask
+
+            def day_slots(date, origin):
+                return [
+                    slot_index(start_time, origin)
+                    for start_time in open_starts.get(date, ())
+                    if not any(busy.get(day, 0) & mask for day, mask in day_masks(start_time, duration))
+                ]
+
+        case _:
+            def day_slots(date, origin):
+                return []
+
+    def stream():
+        yield '{"message": %s, "available_times": {' % json.dumps(f"{user.role} 사용 가능한 시간대입니다.", ensure_ascii=False)
+        for i, date in enumerate(dates):
+            origin = day_origin(date)
+            yield ("," if i else "") + f'"{date}": ' + json.dumps(format_slot_indexes(day_slots(date, origin), origin))
+        yield "}}"
+
+    return StreamingHttpResponse(stream(), content_type="application/json")
 
 @swagger_auto_schema(
     method="get",
@@ -410,41 +1073,300 @@ def available_classe(request):
 
         시간대와 수업 길이로 신청 가능한 수업을 조회합니다.
     """
-    start_time_str = request.GET.get("start_time")
-    duration = request.GET.get("duration")
+    try:
+        start_time, duration = available_class_params(request.GET)
+    except ParamError as e:
+        return Response({"message": str(e)}, status=400)
 
-    if not start_time_str or not duration:
-        return Response({"message": "start_time과 duration은 필수입니다."}, status=400)
+    # 반복 템플릿 수업을 해당 날짜까지 생성
+    local_date = start_time.date()
+    availability_cache.materialize_templates(local_date, local_date)
+
+    # 해당 시간에 신청 가능한 수업 (내가 신청한 수업은 이미 status=True 이므로 제외되어 있다.)
+    index = class_slot_index(start_time)
+    classes = availability_cache.open_classes(local_date, duration).get(index, []) if index is not None else []
+
+    return Response(available_class_data(classes, start_time, duration), status=200)
+
+
+def daily_windows(start_date, end_date, time_from, time_to, duration):
+    """
+        start_date ~ end_date 날짜마다 time_from 이후 시작해 time_to까지 끝나는 수업의 시작 시간 범위 [start, end]
+        time_to가 time_from보다 이르거나 같으면 다음 날 time_to까지 (ex. 22:00 ~ 02:00, 00:00 ~ 00:00은 하루 전체)
+    """
+    windows = []
+    for i in range((end_date - start_date).days + 1):
+        date = start_date + timedelta(days=i)
+        end_day = date + timedelta(days=1) if time_to <= time_from else date
+        start = localize(datetime.combine(date, time_from))
+        end = localize(datetime.combine(end_day, time_to)) - timedelta(minutes=duration)
+        if start <= end:
+            windows.append((start, end))
+    return windows
+
+@swagger_auto_schema(
+    method="get",
+    manual_parameters=[
+        openapi.Parameter("duration", openapi.IN_QUERY, description="수업 길이 (30 또는 60분)", type=openapi.TYPE_INTEGER, required=True, example=30),
+        openapi.Parameter("from", openapi.IN_QUERY, description="검색 시작 (YYYY-MM-DD 또는 YYYY-MM-DDTHH:MM)", type=openapi.TYPE_STRING, required=True, example="2025-04-27"),
+        openapi.Parameter("to", openapi.IN_QUERY, description="검색 종료, 미포함 (YYYY-MM-DD 또는 YYYY-MM-DDTHH:MM, 최대 31일)", type=openapi.TYPE_STRING, required=True, example="2025-05-04"),
+        openapi.Parameter("time_from", openapi.IN_QUERY, description="날짜마다 이 시간 이후 시작하는 수업만 (HH:MM)", type=openapi.TYPE_STRING, example="19:00"),
+        openapi.Parameter("time_to", openapi.IN_QUERY, description="날짜마다 이 시간까지 끝나는 수업만 (HH:MM)", type=openapi.TYPE_STRING, example="23:00"),
+        openapi.Parameter("tutor_id", openapi.IN_QUERY, description="tutor로 제한 (여러 번 지정 가능)", type=openapi.TYPE_ARRAY, items=openapi.Items(type=openapi.TYPE_INTEGER), collection_format="multi"),
+        openapi.Parameter("cursor", openapi.IN_QUERY, description="이전 응답의 next_cursor", type=openapi.TYPE_STRING),
+        openapi.Parameter("limit", openapi.IN_QUERY, description="최대 결과 수 (기본 50, 최대 200)", type=openapi.TYPE_INTEGER),
+    ],
+    responses={
+        200: openapi.Response(
+            description="신청 가능한 수업 목록 (시작 시간 순)",
+            examples={
+                "application/json": {
+                    "message": "신청 가능한 수업 목록입니다.",
+                    "available_classes": [
+                        {"id": 1, "tutor": 3, "start_time": "2025-04-27T19:00:00+09:00", "duration": 30},
+                        {"id": 8, "tutor": 5, "start_time": "2025-04-28T21:30:00+09:00", "duration": 30},
+                    ],
+                    "next_cursor": None,
+                }
+            }
+        ),
+        400: "잘못된 입력 형식",
+    }
+)
+@api_view(["GET"])
+@permission_classes([IsStudent])
+def available_class_search(request):
+    """
+        기간 / 시간대 / tutor로 신청 가능한 수업을 검색합니다.
+
+        신청 가능한 수업만 담는 partial index (study_open_class_idx: duration, start_time)를 시작 시간 순으로 읽으므로
+        조회 비용은 전체 수업 수가 아니라 결과 수(limit)에 비례합니다.
+    """
+    try:
+        duration = int(request.GET.get("duration", ""))
+        if duration not in (30, 60):
+            raise ValueError
+    except ValueError:
+        return Response({"message": "duration은 30 또는 60만 가능합니다."}, status=400)
+
+    if not request.GET.get("from") or not request.GET.get("to"):
+        return Response({"message": "from과 to는 필수입니다."}, status=400)
 
     try:
-        # 입력 문자열을 TIME_ZONE 시간대로 파싱 및 UTC 변경
-        local_tz = pytz.timezone(settings.TIME_ZONE)
-        naive_dt = datetime.fromisoformat(start_time_str)
-        start_time = local_tz.localize(naive_dt) # local time
-        start_time_utc = start_time.astimezone(pytz.UTC) # utc time
-    except Exception as e:
-        return Response({"message": "start_time 형식이 올바르지 않습니다. 예: 2025-04-27T13:00:00"}, status=400)
+        window_start = parse_bound(request.GET["from"], "from")
+        window_end = parse_bound(request.GET["to"], "to")
+    except CursorError as e:
+        return Response({"message": str(e)}, status=400)
+
+    if not timedelta(0) < window_end - window_start <= timedelta(days=MAX_RANGE_DAYS):
+        return Response({"message": f"to는 from 이후 {MAX_RANGE_DAYS}일 이내여야 합니다."}, status=400)
+
+    # 지난 기간 / 신청 가능 기간 이후는 날짜를 계산하기 전에 거절 (0001년, 9999년 등 날짜 범위 초과 방지)
+    if window_end <= timezone.now():
+        return Response({"message": "이미 지난 기간입니다."}, status=400)
+    if window_end > day_origin(booking_horizon() + timedelta(days=1)):
+        return Response({"message": HORIZON_MESSAGE}, status=400)
 
     try:
-        duration = int(duration)
+        time_from = datetime.strptime(request.GET.get("time_from") or "00:00", "%H:%M").time()
+        time_to = datetime.strptime(request.GET.get("time_to") or "00:00", "%H:%M").time()
     except ValueError:
-        return Response({"message": "duration은 정수여야 합니다."}, status=400)
+        return Response({"message": "time_from, time_to는 HH:MM 형식으로 입력하세요."}, status=400)
 
-    my_class_ids = StudentClass.objects.filter(student=request.user).values_list("tutor_class_id", flat=True)
+    try:
+        tutor_ids = [int(tutor_id) for tutor_id in request.GET.getlist("tutor_id")]
+    except ValueError:
+        return Response({"message": "tutor_id는 숫자로 입력하세요."}, status=400)
 
-    # 해당 시간에 신청 가능한 수업 필터링
-    classes = TutorClass.objects.filter(
-        start_time=start_time_utc,
-        duration=duration,
-        status=False
-    ).exclude(id__in=my_class_ids)
+    start_date = timezone.localtime(window_start).date()
+    end_date = timezone.localtime(window_end - timedelta(microseconds=1)).date()
+
+    # 반복 템플릿 수업을 검색 기간까지 생성
+    availability_cache.materialize_templates(start_date, end_date)
 
-    # 응답 데이터 구성
-    serializer = TutorClassSerializer(classes, many=True)
+    classes = TutorClass.objects.filter(
+        status=False, duration=duration, start_time__gte=max(window_start, timezone.now())
+    )
+    if request.GET.get("time_from") or request.GET.get("time_to"):
+        # 날짜별 시작 시간 범위 OR => index 범위 조회 여러 번
+        windows = daily_windows(start_date, end_date, time_from, time_to, duration)
+        if not windows:
+            return Response({"message": "time_from ~ time_to가 수업 길이보다 짧습니다."}, status=400)
+        q = Q()
+        for start, end in windows:
+            q |= Q(start_time__gte=start, start_time__lte=end)
+        classes = classes.filter(q)
+    if tutor_ids:
+        classes = classes.filter(tutor_id__in=tutor_ids)
+
+    params = {key: request.GET[key] for key in ("cursor", "limit", "to") if key in request.GET}
+    try:
+        rows, next_cursor = ClassCursorPagination().paginate(
+            classes.values("id", "tutor_id", "start_time", "duration"), params
+        )
+    except CursorError as e:
+        return Response({"message": str(e)}, status=400)
 
     data = {
         "message": "신청 가능한 수업 목록입니다.",
-        "available_classes": serializer.data
+        "available_classes": [
+            {"id": row["id"], "tutor": row["tutor_id"], "start_time": format_datetime(row["start_time"]), "duration": row["duration"]}
+            for row in rows
+        ],
+        "next_cursor": next_cursor,
+    }
+    return Response(data, status=200)
+
+
+@swagger_auto_schema(
+    method="get",
+    manual_parameters=[
+        openapi.Parameter("month", openapi.IN_QUERY, description="조회할 월 (YYYY-MM)", type=openapi.TYPE_STRING, required=True, example="2025-05"),
+        openapi.Parameter("duration", openapi.IN_QUERY, description="수업 길이 (30 또는 60분)", type=openapi.TYPE_INTEGER, required=True, example=30),
+    ],
+    responses={
+        200: openapi.Response(
+            description="날짜별 48개 슬롯(00:00 ~ 23:30)의 신청 가능한 수업 수 / 신청된 수업 수",
+            examples={
+                "application/json": {
+                    "message": "슬롯별 수업 현황입니다.",
+                    "month": "2025-05",
+                    "duration": 30,
+                    "days": {
+                        "2025-05-01": {"open": [0, 0, "...", 3, 1], "booked": [0, 0, "...", 1, 0]},
+                    }
+                }
+            }
+        ),
+        400: "잘못된 파라미터",
+    }
+)
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def slot_supply(request):
+    """
+        한 달 동안 날짜 / 30분 슬롯별 신청 가능한 수업 수와 신청된 수업 수를 조회합니다.
+
+        미리 집계된 SlotSupply를 (duration, date) index 범위 조회 한 번으로 읽습니다.
+    """
+    try:
+        first_date = datetime.strptime(request.GET.get("month", ""), "%Y-%m").date()
+    except ValueError:
+        return Response({"message": "month를 YYYY-MM 형식으로 입력하세요."}, status=400)
+
+    try:
+        duration = int(request.GET.get("duration", ""))
+        if duration not in (30, 60):
+            raise ValueError
+    except ValueError:
+        return Response({"message": "duration은 30 또는 60만 가능합니다."}, status=400)
+
+    if first_date > booking_horizon():
+        return Response({"message": HORIZON_MESSAGE}, status=400)
+
+    next_month = (first_date + timedelta(days=31)).replace(day=1)
+    dates = [first_date + timedelta(days=i) for i in range((next_month - first_date).days)]
+
+    # 반복 템플릿 수업을 월말까지 생성 (booking_horizon() 이후 날짜는 생성하지 않는다.)
+    availability_cache.materialize_templates(first_date, dates[-1])
+
+    days = {date: {"open": [0] * SLOTS_PER_DAY, "booked": [0] * SLOTS_PER_DAY} for date in dates}
+    rows = SlotSupply.objects.filter(duration=duration, date__gte=first_date, date__lt=next_month).values_list(
+        "date", "slot", "open_count", "booked_count"
+    )
+    for date, slot, open_count, booked_count in rows:
+        days[date]["open"][slot] = open_count
+        days[date]["booked"][slot] = booked_count
+
+    data = {
+        "message": "슬롯별 수업 현황입니다.",
+        "month": first_date.strftime("%Y-%m"),
+        "duration": duration,
+        "days": {str(date): counts for date, counts in days.items()},
+    }
+    return Response(data, status=200)
+
+
+@swagger_auto_schema(
+    method="get",
+    manual_parameters=[
+        openapi.Parameter(
+            "export_format",
+            openapi.IN_QUERY,
+            description="출력 형식 (ndjson 또는 csv, 기본 ndjson)",
+            type=openapi.TYPE_STRING,
+            example="csv"
+        ),
+        openapi.Parameter(
+            "from",
+            openapi.IN_QUERY,
+            description="수업 시작 시간 하한 (YYYY-MM-DD 또는 YYYY-MM-DDTHH:MM)",
+            type=openapi.TYPE_STRING,
+        ),
+        openapi.Parameter(
+            "to",
+            openapi.IN_QUERY,
+            description="수업 시작 시간 상한, 미포함 (YYYY-MM-DD 또는 YYYY-MM-DDTHH:MM)",
+            type=openapi.TYPE_STRING,
+        ),
+        openapi.Parameter(
+            "tutor_id",
+            openapi.IN_QUERY,
+            description="조회할 tutor (관리자만 사용, 없으면 전체)",
+            type=openapi.TYPE_INTEGER,
+        ),
+    ],
+    responses={
+        200: openapi.Response(
+            description="수업 일정 (한 줄에 수업 하나)",
+            examples={
+                "application/x-ndjson": {
+                    "class_id": 13,
+                    "tutor_id": 5,
+                    "tutor_email": "tutor@example.com",
+                    "start_time": "2025-06-07T13:00:00+09:00",
+                    "duration": 30,
+                    "status": True,
+                    "student_id": 7,
+                    "booked_at": "2025-06-01T10:12:45.123456+09:00"
+                }
+            }
+        ),
+        400: "잘못된 파라미터",
     }
+)
+@api_view(["GET"])
+@authentication_classes([JWTAuthentication])  # 관리자 권한(is_staff)은 token claim이 아닌 현재 User row로 확인
+@permission_classes([IsTutorOrStaff])
+def class_export(request):
+    """
+        수업 일정을 신청 정보와 함께 NDJSON 또는 CSV로 내려받습니다.
+
+        tutor는 자신의 수업만, 관리자는 전체(또는 tutor_id의) 수업을 조회합니다.
+        결과는 한 줄씩 전송(streaming)되므로 수업 수와 상관없이 바로 받기 시작합니다.
+    """
+    export_format = request.query_params.get("export_format", "ndjson")
+    if export_format not in exports.FORMATS:
+        return Response({"message": "export_format은 ndjson 또는 csv만 가능합니다."}, status=400)
+
+    try:
+        start = parse_bound(request.query_params["from"], "from") if request.query_params.get("from") else None
+        end = parse_bound(request.query_params["to"], "to") if request.query_params.get("to") else None
+    except CursorError as e:
+        return Response({"message": str(e)}, status=400)
 
-    return Response(data, status=200)
\ No newline at end of file
+    user = request.user
+    tutor_id = user.id
+    if user.is_staff:
+        try:
+            tutor_id = int(request.query_params["tutor_id"]) if request.query_params.get("tutor_id") else None
+        except ValueError:
+            return Response({"message": "tutor_id는 숫자로 입력하세요."}, status=400)
+
+    queryset = exports.export_queryset(tutor_id=tutor_id, start=start, end=end)
+
+    response = StreamingHttpResponse(
+        exports.export_lines(queryset, format=export_format), content_type=exports.FORMATS[export_format]
+    )
+    response["Content-Disposition"] = f'attachment; filename="classes.{export_format}"'
+    return response
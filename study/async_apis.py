@@ -0,0 +1,190 @@
+# study/async_apis.py
+
+"""
+조회 위주 API의 async 버전 (ASGI 배포용)
+
+DRF APIView는 async를 지원하지 않으므로 Django async view로 작성하고,
+JWT 검증/권한 확인은 token claim으로 처리하고 (users/authentication.py와 같은 방식) 수업 조회는 async ORM으로 처리한다.
+ASGI에서 요청마다 thread를 점유하지 않으므로 worker 하나가 더 많은 동시 요청을 처리할 수 있다.
+parameter 검증 / 응답 구성은 apis.py의 공통 함수를 그대로 사용하고, 여기에는 캐시 / ORM 조회(await)만 둔다.
+"""
+
+import asyncio
+import time as timer
+from functools import wraps
+
+from django.http import JsonResponse
+from django.utils import timezone
+from django.views.decorators.http import require_GET
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from users.authentication import JWTClaimsAuthentication, ClaimsUser
+from users.tokens import USER_CLAIMS
+
+from .models import TutorClass, StudentClass, WaitlistEntry
+from .serializers import TutorClassReadSerializer, StudentClassReadSerializer, WaitlistEntryReadSerializer
+from .pagination import ClassCursorPagination, CursorError
+from .apis import (
+    ParamError, available_time_params, tutor_free_slots, student_open_slots, available_time_data,
+    available_class_params, class_slot_index, available_class_data,
+)
+from . import cache as availability_cache
+
+from django.contrib.auth import get_user_model
+User = get_user_model()
+
+
+MAX_WAIT_SECONDS = 30
+POLL_INTERVAL = 0.5
+
+
+def json_response(data, status=200):
+    return JsonResponse(data, status=status, json_dumps_params={"ensure_ascii": False})
+
+
+async def authenticate(request):
+    """Authorization header의 access token으로 user 확인 (없거나 잘못된 token이면 None)"""
+    auth = JWTClaimsAuthentication()
+    header = auth.get_header(request)
+    raw_token = auth.get_raw_token(header) if header else None
+    if raw_token is None:
+        return None
+
+    try:
+        token = auth.get_validated_token(raw_token)
+        user_id = token[api_settings.USER_ID_CLAIM]
+    except (InvalidToken, KeyError):
+        return None
+
+    if all(claim in token for claim in USER_CLAIMS):
+        return ClaimsUser(token)
+
+    # role claim이 없는 이전 token은 User row 조회
+    return await User.objects.filter(**{api_settings.USER_ID_FIELD: user_id}, is_active=True).afirst()
+
+
+def login_required(role=None):
+    """인증 (+ role) 확인 후 view(request, user) 호출"""
+    def decorator(view):
+        @wraps(view)
+        async def wrapper(request):
+            user = await authenticate(request)
+            if user is None:
+                return json_response({"message": "인증 정보가 없거나 올바르지 않습니다."}, status=401)
+            if role and user.role != role:
+                return json_response({"message": "권한이 없습니다."}, status=403)
+            return await view(request, user)
+
+        return require_GET(wrapper)
+    return decorator
+
+
+@login_required(role="tutor")
+async def tutor_class_list(request, user):
+    """나의 수업 리스트 조회 (TutorClassAPI.get의 async 버전)"""
+    try:
+        available_slots, next_cursor = await ClassCursorPagination().apaginate(
+            TutorClassReadSerializer.values(TutorClass.objects.filter(tutor_id=user.id)), request.GET
+        )
+    except CursorError as e:
+        return json_response({"message": str(e)}, status=400)
+
+    return json_response({
+        "message": "수업 리스트 조회 완료",
+        "data": TutorClassReadSerializer(available_slots).data,
+        "next_cursor": next_cursor,
+    })
+
+
+@login_required()
+async def student_class_list(request, user):
+    """내가 신청한 수업 조회 (StudentClassAPI.get의 async 버전)"""
+    pagination = ClassCursorPagination(start_field="tutor_class__start_time", id_field="tutor_class_id")
+    try:
+        classes, next_cursor = await pagination.apaginate(
+            StudentClassReadSerializer.values(StudentClass.objects.filter(student_id=user.id), "tutor_class__start_time"),
+            request.GET,
+        )
+    except CursorError as e:
+        return json_response({"message": str(e)}, status=400)
+
+    return json_response({
+        "data": StudentClassReadSerializer(classes).data,
+        "next_cursor": next_cursor,
+    })
+
+
+@login_required()
+async def available_time(request, user):
+    """선택한 날짜 기준으로 가능한 시간대 조회 (apis.available_time의 async 버전)"""
+    now = timezone.now()
+
+    try:
+        date, duration = available_time_params(request.GET, now)
+    except ParamError as e:
+        return json_response({"message": str(e)}, status=400)
+
+    await availability_cache.amaterialize_templates(date, date, tutor_id=user.id if user.role == "tutor" else None)
+
+    available_slots = []
+
+    match user.role:
+
+        case "tutor":
+
+            available_slots = tutor_free_slots(await availability_cache.atutor_mask(user.id, date), date, duration, now)
+
+        case "student":
+
+            available_slots = student_open_slots(
+                await availability_cache.aopen_classes(date, duration),
+                await availability_cache.astudent_mask(user.id, date),
+                duration,
+            )
+
+    return json_response(available_time_data(user.role, available_slots, date))
+
+
+@login_required(role="student")
+async def available_classe(request, user):
+    """시간대와 수업 길이로 신청 가능한 수업 조회 (apis.available_classe의 async 버전)"""
+    try:
+        start_time, duration = available_class_params(request.GET)
+    except ParamError as e:
+        return json_response({"message": str(e)}, status=400)
+
+    local_date = start_time.date()
+    await availability_cache.amaterialize_templates(local_date, local_date)
+
+    index = class_slot_index(start_time)
+    classes = (await availability_cache.aopen_classes(local_date, duration)).get(index, []) if index is not None else []
+
+    return json_response(available_class_data(classes, start_time, duration))
+
+
+@login_required(role="student")
+async def waitlist(request, user):
+    """
+        나의 대기 목록 long-poll (WaitlistAPI.get의 async 버전)
+
+        version이 현재 값과 같으면 대기 상태가 바뀔 때까지 최대 wait초(최대 30초) 기다렸다가 응답한다.
+        기다리는 동안에는 캐시의 version만 확인하므로 DB를 조회하지 않는다.
+    """
+    try:
+        wait = min(float(request.GET.get("wait", 0)), MAX_WAIT_SECONDS)
+    except ValueError:
+        return json_response({"message": "wait는 숫자로 입력하세요."}, status=400)
+
+    scope = availability_cache.waitlist_scope(user.id)
+    deadline = timer.monotonic() + wait
+    version = str((await availability_cache.aversions(scope))[0])
+    while version == request.GET.get("version") and timer.monotonic() < deadline:
+        await asyncio.sleep(POLL_INTERVAL)
+        version = str((await availability_cache.aversions(scope))[0])
+
+    entries = WaitlistEntryReadSerializer.values(WaitlistEntry.objects.for_student(user.id))
+    return json_response({
+        "data": WaitlistEntryReadSerializer([row async for row in entries]).data,
+        "version": version,
+    })
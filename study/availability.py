@@ -0,0 +1,133 @@
+# study/availability.py
+
+"""
+30분 단위 슬롯 기반 가용 시간 계산 엔진
+
+하루(TIME_ZONE 기준)를 48개의 30분 슬롯으로 나누고,
+점유된 슬롯을 정수 bit mask로 표현한다. (i번째 bit = origin + 30분 * i)
+수업 목록을 mask로 만드는 데 O(n), 빈 시작 슬롯을 찾는 데 O(48)의 bit 연산만 필요하다.
+"""
+
+from datetime import datetime, time, timedelta
+
+from django.utils import timezone
+
+SLOT_MINUTES = 30
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES  # 48
+FULL_DAY_MASK = (1 << SLOTS_PER_DAY) - 1
+# origin 당일과 다음날(자정을 넘기는 수업)까지만 mask에 담는다.
+MASK_LIMIT = 2 * SLOTS_PER_DAY
+# 오늘부터 이 날짜 수 이내만 조회 / 신청할 수 있다. (반복 템플릿 수업도 이 기간까지만 생성)
+MAX_BOOKING_DAYS = 90
+
+
+def day_origin(date):
+    """해당 날짜 00:00 (TIME_ZONE 기준 aware datetime)"""
+    return timezone.make_aware(datetime.combine(date, time.min))
+
+
+def booking_horizon():
+    """조회 / 신청 가능한 마지막 날짜 (TIME_ZONE 기준)"""
+    return timezone.localdate() + timedelta(days=MAX_BOOKING_DAYS)
+
+
+def slot_count(duration):
+    """duration(분)이 차지하는 슬롯 수 (올림)"""
+    return -(-duration // SLOT_MINUTES)
+
+
+def slot_index(value, origin):
+    """origin 기준 value가 속한 슬롯 index (내림, 음수 가능)"""
+    return int((value - origin).total_seconds() // (SLOT_MINUTES * 60))
+
+
+def slot_time(index, origin):
+    """slot index를 다시 datetime으로 변환"""
+    return origin + timedelta(minutes=SLOT_MINUTES * index)
+
+
+def interval_mask(start, end):
+    """[start, end) 슬롯 구간의 bit mask. [0, MASK_LIMIT) 밖의 구간은 잘라낸다."""
+    start = max(start, 0)
+    end = min(end, MASK_LIMIT)
+    if end <= start:
+        return 0
+    return ((1 << (end - start)) - 1) << start
+
+
+def class_mask(start_time, duration, origin):
+    """수업 하나가 origin 기준으로 차지하는 bit mask"""
+    begin = slot_index(start_time, origin)
+    return interval_mask(begin, begin + slot_count(duration))
+
+
+def occupancy_mask(intervals, origin):
+    """(start_time, duration) 목록을 origin 기준 점유 mask로 합친다."""
+    mask = 0
+    for start_time, duration in intervals:
+        mask |= class_mask(start_time, duration, origin)
+    return mask
+
+
+def is_free(mask, start_time, duration, origin):
+    """mask 위에 해당 수업을 겹치지 않게 놓을 수 있는지"""
+    return not mask & class_mask(start_time, duration, origin)
+
+
+def free_start_indexes(mask, duration, first=0, last=SLOTS_PER_DAY):
+    """
+    [first, last) 구간 안에서 duration 길이의 수업을 시작할 수 있는 슬롯 index 목록
+
+    i번째 bit가 비어있고 이후 (슬롯 수 - 1)개의 bit도 비어있어야 하므로
+    빈 슬롯 mask를 offset만큼 밀어가며 AND 하면 한 번에 후보가 남는다.
+    """
+    free = ~mask & interval_mask(first, last)
+    candidates = free
+    for offset in range(1, slot_count(duration)):
+        candidates &= free >> offset
+
+    indexes = []
+    while candidates:
+        lowest = candidates & -candidates
+        indexes.append(lowest.bit_length() - 1)
+        candidates ^= lowest
+    return indexes
+
+
+def slot_cell(start_time):
+    """수업 시작 시간이 속한 (현지 날짜, 슬롯 index)"""
+    date = timezone.localtime(start_time).date()
+    return date, slot_index(start_time, day_origin(date))
+
+
+def day_masks(start_time, duration):
+    """
+    수업 하나를 (현지 날짜, 해당 날짜의 48bit mask) 목록으로 나눈다.
+    자정을 넘기는 수업은 다음 날짜의 mask에도 걸친다.
+    """
+    date = timezone.localtime(start_time).date()
+    mask = class_mask(start_time, duration, day_origin(date))
+
+    masks = []
+    while mask:
+        masks.append((date, mask & FULL_DAY_MASK))
+        mask >>= SLOTS_PER_DAY
+        date += timedelta(days=1)
+    return masks
+
+
+def expand_recurrence(start_date, end_date, weekdays, start, end, duration):
+    """
+    [start_date, end_date] 사이 weekdays(월=0)마다 start~end를 duration 간격으로 나눈
+    현지 시간(naive) 수업 시작 시간 목록
+    """
+    starts = []
+    date = start_date
+    while date <= end_date:
+        if date.weekday() in weekdays:
+            slot = datetime.combine(date, start)
+            while slot + timedelta(minutes=duration) <= datetime.combine(date, end):
+                starts.append(slot)
+                slot += timedelta(minutes=duration)
+        date += timedelta(days=1)
+    return starts
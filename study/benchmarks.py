@@ -0,0 +1,332 @@
+# study/benchmarks.py
+
+"""
+성능 회귀 확인용 데이터 생성 / endpoint 측정 도구
+
+seed()로 대량의 tutor, student, 수업, 신청 데이터를 bulk_create로 빠르게 만들고
+run_endpoints()로 각 API의 query 수와 p50/p95 latency를 측정한다.
+tests.py (query 수 상한 검사)와 `manage.py benchmark` (JSON 리포트)에서 함께 사용한다.
+"""
+
+import itertools
+import random
+import time as timer
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from users.tokens import AccessToken
+
+from .availability import day_masks, day_origin, slot_time
+from .timeutils import slot_minutes, format_local_minutes
+from .models import TutorClass, StudentClass, TutorDayOccupancy, SlotSupply
+from .serializers import TutorClassSerializer, TutorClassReadSerializer
+
+from django.contrib.auth import get_user_model
+User = get_user_model()
+
+PASSWORD = "test1234"
+BATCH_SIZE = 5000
+
+# endpoint별 요청 1회당 query 수 상한 (JWT 인증은 token claim으로 처리하므로 query 없음)
+QUERY_BUDGETS = {
+    "tutor_list": 1,
+    "student_list": 1,
+    "available_time_tutor": 2,
+    "available_time_student": 3,
+    "available_class": 2,
+    "class_search": 2,
+    "slot_supply": 2,
+    "waitlist": 1,  # 대기 상태 version은 캐시에서 확인
+    "signup": 3,
+    "login": 1,  # refresh token 발급 시 OutstandingToken 저장 없음
+}
+
+
+def seed(tutors=1000, students=1000, classes_per_tutor=100, days=30, booking_ratio=0.3, start_date=None, random_seed=0):
+    """
+        benchmark용 데이터 생성
+
+        tutor마다 [start_date, start_date + days) 기간의 서로 다른 정각에 수업을 만들고
+        booking_ratio 비율만큼 임의의 student가 신청한 상태로 만든다.
+    """
+    if classes_per_tutor > days * 24:
+        raise ValueError("classes_per_tutor는 days * 24 이하여야 합니다.")
+
+    rng = random.Random(random_seed)
+    start_date = start_date or timezone.localdate() + timedelta(days=1)
+    origin = day_origin(start_date)
+    password = make_password(PASSWORD)  # 모든 계정이 같은 hash를 사용 (hash 계산 1회)
+
+    tutor_ids = _create_users("tutor", tutors, password)
+    student_ids = _create_users("student", students, password)
+
+    masks = {}
+    classes = []
+    booked = 0
+
+    for tutor_id in tutor_ids:
+        for hour in rng.sample(range(days * 24), classes_per_tutor):
+            start_time = origin + timedelta(hours=hour)
+            duration = rng.choice((30, 60))
+            is_booked = bool(student_ids) and rng.random() < booking_ratio
+
+            classes.append(TutorClass(tutor_id=tutor_id, start_time=start_time, duration=duration, status=is_booked))
+            for date, mask in day_masks(start_time, duration):
+                masks[(tutor_id, date)] = masks.get((tutor_id, date), 0) | mask
+
+        if len(classes) >= BATCH_SIZE:
+            booked += _create_classes(classes, student_ids, rng)
+            classes = []
+
+    booked += _create_classes(classes, student_ids, rng)
+
+    TutorDayOccupancy.objects.bulk_create(
+        (TutorDayOccupancy(tutor_id=tutor_id, date=date, mask=mask) for (tutor_id, date), mask in masks.items()),
+        batch_size=BATCH_SIZE,
+    )
+    SlotSupply.objects.rebuild()
+
+    return {
+        "tutors": tutors,
+        "students": students,
+        "classes": tutors * classes_per_tutor,
+        "bookings": booked,
+        "start_date": str(start_date),
+        "days": days,
+    }
+
+
+def _create_users(role, count, password):
+    users = (User(email=f"bench-{role}{i}@example.com", role=role, password=password) for i in range(count))
+    User.objects.bulk_create(users, batch_size=BATCH_SIZE)
+    return list(
+        User.objects.filter(role=role, email__startswith=f"bench-{role}").values_list("id", flat=True)
+    )
+
+
+def _create_classes(classes, student_ids, rng):
+    TutorClass.objects.bulk_create(classes, batch_size=BATCH_SIZE)
+
+    # tutor 단위로 나눠 생성하므로 이번 batch tutor의 신청된 수업 = 방금 생성한 신청된 수업
+    booked_ids = TutorClass.objects.filter(
+        tutor_id__in={tutor_class.tutor_id for tutor_class in classes}, status=True
+    ).values_list("id", flat=True)
+
+    students = [StudentClass(tutor_class_id=class_id, student_id=rng.choice(student_ids)) for class_id in booked_ids]
+    StudentClass.objects.bulk_create(students, batch_size=BATCH_SIZE)
+    return len(students)
+
+
+def percentile(values, percent):
+    """nearest-rank 방식 백분위 값"""
+    ordered = sorted(values)
+    index = max(0, -(-len(ordered) * percent // 100) - 1)
+    return ordered[int(index)]
+
+
+def endpoint_cases(day=None):
+    """
+        측정할 요청 목록 {이름: (method, path, data 생성 함수, 요청 user)}
+
+        seed() 데이터의 첫 번째 tutor, student로 요청하고, 가장 이른 미신청 수업 날짜를 조회한다.
+    """
+    tutor = User.objects.filter(role="tutor").order_by("id").first()
+    student = User.objects.filter(role="student").order_by("id").first()
+
+    first_class = TutorClass.objects.filter(status=False).order_by("start_time").first()
+    day = day or (first_class.start_time if first_class else timezone.now() + timedelta(days=1))
+    local_day = timezone.localtime(day)
+    signup_numbers = itertools.count()
+
+    return {
+        "tutor_list": ("get", "/study/tutor/", lambda: {}, tutor),
+        "student_list": ("get", "/study/student/", lambda: {}, student),
+        "available_time_tutor": (
+            "get", "/study/available-time/",
+            lambda: {"date": local_day.strftime("%Y-%m-%d"), "duration": 30}, tutor,
+        ),
+        "available_time_student": (
+            "get", "/study/available-time/",
+            lambda: {"date": local_day.strftime("%Y-%m-%d"), "duration": 30}, student,
+        ),
+        "available_class": (
+            "get", "/study/available-class/",
+            lambda: {"start_time": local_day.strftime("%Y-%m-%dT%H:%M:%S"), "duration": 30}, student,
+        ),
+        "class_search": (
+            "get", "/study/available-class/search/",
+            lambda: {
+                "duration": 30,
+                "from": local_day.strftime("%Y-%m-%d"),
+                "to": (local_day + timedelta(days=7)).strftime("%Y-%m-%d"),
+                "time_from": "19:00",
+                "time_to": "23:00",
+            },
+            student,
+        ),
+        "slot_supply": (
+            "get", "/study/supply/",
+            lambda: {"month": local_day.strftime("%Y-%m"), "duration": 30}, student,
+        ),
+        "waitlist": ("get", "/study/waitlist/", lambda: {}, student),
+        "signup": (
+            "post", "/user/signup/",
+            lambda: {"email": f"bench-signup{next(signup_numbers)}@example.com", "password": PASSWORD, "role": "student"},
+            None,
+        ),
+        "login": (
+            "post", "/user/signin/",
+            lambda: {"email": tutor.email, "password": PASSWORD}, None,
+        ),
+    }
+
+
+def measure(method, path, make_data, user, iterations=20):
+    """요청을 iterations번 보내고 {query 수, p50, p95, 응답 코드} 반환"""
+    client = APIClient()
+    if user is not None:
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+
+    timings = []
+    queries = 0
+    status_code = None
+
+    for _ in range(iterations):
+        data = make_data()
+        with CaptureQueriesContext(connection) as captured:
+            started = timer.perf_counter()
+            response = client.post(path, data, format="json") if method == "post" else client.get(path, data)
+            timings.append((timer.perf_counter() - started) * 1000)
+        queries = max(queries, len(captured))
+        status_code = response.status_code
+
+    return {
+        "status_code": status_code,
+        "queries": queries,
+        "iterations": iterations,
+        "p50_ms": round(percentile(timings, 50), 3),
+        "p95_ms": round(percentile(timings, 95), 3),
+        # 요청을 순서대로 하나씩 보내므로 core 하나가 초당 처리할 수 있는 요청 수
+        "per_core_rps": round(len(timings) / (sum(timings) / 1000), 1),
+    }
+
+
+def run_endpoints(iterations=20, names=None):
+    """모든 endpoint 측정 결과 {이름: 측정 결과}"""
+    results = {}
+    for name, case in endpoint_cases().items():
+        if names and name not in names:
+            continue
+        results[name] = measure(*case, iterations=iterations)
+        results[name]["query_budget"] = QUERY_BUDGETS.get(name)
+    return results
+
+
+def best_of(iterations, run):
+    """run()을 iterations번 실행한 시간 중 가장 짧은 시간 (ms)"""
+    timings = []
+    for _ in range(iterations):
+        started = timer.perf_counter()
+        run()
+        timings.append((timer.perf_counter() - started) * 1000)
+    return min(timings)
+
+
+def serializer_benchmark(rows=10000, iterations=5):
+    """
+        TutorClassSerializer(many=True)와 TutorClassReadSerializer의 목록 직렬화 시간 비교 (DB 접근 없음)
+
+        같은 수업 rows개를 model instance / values() dict로 각각 만들어 직렬화만 측정한다.
+    """
+    origin = day_origin(timezone.localdate() + timedelta(days=1))
+    values = [
+        {"id": i, "tutor_id": i % 100, "start_time": origin + timedelta(minutes=30 * (i % 1440)), "duration": 30}
+        for i in range(rows)
+    ]
+    instances = [TutorClass(**row) for row in values]
+
+    model_ms = best_of(iterations, lambda: TutorClassSerializer(instances, many=True).data)
+    values_ms = best_of(iterations, lambda: TutorClassReadSerializer(values).data)
+
+    return {
+        "rows": rows,
+        "model_serializer_ms": round(model_ms, 3),
+        "values_serializer_ms": round(values_ms, 3),
+        "speedup": round(model_ms / values_ms, 2),
+    }
+
+
+def timeutils_benchmark(days=31, iterations=5):
+    """
+        슬롯 목록 문자열 변환 시간 비교 (DB 접근 없음)
+
+        기존 방식 (슬롯마다 localtime + strftime, aware datetime sorted(set()))과
+        timeutils.format_local_minutes (epoch 분 일괄 변환)로 days일치 48개 슬롯을 변환한다.
+    """
+    start_date = timezone.localdate() + timedelta(days=1)
+    origins = [day_origin(start_date + timedelta(days=i)) for i in range(days)]
+    indexes = range(48)
+
+    def per_object():
+        slots = [timezone.localtime(slot_time(i, origin)) for origin in origins for i in indexes]
+        return [slot.strftime("%Y-%m-%d %H:%M") for slot in sorted(set(slots))]
+
+    def batch():
+        return format_local_minutes([minute for origin in origins for minute in slot_minutes(indexes, origin)])
+
+    per_object_ms = best_of(iterations, per_object)
+    batch_ms = best_of(iterations, batch)
+
+    return {
+        "slots": days * len(indexes),
+        "per_object_ms": round(per_object_ms, 3),
+        "batch_ms": round(batch_ms, 3),
+        "speedup": round(per_object_ms / batch_ms, 2),
+    }
+
+
+def load_test(base_url, paths, token=None, concurrency=50, requests=1000, timeout=30):
+    """
+        실행 중인 서버(WSGI 또는 ASGI)에 path별로 concurrency개씩 동시에 requests번 요청하고
+        {path: {처리량(req/s), p50, p95, 실패 수}} 반환
+
+        같은 worker 수로 띄운 WSGI / ASGI 서버에 각각 실행해 동시 처리 능력을 비교한다.
+    """
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+
+    def fetch(url):
+        started = timer.perf_counter()
+        try:
+            with urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=timeout) as response:
+                response.read()
+                ok = response.status == 200
+        except (urllib.error.URLError, OSError):
+            ok = False
+        return (timer.perf_counter() - started) * 1000, ok
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for path in paths:
+            url = base_url.rstrip("/") + path
+            started = timer.perf_counter()
+            responses = list(executor.map(fetch, [url] * requests))
+            elapsed = timer.perf_counter() - started
+
+            timings = [ms for ms, _ in responses]
+            results[path] = {
+                "requests": requests,
+                "concurrency": concurrency,
+                "failures": sum(1 for _, ok in responses if not ok),
+                "throughput_rps": round(requests / elapsed, 1),
+                "p50_ms": round(percentile(timings, 50), 3),
+                "p95_ms": round(percentile(timings, 95), 3),
+            }
+    return results
@@ -0,0 +1,221 @@
+# study/cache.py
+
+"""
+가용 시간 조회 결과 캐시 (Django cache framework)
+
+날짜별로 "신청 가능한 수업 목록", "tutor 점유 mask"를 캐시하고,
+student별로 "해당 날짜 신청 mask"를 캐시한다.
+캐시 key에는 version이 포함되며, 수업/신청이 변경되면 해당 날짜(또는 student)의
+version을 올려 이전 캐시를 더 이상 읽지 않게 한다. (삭제 없이 무효화)
+a로 시작하는 함수는 async view(async_apis.py)에서 사용하는 async 버전이다.
+"""
+
+import time as timer
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.db import transaction
+
+from .availability import day_origin, day_masks, slot_index, occupancy_mask
+
+KEY_PREFIX = "availability"
+TIMEOUT = 60 * 60
+TEMPLATE_SCOPE = "templates"
+
+
+def date_scope(date):
+    return f"date:{date}"
+
+
+def student_scope(student_id):
+    return f"student:{student_id}"
+
+
+def waitlist_scope(student_id):
+    # 대기 상태 변경 확인용 (캐시 값 없이 version만 사용)
+    return f"waitlist:{student_id}"
+
+
+def _version_key(scope):
+    return f"{KEY_PREFIX}:version:{scope}"
+
+
+def versions(*scopes):
+    """scope별 현재 version (없으면 새로 발급)"""
+    keys = [_version_key(scope) for scope in scopes]
+    found = cache.get_many(keys)
+
+    # 처음 발급하는 version은 시각 기반으로 만들어 이전에 쓰던 version과 겹치지 않게 한다.
+    missing = {key: timer.time_ns() for key in keys if key not in found}
+    if missing:
+        cache.set_many(missing, None)
+        found.update(missing)
+
+    return [found[key] for key in keys]
+
+
+async def aversions(*scopes):
+    keys = [_version_key(scope) for scope in scopes]
+    found = await cache.aget_many(keys)
+
+    missing = {key: timer.time_ns() for key in keys if key not in found}
+    if missing:
+        await cache.aset_many(missing, None)
+        found.update(missing)
+
+    return [found[key] for key in keys]
+
+
+def bump(*scopes):
+    """
+        scope의 version을 올려 이전 캐시를 무효화
+
+        commit 전에 다른 요청이 이전 데이터로 캐시를 다시 채울 수 있으므로 commit 후에 한 번 더 올린다.
+    """
+    def incr():
+        for scope in scopes:
+            try:
+                cache.incr(_version_key(scope))
+            except ValueError:
+                cache.set(_version_key(scope), timer.time_ns(), None)
+
+    incr()
+    transaction.on_commit(incr)
+
+
+def bump_class_dates(start_time, duration):
+    """수업이 걸친 날짜의 캐시 무효화"""
+    bump(*(date_scope(date) for date, _ in day_masks(start_time, duration)))
+
+
+def _key(name, args, versions):
+    return ":".join(str(part) for part in (KEY_PREFIX, name, *args, *versions))
+
+
+def cached(name, args, scopes, compute):
+    key = _key(name, args, versions(*scopes))
+
+    value = cache.get(key)
+    if value is None:
+        value = compute()
+        cache.set(key, value, TIMEOUT)
+    return value
+
+
+async def acached(name, args, scopes, compute):
+    """cached()의 async 버전 (compute는 async 함수)"""
+    key = _key(name, args, await aversions(*scopes))
+
+    value = await cache.aget(key)
+    if value is None:
+        value = await compute()
+        await cache.aset(key, value, TIMEOUT)
+    return value
+
+
+def _open_class_rows(date, duration):
+    from .models import TutorClass
+
+    origin = day_origin(date)
+    return TutorClass.objects.filter(
+        start_time__gte=origin,
+        start_time__lt=origin + timedelta(days=1),
+        status=False,
+        duration=duration,
+    ).order_by("start_time", "id").values_list("id", "tutor_id", "start_time")
+
+
+def _group_open_classes(rows, date):
+    origin = day_origin(date)
+    classes = {}
+    for class_id, tutor_id, start_time in rows:
+        classes.setdefault(slot_index(start_time, origin), []).append((class_id, tutor_id))
+    return classes
+
+
+def open_classes(date, duration):
+    """
+        해당 날짜의 신청 가능한 수업 {slot index: [(class id, tutor id), ...]}
+
+        사용자와 상관없는 기본 목록이므로 모든 student가 같은 캐시를 사용한다.
+    """
+    def compute():
+        return _group_open_classes(_open_class_rows(date, duration), date)
+
+    return cached("open", (date, duration), [date_scope(date)], compute)
+
+
+async def aopen_classes(date, duration):
+    async def compute():
+        return _group_open_classes([row async for row in _open_class_rows(date, duration)], date)
+
+    return await acached("open", (date, duration), [date_scope(date)], compute)
+
+
+def tutor_mask(tutor_id, date):
+    """tutor의 해당 날짜 점유 mask"""
+    def compute():
+        from .models import TutorDayOccupancy
+
+        return TutorDayOccupancy.objects.masks(tutor_id, [date])[date]
+
+    return cached("tutor", (tutor_id, date), [date_scope(date)], compute)
+
+
+async def atutor_mask(tutor_id, date):
+    async def compute():
+        from .models import TutorDayOccupancy
+
+        return (await TutorDayOccupancy.objects.amasks(tutor_id, [date]))[date]
+
+    return await acached("tutor", (tutor_id, date), [date_scope(date)], compute)
+
+
+def _student_times(student_id, date):
+    from .models import TutorClass, StudentClass
+
+    origin = day_origin(date)
+    return StudentClass.objects.filter(
+        student_id=student_id,
+        tutor_class__start_time__gt=origin - timedelta(minutes=TutorClass.MAX_DURATION),
+        tutor_class__start_time__lt=origin + timedelta(days=1, minutes=TutorClass.MAX_DURATION),
+    ).values_list("tutor_class__start_time", "tutor_class__duration")
+
+
+def student_mask(student_id, date):
+    """student가 신청한 수업 중 해당 날짜 수업과 겹칠 수 있는 수업의 mask"""
+    def compute():
+        return occupancy_mask(_student_times(student_id, date), day_origin(date))
+
+    return cached("student", (student_id, date), [student_scope(student_id)], compute)
+
+
+async def astudent_mask(student_id, date):
+    async def compute():
+        return occupancy_mask([row async for row in _student_times(student_id, date)], day_origin(date))
+
+    return await acached("student", (student_id, date), [student_scope(student_id)], compute)
+
+
+def _materialize(start_date, end_date, tutor_id):
+    from .models import TutorClassTemplate
+
+    TutorClassTemplate.objects.materialize(start_date, end_date, tutor_id=tutor_id)
+    return True
+
+
+def materialize_templates(start_date, end_date, tutor_id=None):
+    """반복 템플릿 수업 생성 (같은 기간은 템플릿이 바뀌기 전까지 다시 확인하지 않는다.)"""
+    def compute():
+        return _materialize(start_date, end_date, tutor_id)
+
+    return cached("materialized", (start_date, end_date, tutor_id), [TEMPLATE_SCOPE], compute)
+
+
+async def amaterialize_templates(start_date, end_date, tutor_id=None):
+    # 생성은 transaction / select_for_update가 필요하므로 sync ORM으로 실행 (캐시 miss일 때만)
+    async def compute():
+        return await sync_to_async(_materialize)(start_date, end_date, tutor_id)
+
+    return await acached("materialized", (start_date, end_date, tutor_id), [TEMPLATE_SCOPE], compute)
@@ -0,0 +1,87 @@
+# study/exports.py
+
+"""
+수업 일정 export (NDJSON / CSV)
+
+수업 + 신청 정보를 values()로 한 번의 LEFT JOIN query로 읽고,
+.iterator(chunk_size)로 chunk 단위로 가져오면서 한 줄씩 문자열로 만들어 내보낸다.
+전체 목록을 메모리에 올리지 않으므로 row 수와 상관없이 메모리 사용량이 일정하다.
+"""
+
+import csv
+import json
+
+from django.utils import timezone
+
+from .models import TutorClass
+
+CHUNK_SIZE = 2000
+FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+# (출력 이름, values() field)
+COLUMNS = (
+    ("class_id", "id"),
+    ("tutor_id", "tutor_id"),
+    ("tutor_email", "tutor__email"),
+    ("start_time", "start_time"),
+    ("duration", "duration"),
+    ("status", "status"),
+    ("student_id", "student_class__student_id"),
+    ("booked_at", "student_class__created_at"),
+)
+DATETIME_COLUMNS = ("start_time", "booked_at")
+
+
+def export_queryset(tutor_id=None, start=None, end=None):
+    """export 대상 수업 (tutor_id가 없으면 전체 tutor)"""
+    queryset = TutorClass.objects.all()
+    if tutor_id is not None:
+        queryset = queryset.filter(tutor_id=tutor_id)
+    if start is not None:
+        queryset = queryset.filter(start_time__gte=start)
+    if end is not None:
+        queryset = queryset.filter(start_time__lt=end)
+    return queryset.order_by("start_time", "id")
+
+
+def export_rows(queryset, chunk_size=CHUNK_SIZE):
+    """수업 row를 {출력 이름: 값} dict로 하나씩 반환 (datetime은 TIME_ZONE 기준 isoformat)"""
+    names = [name for name, _ in COLUMNS]
+    rows = queryset.values_list(*(field for _, field in COLUMNS)).iterator(chunk_size=chunk_size)
+
+    for values in rows:
+        row = dict(zip(names, values))
+        for name in DATETIME_COLUMNS:
+            if row[name] is not None:
+                row[name] = timezone.localtime(row[name]).isoformat()
+        yield row
+
+
+def ndjson_lines(rows):
+    for row in rows:
+        yield json.dumps(row, ensure_ascii=False) + "\n"
+
+
+class _Echo:
+    """csv.writer가 쓴 한 줄을 그대로 반환하는 buffer"""
+
+    def write(self, value):
+        return value
+
+
+def csv_lines(rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow([name for name, _ in COLUMNS])
+    for row in rows:
+        yield writer.writerow(["" if value is None else value for value in row.values()])
+
+
+def export_lines(queryset, format="ndjson", chunk_size=CHUNK_SIZE):
+    """format에 맞는 한 줄 단위 문자열 generator"""
+    rows = export_rows(queryset, chunk_size=chunk_size)
+    if format == "csv":
+        return csv_lines(rows)
+    return ndjson_lines(rows)
@@ -0,0 +1,102 @@
+# study/management/commands/benchmark.py
+
+import json
+import time as timer
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment, override_settings
+from django.utils import timezone
+
+from study.benchmarks import seed, run_endpoints, serializer_benchmark, timeutils_benchmark
+
+
+class Command(BaseCommand):
+    help = (
+        "테스트 DB에 대량 데이터를 생성한 뒤 API별 query 수와 p50/p95 latency를 측정해 JSON으로 저장합니다. "
+        "(--compare로 이전 리포트와 비교)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tutors", type=int, default=1000)
+        parser.add_argument("--students", type=int, default=1000)
+        parser.add_argument("--classes-per-tutor", type=int, default=200)
+        parser.add_argument("--days", type=int, default=30)
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument("--serializer-rows", type=int, default=10000, help="목록 serializer 비교에 사용할 row 수")
+        parser.add_argument("--endpoint", action="append", dest="endpoints", help="측정할 endpoint (여러 번 지정 가능)")
+        parser.add_argument("--output", default="benchmark.json")
+        parser.add_argument("--compare", help="비교할 이전 리포트 경로")
+
+    @override_settings(CACHES=settings.ISOLATED_CACHES)  # 임시 DB 기준 캐시 값이 공유 캐시에 섞이지 않도록
+    def handle(self, *args, **options):
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+
+        try:
+            started = timer.perf_counter()
+            seeded = seed(
+                tutors=options["tutors"],
+                students=options["students"],
+                classes_per_tutor=options["classes_per_tutor"],
+                days=options["days"],
+            )
+            seeded["seconds"] = round(timer.perf_counter() - started, 2)
+            self.stdout.write(f"데이터 생성 완료: {seeded}")
+
+            results = run_endpoints(iterations=options["iterations"], names=options["endpoints"])
+            serializers = serializer_benchmark(rows=options["serializer_rows"])
+            slot_formatting = timeutils_benchmark()
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        report = {
+            "created_at": timezone.now().isoformat(),
+            "vendor": connection.vendor,
+            "seed": seeded,
+            "endpoints": results,
+            "serializers": serializers,
+            "slot_formatting": slot_formatting,
+        }
+        Path(options["output"]).write_text(json.dumps(report, indent=2, ensure_ascii=False))
+
+        previous = self.load(options["compare"]) if options["compare"] else {}
+        over_budget = []
+
+        for name, result in results.items():
+            line = (
+                f"{name:<24} queries={result['queries']:<3} p50={result['p50_ms']:>9.3f}ms p95={result['p95_ms']:>9.3f}ms "
+                f"{result['per_core_rps']:>8.1f} req/s/core"
+            )
+            if name in previous:
+                before = previous[name]
+                line += f"  (p50 {result['p50_ms'] - before['p50_ms']:+.3f}ms, queries {result['queries'] - before['queries']:+d})"
+            self.stdout.write(line)
+
+            if result["query_budget"] is not None and result["queries"] > result["query_budget"]:
+                over_budget.append(name)
+
+        self.stdout.write(
+            f"serializer ({serializers['rows']} rows) model={serializers['model_serializer_ms']:.3f}ms "
+            f"values={serializers['values_serializer_ms']:.3f}ms (x{serializers['speedup']})"
+        )
+        if serializers["speedup"] <= 1:
+            # 실행 시간 비교는 환경에 따라 흔들리므로 테스트가 아니라 여기서만 경고한다.
+            self.stdout.write(self.style.WARNING("values serializer가 ModelSerializer보다 빠르지 않습니다."))
+        self.stdout.write(
+            f"slot formatting ({slot_formatting['slots']} slots) per-object={slot_formatting['per_object_ms']:.3f}ms "
+            f"batch={slot_formatting['batch_ms']:.3f}ms (x{slot_formatting['speedup']})"
+        )
+        self.stdout.write(self.style.SUCCESS(f"리포트 저장: {options['output']}"))
+
+        if over_budget:
+            raise CommandError(f"query 수 상한 초과: {', '.join(over_budget)}")
+
+    def load(self, path):
+        try:
+            return json.loads(Path(path).read_text())["endpoints"]
+        except (OSError, ValueError, KeyError) as e:
+            raise CommandError(f"비교할 리포트를 읽을 수 없습니다: {e}")
@@ -0,0 +1,41 @@
+# study/management/commands/export_classes.py
+
+from django.core.management.base import BaseCommand, CommandError
+
+from study import exports
+from study.pagination import parse_bound, CursorError
+
+
+class Command(BaseCommand):
+    help = "수업 일정을 신청 정보와 함께 NDJSON 또는 CSV로 출력합니다. (row 수와 상관없이 chunk 단위로 읽어 바로 기록)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--format", choices=sorted(exports.FORMATS), default="ndjson")
+        parser.add_argument("--output", help="저장할 파일 경로 (없으면 표준 출력)")
+        parser.add_argument("--tutor", type=int, help="특정 tutor의 수업만 출력")
+        parser.add_argument("--from", dest="start", help="수업 시작 시간 하한 (YYYY-MM-DD 또는 YYYY-MM-DDTHH:MM)")
+        parser.add_argument("--to", dest="end", help="수업 시작 시간 상한, 미포함")
+        parser.add_argument("--chunk-size", type=int, default=exports.CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        try:
+            start = parse_bound(options["start"], "--from") if options["start"] else None
+            end = parse_bound(options["end"], "--to") if options["end"] else None
+        except CursorError as e:
+            raise CommandError(str(e))
+
+        queryset = exports.export_queryset(tutor_id=options["tutor"], start=start, end=end)
+        lines = exports.export_lines(queryset, format=options["format"], chunk_size=options["chunk_size"])
+
+        if options["output"] is None:
+            for line in lines:
+                self.stdout.write(line, ending="")
+            return
+
+        count = -1 if options["format"] == "csv" else 0  # csv header 제외
+        with open(options["output"], "w", newline="", encoding="utf-8") as output:
+            for line in lines:
+                output.write(line)
+                count += 1
+
+        self.stdout.write(self.style.SUCCESS(f"{count}개 수업을 {options['output']}에 저장했습니다."))
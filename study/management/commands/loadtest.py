@@ -0,0 +1,83 @@
+# study/management/commands/loadtest.py
+
+import json
+from datetime import timedelta
+from pathlib import Path
+from urllib.parse import urlencode
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from users.tokens import AccessToken
+
+from study.benchmarks import load_test
+
+from django.contrib.auth import get_user_model
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        "실행 중인 서버에 조회 API 동시 요청을 보내 처리량과 p50/p95 latency를 측정합니다. "
+        "같은 worker 수로 WSGI(ex. gunicorn config.wsgi -w 1)와 ASGI(ex. uvicorn config.asgi:application --workers 1) "
+        "서버를 띄우고 각각 실행해 비교합니다. (--async이면 /study/async/ API 요청)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+        parser.add_argument("--email", required=True, help="요청에 사용할 사용자 (서버와 같은 DB에 있어야 함)")
+        parser.add_argument("--async", action="store_true", dest="use_async")
+        parser.add_argument("--date", help="available-time 조회 날짜 (기본: 내일)")
+        parser.add_argument("--concurrency", type=int, default=50)
+        parser.add_argument("--requests", type=int, default=1000)
+        parser.add_argument("--output", help="결과를 저장할 JSON 경로")
+        parser.add_argument("--compare", help="비교할 이전 결과 JSON 경로")
+
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(email=options["email"])
+        except User.DoesNotExist:
+            raise CommandError(f"사용자를 찾을 수 없습니다: {options['email']}")
+
+        prefix = "/study/async/" if options["use_async"] else "/study/"
+        date = options["date"] or str(timezone.localdate() + timedelta(days=1))
+        paths = [
+            prefix + ("tutor/" if user.role == "tutor" else "student/"),
+            prefix + "available-time/?" + urlencode({"date": date, "duration": 30}),
+        ]
+        if user.role == "student":
+            paths.append(prefix + "available-class/?" + urlencode({"start_time": f"{date}T13:00:00", "duration": 30}))
+
+        results = load_test(
+            options["base_url"], paths,
+            token=str(AccessToken.for_user(user)),
+            concurrency=options["concurrency"],
+            requests=options["requests"],
+        )
+
+        previous = {}
+        if options["compare"]:
+            try:
+                previous = json.loads(Path(options["compare"]).read_text())["results"]
+            except (OSError, ValueError, KeyError) as e:
+                raise CommandError(f"비교할 결과를 읽을 수 없습니다: {e}")
+
+        for path, result in results.items():
+            # --compare는 sync/async 결과를 비교하므로 prefix를 뺀 path로 맞춘다.
+            name = path.removeprefix(prefix)
+            line = (
+                f"{name:<48} {result['throughput_rps']:>8.1f} req/s "
+                f"p50={result['p50_ms']:>9.3f}ms p95={result['p95_ms']:>9.3f}ms failures={result['failures']}"
+            )
+            if name in previous:
+                line += f"  (x{result['throughput_rps'] / previous[name]['throughput_rps']:.2f} req/s)"
+            self.stdout.write(line)
+
+        if options["output"]:
+            report = {
+                "created_at": timezone.now().isoformat(),
+                "base_url": options["base_url"],
+                "async": options["use_async"],
+                "results": {path.removeprefix(prefix): result for path, result in results.items()},
+            }
+            Path(options["output"]).write_text(json.dumps(report, indent=2, ensure_ascii=False))
+            self.stdout.write(self.style.SUCCESS(f"결과 저장: {options['output']}"))
@@ -0,0 +1,30 @@
+# study/management/commands/rebuild_slot_supply.py
+
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from study.models import SlotSupply
+
+
+class Command(BaseCommand):
+    help = (
+        "TutorClass로 날짜/슬롯별 수업 현황(SlotSupply)을 다시 만듭니다. "
+        "(처음 배포 시 backfill, 또는 signal 없이 변경된 데이터가 있을 때)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--from", dest="start_date", help="시작 날짜 (YYYY-MM-DD, 없으면 처음부터)")
+        parser.add_argument("--to", dest="end_date", help="종료 날짜, 포함 (YYYY-MM-DD, 없으면 끝까지)")
+
+    def handle(self, *args, **options):
+        try:
+            start_date, end_date = (
+                datetime.strptime(options[name], "%Y-%m-%d").date() if options[name] else None
+                for name in ("start_date", "end_date")
+            )
+        except ValueError:
+            raise CommandError("--from, --to는 YYYY-MM-DD 형식으로 입력하세요.")
+
+        rows = SlotSupply.objects.rebuild(start_date, end_date)
+        self.stdout.write(self.style.SUCCESS(f"{rows}개 슬롯의 수업 현황을 다시 만들었습니다."))
@@ -0,0 +1,21 @@
+# study/management/commands/sync_class_status.py
+
+from django.core.management.base import BaseCommand
+
+from study.availability import day_masks
+from study.cache import bump, date_scope
+from study.models import TutorClass, SlotSupply
+
+
+class Command(BaseCommand):
+    help = "신청(StudentClass) 여부로 TutorClass.status를 다시 계산합니다."
+
+    def handle(self, *args, **options):
+        changed = TutorClass.objects.sync_status()
+
+        # status가 바뀐 수업의 날짜만 가용 시간 캐시 / 수업 현황을 다시 만든다.
+        dates = {date for start_time, duration in changed for date, _ in day_masks(start_time, duration)}
+        if dates:
+            bump(*(date_scope(date) for date in dates))
+            SlotSupply.objects.rebuild(min(dates), max(dates))
+        self.stdout.write(self.style.SUCCESS(f"{len(changed)}개 수업의 status를 동기화했습니다."))
@@ -0,0 +1,96 @@
+# study/matching.py
+
+"""
+수업 자동 매칭 (auto-book)
+
+같은 시작 시간 / 길이의 신청 가능한 수업을 ranker 순서로 정렬하고, 앞에서부터 StudentClass.objects.book()으로 선점한다.
+book()은 조건부 UPDATE(status=False인 row만 True로 변경)로 선점하므로 row lock을 기다리지 않는다.
+먼저 다른 학생이 선점한 수업은 변경 row 0개로 바로 실패하고 다음 후보로 넘어간다. (SELECT ... FOR UPDATE SKIP LOCKED와 같은 효과)
+같은 점수의 후보는 요청마다 순서를 섞어, 동시에 요청한 학생들이 서로 다른 수업부터 시도하게 한다.
+
+ranker는 settings.CLASS_MATCHING["RANKERS"]에 import 경로로 지정하고, 앞의 ranker 점수가 같을 때 다음 ranker 점수로 비교한다.
+ranker는 scores(candidates, start_time) => 후보별 점수 목록(작을수록 먼저 시도)을 구현한다.
+"""
+
+import random
+from collections import namedtuple
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError
+from django.db.models import Count
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .availability import day_origin, slot_index, slot_time
+from .models import TutorClass, StudentClass
+from . import cache as availability_cache
+
+DEFAULTS = {
+    "RANKERS": ("study.matching.LeastLoadedRanker",),
+    "MAX_ATTEMPTS": 20,  # 선점을 시도할 최대 후보 수
+}
+
+Candidate = namedtuple("Candidate", ["class_id", "tutor_id"])
+
+
+def matching_setting(name):
+    return getattr(settings, "CLASS_MATCHING", {}).get(name, DEFAULTS[name])
+
+
+def load_rankers():
+    return [import_string(path)() for path in matching_setting("RANKERS")]
+
+
+class LeastLoadedRanker:
+    """그날 신청된 수업이 적은 tutor 먼저 (tutor 간 부하 분산, 조회 1회)"""
+
+    def scores(self, candidates, start_time):
+        origin = day_origin(timezone.localtime(start_time).date())
+        booked = dict(
+            TutorClass.objects.filter(
+                tutor_id__in={candidate.tutor_id for candidate in candidates},
+                start_time__gte=origin,
+                start_time__lt=origin + timedelta(days=1),
+                status=True,
+            ).order_by().values("tutor_id").annotate(count=Count("id")).values_list("tutor_id", "count")
+        )
+        return [booked.get(candidate.tutor_id, 0) for candidate in candidates]
+
+
+def rank(candidates, start_time, rankers=None):
+    """ranker 점수 순서로 정렬한 후보 목록 (같은 점수는 임의 순서)"""
+    rankers = load_rankers() if rankers is None else rankers
+    candidates = list(candidates)
+    random.shuffle(candidates)  # sort는 stable하므로 같은 점수끼리는 섞인 순서가 유지된다.
+
+    scores = [ranker.scores(candidates, start_time) for ranker in rankers]
+    order = sorted(range(len(candidates)), key=lambda i: [score[i] for score in scores])
+    return [candidates[i] for i in order]
+
+
+def open_candidates(start_time, duration):
+    """해당 시작 시간 / 길이의 신청 가능한 수업 후보 (날짜별 신청 가능 목록 캐시 사용)"""
+    local_date = timezone.localtime(start_time).date()
+    origin = day_origin(local_date)
+    index = slot_index(start_time, origin)
+    if slot_time(index, origin) != start_time:
+        return []
+    return [Candidate(*row) for row in availability_cache.open_classes(local_date, duration).get(index, [])]
+
+
+def auto_book(student_id, start_time, duration):
+    """가장 순위가 높은 수업부터 선점을 시도해 신청한 후보(Candidate) 반환 (모두 실패하면 None)"""
+    candidates = open_candidates(start_time, duration)
+    if not candidates:
+        return None
+
+    for candidate in rank(candidates, start_time)[:matching_setting("MAX_ATTEMPTS")]:
+        try:
+            booked = StudentClass.objects.book(student_id, candidate.class_id)
+        except IntegrityError:  # status와 신청 row가 어긋난 경우
+            booked = None
+
+        if booked is not None:
+            return candidate
+    return None
@@ -0,0 +1,64 @@
+# Generated by Django 5.2 on 2026-10-18 07:25
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def fill_occupancy(apps, schema_editor):
+    # 기존 수업으로 날짜별 점유 mask 채우기
+    from study.availability import day_masks
+
+    TutorClass = apps.get_model("study", "TutorClass")
+    TutorDayOccupancy = apps.get_model("study", "TutorDayOccupancy")
+
+    masks = {}
+    rows = TutorClass.objects.values_list("tutor_id", "start_time", "duration")
+    for tutor_id, start_time, duration in rows.iterator(chunk_size=2000):
+        for date, mask in day_masks(start_time, duration):
+            masks[(tutor_id, date)] = masks.get((tutor_id, date), 0) | mask
+
+    TutorDayOccupancy.objects.bulk_create(
+        [
+            TutorDayOccupancy(tutor_id=tutor_id, date=date, mask=mask)
+            for (tutor_id, date), mask in masks.items()
+        ],
+        batch_size=2000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("study", "0003_tutorclass_status_alter_tutorclass_tutor_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TutorDayOccupancy",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("mask", models.BigIntegerField(default=0)),
+                (
+                    "tutor",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="day_occupancies",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={"unique_together": {("tutor", "date")},},
+        ),
+        migrations.RunPython(fill_occupancy, migrations.RunPython.noop),
+    ]
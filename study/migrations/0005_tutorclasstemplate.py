@@ -0,0 +1,65 @@
+# Generated by Django 5.2 on 2026-10-18 07:27
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("study", "0004_tutordayoccupancy"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TutorClassTemplate",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("weekday", models.IntegerField()),
+                ("start_time", models.TimeField()),
+                ("end_time", models.TimeField()),
+                ("duration", models.IntegerField(choices=[(30, "30분"), (60, "60분")])),
+                ("materialized_until", models.DateField(blank=True, null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "tutor",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="class_templates",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["weekday", "start_time"],
+            },
+        ),
+        migrations.AddField(
+            model_name="tutorclass",
+            name="template",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="classes",
+                to="study.tutorclasstemplate",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="tutorclasstemplate",
+            index=models.Index(
+                fields=["weekday", "materialized_until"],
+                name="study_tutor_weekday_ea334f_idx",
+            ),
+        ),
+    ]
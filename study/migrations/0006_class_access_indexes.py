@@ -0,0 +1,46 @@
+# Generated by Django 5.2 on 2026-10-18 07:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("study", "0005_tutorclasstemplate"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="tutorclass",
+            name="duration",
+            field=models.IntegerField(choices=[(30, "30분"), (60, "60분")]),
+        ),
+        migrations.AlterField(
+            model_name="tutorclass",
+            name="status",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name="studentclass",
+            index=models.Index(
+                fields=["student", "tutor_class"], name="study_student_class_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="tutorclass",
+            index=models.Index(
+                fields=["start_time", "duration", "status"],
+                name="study_class_start_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="tutorclass",
+            index=models.Index(
+                condition=models.Q(("status", False)),
+                fields=["duration", "start_time"],
+                name="study_open_class_idx",
+            ),
+        ),
+    ]
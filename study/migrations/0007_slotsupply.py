@@ -0,0 +1,35 @@
+# Generated by Django 5.2 on 2026-10-18 08:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("study", "0006_class_access_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SlotSupply",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("slot", models.SmallIntegerField()),
+                ("duration", models.IntegerField(choices=[(30, "30분"), (60, "60분")])),
+                ("open_count", models.IntegerField(default=0)),
+                ("booked_count", models.IntegerField(default=0)),
+            ],
+            options={
+                "unique_together": {("duration", "date", "slot")},
+            },
+        ),
+    ]
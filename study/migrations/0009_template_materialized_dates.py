@@ -0,0 +1,78 @@
+# Generated by Django 5.2 on 2026-10-18 08:38
+
+import django.db.models.deletion
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def copy_materialized_until(apps, schema_editor):
+    """materialized_until까지 생성한 앞으로의 날짜를 TutorClassTemplateDate로 기록 (tutor가 삭제한 수업을 다시 생성하지 않도록)"""
+    TutorClassTemplate = apps.get_model("study", "TutorClassTemplate")
+    TutorClassTemplateDate = apps.get_model("study", "TutorClassTemplateDate")
+
+    today = timezone.localdate()
+    templates = TutorClassTemplate.objects.filter(materialized_until__gte=today)
+    for template_id, weekday, materialized_until in templates.values_list("id", "weekday", "materialized_until").iterator():
+        date = today + timedelta(days=(weekday - today.weekday()) % 7)
+        batch = []
+        while date <= materialized_until:
+            batch.append(TutorClassTemplateDate(template_id=template_id, date=date))
+            date += timedelta(days=7)
+        TutorClassTemplateDate.objects.bulk_create(batch, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("study", "0008_waitlistentry"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TutorClassTemplateDate",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+            ],
+        ),
+        migrations.AddField(
+            model_name="tutorclasstemplatedate",
+            name="template",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="materialized_dates",
+                to="study.tutorclasstemplate",
+            ),
+        ),
+        migrations.AlterUniqueTogether(
+            name="tutorclasstemplatedate",
+            unique_together={("template", "date")},
+        ),
+        migrations.RunPython(copy_materialized_until, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name="tutorclasstemplate",
+            name="study_tutor_weekday_ea334f_idx",
+        ),
+        migrations.RemoveField(
+            model_name="tutorclasstemplate",
+            name="materialized_until",
+        ),
+        migrations.AddIndex(
+            model_name="tutorclasstemplate",
+            index=models.Index(
+                fields=["weekday"], name="study_tutor_weekday_e889a9_idx"
+            ),
+        ),
+    ]
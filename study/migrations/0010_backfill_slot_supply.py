@@ -0,0 +1,48 @@
+# Generated by Django 5.2 on 2026-10-18 09:12
+
+from datetime import datetime, time
+
+from django.db import migrations, models
+from django.utils import timezone
+
+SLOT_MINUTES = 30
+
+
+def backfill_slot_supply(apps, schema_editor):
+    """
+        0007 이전에 만들어진 수업도 SlotSupply에 포함되도록 TutorClass로 전체 row를 다시 만든다.
+
+        row가 없는 시간의 수업을 신청/취소하면 0에서 빼게 되므로 (음수) 비어 있는 날짜만이 아니라 전체를 다시 센다.
+        (SlotSupply.objects.rebuild()와 같은 집계. migration에서는 app 코드를 import하지 않는다.)
+    """
+    TutorClass = apps.get_model("study", "TutorClass")
+    SlotSupply = apps.get_model("study", "SlotSupply")
+
+    counts = {}
+    grouped = TutorClass.objects.order_by().values("start_time", "duration", "status").annotate(count=models.Count("id"))
+    for start_time, duration, booked, count in grouped.values_list("start_time", "duration", "status", "count").iterator():
+        date = timezone.localtime(start_time).date()
+        origin = timezone.make_aware(datetime.combine(date, time.min))
+        slot = int((start_time - origin).total_seconds() // (SLOT_MINUTES * 60))
+        opened_count, booked_count = counts.get((date, slot, duration), (0, 0))
+        counts[date, slot, duration] = (opened_count + (0 if booked else count), booked_count + (count if booked else 0))
+
+    SlotSupply.objects.all().delete()
+    SlotSupply.objects.bulk_create(
+        [
+            SlotSupply(date=date, slot=slot, duration=duration, open_count=opened, booked_count=booked)
+            for (date, slot, duration), (opened, booked) in counts.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("study", "0009_template_materialized_dates"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_slot_supply, migrations.RunPython.noop),
+    ]
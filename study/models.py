@@ -1,45 +1,301 @@
 # study/models.py
 
-from django.db import models
+from django.db import connection, models, transaction
+from django.db.models import F, Q
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 from django.core.exceptions import ValidationError
 
 from datetime import timedelta
 
+from .availability import FULL_DAY_MASK, day_origin, slot_cell, class_mask, day_masks, expand_recurrence, booking_horizon
+from .cache import bump, date_scope, waitlist_scope, student_mask
+
 from django.contrib.auth import get_user_model
 User = get_user_model()
 
 # Create your models here.
+class TutorClassManager(models.Manager):
+
+    def bulk_open(self, tutor_id, slots, template=None):
+        """
+            (start_time, duration) 목록을 한 번에 생성한다.
+
+            겹침 검증은 호출하는 쪽에서 끝났다고 가정하고,
+            bulk_create는 signal이 호출되지 않으므로 점유 mask를 직접 갱신한다.
+        """
+        classes = self.bulk_create([
+            TutorClass(tutor_id=tutor_id, start_time=start_time, duration=duration, template=template)
+            for start_time, duration in slots
+        ])
+
+        masks = {}
+        for start_time, duration in slots:
+            for date, mask in day_masks(start_time, duration):
+                masks[date] = masks.get(date, 0) | mask
+        TutorDayOccupancy.objects.occupy_masks(tutor_id, masks)
+        SlotSupply.objects.add({(*slot_cell(start_time), duration): (1, 0) for start_time, duration in slots})
+        bump(*(date_scope(date) for date in masks))
+        WaitlistEntry.objects.assign_slots(slots)
+
+        return classes
+
+    def sync_status(self, ids=None):
+        """
+            신청 row 존재 여부로 status를 다시 계산하고 status가 바뀐 수업의 (start_time, duration) 목록을 반환한다.
+            signal 없이 지워진 신청(raw SQL 등)으로 어긋난 status를 맞출 때 사용
+        """
+        classes = self.all() if ids is None else self.filter(id__in=ids)
+        booked = models.Exists(StudentClass.objects.filter(tutor_class=models.OuterRef("pk")))
+
+        drifted = list(classes.alias(booked=booked).exclude(status=F("booked")).values_list("id", "start_time", "duration"))
+        self.filter(id__in=[class_id for class_id, _, _ in drifted]).update(status=booked)
+        return [(start_time, duration) for _, start_time, duration in drifted]
+
 class TutorClass(models.Model):
     DURATION_CHOICES = (
         (30, "30분"),
         (60, "60분"),
     )
+    MAX_DURATION = max(minutes for minutes, _ in DURATION_CHOICES)
 
     tutor = models.ForeignKey(User, on_delete=models.CASCADE, related_name="open_class_times")
     start_time = models.DateTimeField()
-    duration = models.IntegerField(choices=DURATION_CHOICES, db_index=True)
-    status = models.BooleanField(default=False, db_index=True)
+    duration = models.IntegerField(choices=DURATION_CHOICES)
+    status = models.BooleanField(default=False)
+    template = models.ForeignKey(  # 반복 템플릿으로 생성된 수업
+        "TutorClassTemplate",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="classes"
+    )
+
+    objects = TutorClassManager()
 
     class Meta:
         ordering = ["start_time"]
-        unique_together = ("tutor", "start_time")  # 같은 시간 중복 방지
+        unique_together = ("tutor", "start_time")  # 같은 시간 중복 방지 + tutor별 시간 범위 조회 index
+        indexes = [
+            # 시간대/수업 길이로 수업 조회 (available_classe, available_time)
+            models.Index(fields=["start_time", "duration", "status"], name="study_class_start_idx"),
+            # 신청 가능한 수업만 담는 partial index
+            models.Index(
+                fields=["duration", "start_time"],
+                condition=Q(status=False),
+                name="study_open_class_idx",
+            ),
+        ]
 
     def clean(self):
-        # 겹치는 시간 검증
-        end_time = self.end_time
-        overlapping = TutorClass.objects.filter(
-            tutor = self.tutor,
-            start_time__lt = end_time,
-        ).exclude(id = self.id)
+        # 겹치는 시간 검증 => tutor의 날짜별 점유 mask (1~2 row)와 bit 연산
+        exclude = None
+        if self.pk:
+            # 수정하는 경우 기존 수업이 차지하던 슬롯은 제외
+            exclude = TutorClass.objects.filter(pk=self.pk).values_list("start_time", "duration").first()
 
-        for slot in overlapping:
-            if slot.end_time > self.start_time:
-                raise ValidationError("이미 겹치는 수업이 존재합니다.")
+        if TutorDayOccupancy.objects.conflicts(self.tutor_id, self.start_time, self.duration, exclude=exclude):
+            raise ValidationError("이미 겹치는 수업이 존재합니다.")
 
     @property
     def end_time(self):
         return self.start_time + timedelta(minutes=self.duration)
 
+class TutorDayOccupancyManager(models.Manager):
+
+    def masks(self, tutor_id, dates):
+        """{현지 날짜: 점유 mask} (row가 없는 날짜는 0)"""
+        rows = self.filter(tutor_id=tutor_id, date__in=dates).values_list("date", "mask")
+        masks = dict.fromkeys(dates, 0)
+        masks.update(rows)
+        return masks
+
+    async def amasks(self, tutor_id, dates):
+        """masks()의 async 버전"""
+        rows = self.filter(tutor_id=tutor_id, date__in=dates).values_list("date", "mask")
+        masks = dict.fromkeys(dates, 0)
+        masks.update([row async for row in rows])
+        return masks
+
+    def conflicts(self, tutor_id, start_time, duration, exclude=None):
+        """해당 수업이 tutor의 기존 수업과 겹치는지"""
+        bits = day_masks(start_time, duration)
+        masks = self.masks(tutor_id, [date for date, _ in bits])
+
+        if exclude:
+            for date, mask in day_masks(*exclude):
+                if date in masks:
+                    masks[date] &= ~mask
+
+        return any(masks[date] & mask for date, mask in bits)
+
+    def fit(self, tutor_id, slots):
+        """
+            (start_time, duration) 목록을 순서대로 놓아보며 겹치지 않는지 여부 목록을 반환한다.
+            기존 수업뿐 아니라 앞서 놓은 수업과의 겹침도 함께 검사한다. (점유 mask 조회 1회)
+        """
+        bits = [day_masks(start_time, duration) for start_time, duration in slots]
+        masks = self.masks(tutor_id, {date for slot_bits in bits for date, _ in slot_bits})
+
+        fits = []
+        for slot_bits in bits:
+            fit = not any(masks[date] & mask for date, mask in slot_bits)
+            if fit:
+                for date, mask in slot_bits:
+                    masks[date] |= mask
+            fits.append(fit)
+        return fits
+
+    def occupy(self, tutor_id, start_time, duration):
+        self.occupy_masks(tutor_id, dict(day_masks(start_time, duration)))
+
+    def occupy_masks(self, tutor_id, masks):
+        """{현지 날짜: 추가로 점유할 mask}"""
+        for date, mask in masks.items():
+            self.get_or_create(tutor_id=tutor_id, date=date)
+            self.filter(tutor_id=tutor_id, date=date).update(mask=F("mask").bitor(mask))
+
+    def release(self, tutor_id, start_time, duration):
+        for date, mask in day_masks(start_time, duration):
+            self.filter(tutor_id=tutor_id, date=date).update(mask=F("mask").bitand(FULL_DAY_MASK ^ mask))
+
+class TutorDayOccupancy(models.Model):
+    """
+        tutor의 날짜(TIME_ZONE 기준)별 수업 점유 상태
+
+        mask의 i번째 bit = 00:00 + 30분 * i 슬롯에 수업이 있음
+        TutorClass 생성/삭제 시 signal로 동기화된다.
+    """
+
+    tutor = models.ForeignKey(User, on_delete=models.CASCADE, related_name="day_occupancies")
+    date = models.DateField()
+    mask = models.BigIntegerField(default=0)
+
+    objects = TutorDayOccupancyManager()
+
+    class Meta:
+        unique_together = ("tutor", "date")
+
+class TutorClassTemplateManager(models.Manager):
+
+    def materialize(self, start_date, end_date, tutor_id=None):
+        """
+            [start_date, end_date] 기간이 조회될 때 해당 기간의 템플릿 수업을 TutorClass row로 생성한다.
+            오늘 ~ booking_horizon() 밖의 날짜는 생성하지 않고, 템플릿별로 이미 생성한 날짜(TutorClassTemplateDate)는 건너뛴다.
+        """
+        start_date = max(start_date, timezone.localdate())
+        end_date = min(end_date, booking_horizon())
+        if start_date > end_date:
+            return
+
+        dates = {}  # {요일: 기간 내 날짜 목록}
+        for i in range((end_date - start_date).days + 1):
+            date = start_date + timedelta(days=i)
+            dates.setdefault(date.weekday(), []).append(date)
+
+        templates = self.filter(weekday__in=dates)
+        if tutor_id:
+            templates = templates.filter(tutor_id=tutor_id)
+
+        templates = list(templates.values_list("id", "weekday"))
+        if not templates:
+            return
+
+        done = set(TutorClassTemplateDate.objects.filter(
+            template_id__in=[template_id for template_id, _ in templates], date__gte=start_date, date__lte=end_date
+        ).values_list("template_id", "date"))
+
+        pending = {}
+        for template_id, weekday in templates:
+            missing = [date for date in dates[weekday] if (template_id, date) not in done]
+            if missing:
+                pending[template_id] = missing
+        if not pending:
+            return
+
+        with transaction.atomic():
+            for template in self.select_for_update().filter(id__in=pending):
+                template.materialize(pending[template.id])
+
+class TutorClassTemplate(models.Model):
+    """
+        tutor의 주간 반복 수업 템플릿 (ex. 월요일 19:00~22:00, 30분 수업)
+
+        미리 수업을 만들어 두지 않고, 해당 날짜가 조회될 때 TutorClass로 생성된다.
+    """
+
+    tutor = models.ForeignKey(User, on_delete=models.CASCADE, related_name="class_templates")
+    weekday = models.IntegerField()  # 월=0 ~ 일=6
+    start_time = models.TimeField()  # TIME_ZONE 기준
+    end_time = models.TimeField()
+    duration = models.IntegerField(choices=TutorClass.DURATION_CHOICES)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = TutorClassTemplateManager()
+
+    class Meta:
+        ordering = ["weekday", "start_time"]
+        indexes = [
+            models.Index(fields=["weekday"]),
+        ]
+
+    def materialize(self, dates):
+        """dates 중 아직 생성하지 않은 날짜의 수업 생성 (select_for_update로 잠근 뒤 호출)"""
+        done = set(self.materialized_dates.filter(date__in=dates).values_list("date", flat=True))
+        dates = sorted(set(dates) - done)
+        if not dates:
+            return []
+
+        now = timezone.now()
+        starts = [
+            timezone.make_aware(start)
+            for date in dates
+            for start in expand_recurrence(date, date, [self.weekday], self.start_time, self.end_time, self.duration)
+        ]
+        slots = [(start, self.duration) for start in starts if start >= now]
+
+        # 직접 생성한 수업이나 다른 템플릿과 겹치는 시간은 건너뛴다.
+        fits = TutorDayOccupancy.objects.fit(self.tutor_id, slots)
+        slots = [slot for slot, fit in zip(slots, fits) if fit]
+
+        classes = TutorClass.objects.bulk_open(self.tutor_id, slots, template=self)
+        TutorClassTemplateDate.objects.bulk_create([TutorClassTemplateDate(template=self, date=date) for date in dates])
+
+        return classes
+
+class TutorClassTemplateDate(models.Model):
+    """
+        템플릿 수업을 생성한 날짜
+
+        조회된 날짜만 생성하므로 생성한 날짜가 연속되지 않는다.
+        tutor가 삭제한 템플릿 수업이 다시 생성되지 않도록 생성 여부를 날짜별로 기록한다.
+    """
+
+    template = models.ForeignKey(TutorClassTemplate, on_delete=models.CASCADE, related_name="materialized_dates")
+    date = models.DateField()
+
+    class Meta:
+        unique_together = ("template", "date")
+
+class StudentClassManager(models.Manager):
+
+    def book(self, student_id, tutor_class_id):
+        """
+            수업 신청 (신청되지 않은 수업일 때만 status를 변경하고 신청 row 생성)
+
+            조건부 UPDATE의 변경 row 수로 선점 여부를 판단하므로
+            동시에 같은 수업을 신청해도 한 명만 성공한다. 선점에 실패하면 None
+        """
+        with transaction.atomic():
+            claimed = TutorClass.objects.filter(id=tutor_class_id, status=False).update(status=True)
+            if not claimed:
+                return None
+
+            student_class = self.model(student_id=student_id, tutor_class_id=tutor_class_id)
+            student_class.status_claimed = True  # status는 위에서 변경 완료 => signal에서 다시 변경하지 않음
+            student_class.save(force_insert=True)
+            return student_class
+
 class StudentClass(models.Model):
 
     tutor_class = models.OneToOneField(  # 수업 하나당 한 명만 신청 가능하게
@@ -50,5 +306,230 @@ class StudentClass(models.Model):
     student = models.ForeignKey(User, on_delete=models.CASCADE)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = StudentClassManager()
+
     class Meta:
         unique_together = ('tutor_class', 'student')  # 중복 신청 방지
+        indexes = [
+            # 학생별 신청 조회 시 tutor_class_id까지 index에서 바로 읽는다.
+            models.Index(fields=["student", "tutor_class"], name="study_student_class_idx"),
+        ]
+
+# SlotSupply UPDATE 1회에 묶는 최대 row 수 (WHERE 조건 길이 제한)
+UPDATE_BATCH_SIZE = 200
+
+class SlotSupplyManager(models.Manager):
+
+    def add(self, deltas):
+        """
+            {(현지 날짜, 슬롯 index, duration): (신청 가능 수 변화, 신청된 수 변화)}
+
+            슬롯 수와 상관없이 row 생성 1회 + 같은 변화량끼리 묶은 UPDATE로 처리한다. (bulk_open)
+        """
+        if len(deltas) == 1:
+            # 신청/취소는 수업 생성 시 만들어진 row가 있으므로 UPDATE 1회
+            [((date, slot, duration), (opened, booked))] = deltas.items()
+            changes = {"open_count": F("open_count") + opened, "booked_count": F("booked_count") + booked}
+            if self.filter(date=date, slot=slot, duration=duration).update(**changes):
+                return
+
+        self.bulk_create(
+            [SlotSupply(date=date, slot=slot, duration=duration) for date, slot, duration in deltas],
+            ignore_conflicts=True,
+        )
+
+        cells_by_delta = {}
+        for cell, delta in deltas.items():
+            cells_by_delta.setdefault(delta, []).append(cell)
+
+        for (opened, booked), cells in cells_by_delta.items():
+            for i in range(0, len(cells), UPDATE_BATCH_SIZE):
+                match = Q()
+                for date, slot, duration in cells[i:i + UPDATE_BATCH_SIZE]:
+                    match |= Q(date=date, slot=slot, duration=duration)
+                self.filter(match).update(
+                    open_count=F("open_count") + opened,
+                    booked_count=F("booked_count") + booked,
+                )
+
+    def recount(self, start_time, duration):
+        """해당 시작 시간/길이의 수업 수를 TutorClass에서 다시 센다. (study_class_start_idx 조회 1회)"""
+        date, slot = slot_cell(start_time)
+        counts = TutorClass.objects.filter(start_time=start_time, duration=duration).aggregate(
+            open_count=models.Count("id", filter=Q(status=False)),
+            booked_count=models.Count("id", filter=Q(status=True)),
+        )
+        self.update_or_create(date=date, slot=slot, duration=duration, defaults=counts)
+
+    def rebuild(self, start_date=None, end_date=None):
+        """[start_date, end_date] 기간(없으면 전체)의 row를 TutorClass에서 다시 만들고 row 수를 반환한다."""
+        classes = TutorClass.objects.order_by()
+        rows = self.all()
+        if start_date:
+            classes = classes.filter(start_time__gte=day_origin(start_date))
+            rows = rows.filter(date__gte=start_date)
+        if end_date:
+            classes = classes.filter(start_time__lt=day_origin(end_date + timedelta(days=1)))
+            rows = rows.filter(date__lte=end_date)
+
+        # 같은 시작 시간/길이/status의 수업은 DB에서 묶어서 센다.
+        counts = {}
+        grouped = classes.values("start_time", "duration", "status").annotate(count=models.Count("id"))
+        for row in grouped.values_list("start_time", "duration", "status", "count").iterator():
+            start_time, duration, booked, count = row
+            key = (*slot_cell(start_time), duration)
+            opened_count, booked_count = counts.get(key, (0, 0))
+            counts[key] = (opened_count + (0 if booked else count), booked_count + (count if booked else 0))
+
+        with transaction.atomic():
+            rows.delete()
+            self.bulk_create(
+                [
+                    SlotSupply(date=date, slot=slot, duration=duration, open_count=opened, booked_count=booked)
+                    for (date, slot, duration), (opened, booked) in counts.items()
+                ],
+                batch_size=1000,
+            )
+        return len(counts)
+
+class SlotSupply(models.Model):
+    """
+        날짜(TIME_ZONE 기준) / 30분 슬롯 / 수업 길이별 신청 가능한 수업 수와 신청된 수업 수
+
+        TutorClass 생성/삭제, 수업 신청/취소 시 signal로 갱신된다. (bulk_open, book은 직접 갱신)
+        어긋난 경우 `manage.py rebuild_slot_supply`로 다시 만든다.
+    """
+
+    date = models.DateField()
+    slot = models.SmallIntegerField()  # 00:00 + 30분 * slot
+    duration = models.IntegerField(choices=TutorClass.DURATION_CHOICES)
+    open_count = models.IntegerField(default=0)
+    booked_count = models.IntegerField(default=0)
+
+    objects = SlotSupplyManager()
+
+    class Meta:
+        # 수업 길이 + 기간 조회 (월별 heatmap)가 index 범위 조회 한 번이 되도록 duration을 앞에 둔다.
+        unique_together = ("duration", "date", "slot")
+
+class WaitlistEntryManager(models.Manager):
+
+    def waiting(self, start_time, duration):
+        return self.filter(start_time=start_time, duration=duration, status=WaitlistEntry.Status.WAITING)
+
+    def assign(self, start_time, duration):
+        """
+            해당 시간의 신청 가능한 수업을 대기 순서(id)대로 배정하고 배정한 entry 목록을 반환한다.
+
+            수업 선점은 StudentClass.objects.book()과 같은 조건부 UPDATE이므로 동시에 배정해도 수업 하나는 한 명에게만 간다.
+            대기 중에 같은 시간의 다른 수업을 신청해 겹치게 된 entry는 취소한다.
+        """
+        if start_time <= timezone.now():
+            return []
+
+        assigned = []
+        with transaction.atomic():
+            open_ids = list(
+                TutorClass.objects.filter(start_time=start_time, duration=duration, status=False)
+                .order_by("id").values_list("id", flat=True)
+            )
+            if not open_ids:
+                return []
+
+            waiting = self.waiting(start_time, duration).order_by("id")
+            if connection.features.has_select_for_update_skip_locked:
+                waiting = waiting.select_for_update(skip_locked=True)  # 다른 transaction이 배정 중인 entry는 건너뛴다.
+
+            date = timezone.localtime(start_time).date()
+            while open_ids and (entry := waiting.first()):
+                if student_mask(entry.student_id, date) & class_mask(start_time, duration, day_origin(date)):
+                    self.close(entry, WaitlistEntry.Status.CANCELLED)
+                    continue
+
+                while open_ids:
+                    class_id = open_ids.pop(0)
+                    if StudentClass.objects.book(entry.student_id, class_id):
+                        self.close(entry, WaitlistEntry.Status.ASSIGNED, tutor_class_id=class_id)
+                        assigned.append(entry)
+                        break
+
+        return assigned
+
+    def assign_slots(self, slots):
+        """(start_time, duration) 목록 중 대기자가 있는 시간만 배정 (대기자 조회 1회)"""
+        waited = self.filter(
+            status=WaitlistEntry.Status.WAITING, start_time__in={start_time for start_time, _ in slots}
+        ).values_list("start_time", "duration").distinct()
+
+        for start_time, duration in set(waited) & set(slots):
+            self.assign(start_time, duration)
+
+    def for_student(self, student_id):
+        """student의 지금 이후 대기 entry (대기 중이면 position = 대기 순번, 조회 1회)"""
+        ahead = self.filter(
+            start_time=models.OuterRef("start_time"),
+            duration=models.OuterRef("duration"),
+            status=WaitlistEntry.Status.WAITING,
+            id__lt=models.OuterRef("id"),
+        ).order_by().values("start_time").annotate(count=models.Count("id")).values("count")
+
+        return self.filter(student_id=student_id, start_time__gte=timezone.now()).annotate(
+            position=models.Case(
+                models.When(
+                    status=WaitlistEntry.Status.WAITING,
+                    then=Coalesce(models.Subquery(ahead), 0) + 1,
+                ),
+                output_field=models.IntegerField(),
+            )
+        )
+
+    def close(self, entry, status, **fields):
+        self.filter(pk=entry.pk).update(status=status, closed_at=timezone.now(), **fields)
+        bump(waitlist_scope(entry.student_id))
+
+class WaitlistEntry(models.Model):
+    """
+        모든 수업이 신청된 시간(start_time, duration)의 대기 목록
+
+        신청 취소 / 같은 시간의 수업 생성 시 먼저 등록한 대기자부터 수업을 배정한다. (signal, 같은 transaction)
+    """
+
+    class Status(models.TextChoices):
+        WAITING = "waiting", "대기"
+        ASSIGNED = "assigned", "배정"
+        CANCELLED = "cancelled", "취소"
+
+    student = models.ForeignKey(User, on_delete=models.CASCADE, related_name="waitlist_entries")
+    start_time = models.DateTimeField()
+    duration = models.IntegerField(choices=TutorClass.DURATION_CHOICES)
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.WAITING)
+    tutor_class = models.ForeignKey(  # 배정된 수업
+        TutorClass,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="waitlist_entries"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    closed_at = models.DateTimeField(null=True, blank=True)
+
+    objects = WaitlistEntryManager()
+
+    class Meta:
+        ordering = ["id"]
+        indexes = [
+            # 시간별 대기 순서 (배정 / 대기 순번 계산)
+            models.Index(
+                fields=["start_time", "duration", "id"],
+                condition=Q(status="waiting"),
+                name="study_waitlist_queue_idx",
+            ),
+        ]
+        constraints = [
+            # 같은 시간에 한 번만 대기
+            models.UniqueConstraint(
+                fields=["student", "start_time", "duration"],
+                condition=Q(status="waiting"),
+                name="study_waitlist_unique_waiting",
+            ),
+        ]
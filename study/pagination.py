@@ -0,0 +1,127 @@
+# study/pagination.py
+
+"""
+수업 목록 cursor(keyset) 페이지네이션
+
+(start_time, id) 순서로 정렬하고, 다음 페이지는 마지막 row의 (start_time, id)보다 뒤의 row부터 읽는다.
+OFFSET 없이 index 범위 조회만으로 페이지를 읽으므로 몇 번째 페이지든 비용이 같다.
+단, 신청한 수업 목록(StudentClass)은 JOIN한 tutor_class__start_time으로 정렬하므로 index 범위 조회가 아니라
+페이지마다 해당 student의 신청을 모두 읽어 정렬한다. (비용은 전체 수업 수가 아니라 student별 신청 수에 비례)
+"""
+
+import base64
+from datetime import datetime
+
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime, parse_date
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 200
+
+
+class CursorError(ValueError):
+    pass
+
+
+def encode_cursor(start_time, pk):
+    value = f"{start_time.isoformat()}|{pk}"
+    return base64.urlsafe_b64encode(value.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    try:
+        value = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        start_time, pk = value.split("|")
+        start_time = parse_datetime(start_time)
+        pk = int(pk)
+    except (ValueError, UnicodeDecodeError):
+        raise CursorError("잘못된 cursor입니다.")
+
+    if start_time is None or timezone.is_naive(start_time):
+        raise CursorError("잘못된 cursor입니다.")
+    return start_time, pk
+
+
+def parse_bound(value, name):
+    """from/to 값 (YYYY-MM-DD 또는 YYYY-MM-DDTHH:MM[:SS]) => aware datetime, 날짜만 입력하면 현지 자정"""
+    try:
+        moment = parse_datetime(value) or parse_date(value)
+    except ValueError:  # 형식은 맞지만 없는 날짜 (2025-02-30, 2025-13-01 등)
+        moment = None
+    if moment is None:
+        raise CursorError(f"{name}은 YYYY-MM-DD 또는 YYYY-MM-DDTHH:MM 형식으로 입력하세요.")
+    if not isinstance(moment, datetime):
+        moment = datetime.combine(moment, datetime.min.time())
+
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment, timezone.get_default_timezone())
+    return moment
+
+
+class ClassCursorPagination:
+    """
+        수업 목록 페이지네이션
+
+        query parameter
+            - cursor: 이전 응답의 next_cursor
+            - limit: 페이지 크기 (기본 50, 최대 200)
+            - from / to: 시작 시간 범위 [from, to)
+            - upcoming_only: true이면 지금 이후 수업만
+    """
+
+    def __init__(self, start_field="start_time", id_field="id"):
+        self.start_field = start_field
+        self.id_field = id_field
+
+    def paginate(self, queryset, params):
+        """(현재 페이지 row list, next_cursor) 반환, 잘못된 parameter는 CursorError"""
+        queryset, limit = self.page_queryset(queryset, params)
+        return self.page(list(queryset), limit)
+
+    async def apaginate(self, queryset, params):
+        """paginate()의 async 버전 (async ORM으로 조회)"""
+        queryset, limit = self.page_queryset(queryset, params)
+        return self.page([row async for row in queryset], limit)
+
+    def page_queryset(self, queryset, params):
+        """필터/cursor를 적용한 (limit + 1)개 조회 queryset과 limit"""
+        try:
+            limit = int(params.get("limit", DEFAULT_LIMIT))
+        except ValueError:
+            raise CursorError("limit은 숫자로 입력하세요.")
+        if not 1 <= limit <= MAX_LIMIT:
+            raise CursorError(f"limit은 1 ~ {MAX_LIMIT} 사이로 입력하세요.")
+
+        start = self.start_field
+        if params.get("from"):
+            queryset = queryset.filter(**{f"{start}__gte": parse_bound(params["from"], "from")})
+        if params.get("to"):
+            queryset = queryset.filter(**{f"{start}__lt": parse_bound(params["to"], "to")})
+        if params.get("upcoming_only", "").lower() in ("1", "true"):
+            queryset = queryset.filter(**{f"{start}__gte": timezone.now()})
+
+        if params.get("cursor"):
+            start_time, pk = decode_cursor(params["cursor"])
+            queryset = queryset.filter(
+                Q(**{f"{start}__gt": start_time}) | Q(**{start: start_time, f"{self.id_field}__gt": pk})
+            )
+
+        # 다음 페이지가 있는지 확인하기 위해 1개 더 읽는다.
+        return queryset.order_by(start, self.id_field)[:limit + 1], limit
+
+    def page(self, rows, limit):
+        if len(rows) <= limit:
+            return rows, None
+
+        rows = rows[:limit]
+        last = rows[-1]
+        return rows, encode_cursor(self.value(last, self.start_field), self.value(last, self.id_field))
+
+    @staticmethod
+    def value(row, field):
+        if isinstance(row, dict):  # values() row
+            return row[field]
+        for name in field.split("__"):
+            row = getattr(row, name)
+        return row
@@ -3,11 +3,10 @@ from rest_framework.response import Response
 
 from django.utils import timezone
 
-from .models import TutorClass, StudentClass
+from .models import TutorClass, StudentClass, TutorClassTemplate
+from .timeutils import localize
 
-from django.utils import timezone
-from django.conf import settings
-import pytz
+from datetime import timezone as dt_timezone
 
 class TutorClassSerializer(serializers.ModelSerializer):
     class Meta:
@@ -18,9 +17,7 @@ class TutorClassSerializer(serializers.ModelSerializer):
     def validate_start_time(self, value):
         # 만약 timezone 정보가 없거나 local time이라면, settings.TIME_ZONE으로 간주하고 UTC로 변환
         if timezone.is_naive(value):
-            local_tz = pytz.timezone(settings.TIME_ZONE)
-            value = local_tz.localize(value)  # timezone 붙이기
-            value = value.astimezone(pytz.UTC)  # UTC로 변환
+            value = localize(value).astimezone(dt_timezone.utc)  # timezone 붙이고 UTC로 변환
 
         # 정각/30분 체크
         if value.minute not in (0, 30):
@@ -35,7 +32,7 @@ class TutorClassSerializer(serializers.ModelSerializer):
     def validate(self, data):
         # 임시 인스턴스 생성
         instance = TutorClass(
-            tutor=self.context["request"].user,
+            tutor_id=self.context["request"].user.id,
             start_time=data["start_time"],
             duration=data["duration"]
         )
@@ -51,4 +48,139 @@ class StudentClassSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = StudentClass
-        fields = "__all__"
\ No newline at end of file
+        fields = "__all__"
+
+class TutorClassSlotSerializer(TutorClassSerializer):
+    """
+        일괄 생성용 단일 수업 검증 (시간 형식 검증만)
+
+        겹침 검증은 일괄 생성 API에서 전체 수업을 모아 한 번에 처리한다.
+    """
+
+    def validate(self, data):
+        return data
+
+class TutorClassRecurrenceSerializer(serializers.Serializer):
+    start_date = serializers.DateField()
+    end_date = serializers.DateField()
+    weekdays = serializers.ListField(child=serializers.IntegerField(min_value=0, max_value=6), allow_empty=False)
+    start = serializers.TimeField()
+    end = serializers.TimeField()
+    duration = serializers.ChoiceField(choices=TutorClass.DURATION_CHOICES)
+
+    MAX_DAYS = 31
+
+    def validate(self, data):
+        if data["start_date"] > data["end_date"]:
+            raise serializers.ValidationError("start_date는 end_date 이전이어야 합니다.")
+
+        if (data["end_date"] - data["start_date"]).days >= self.MAX_DAYS:
+            raise serializers.ValidationError(f"최대 {self.MAX_DAYS}일까지 한 번에 생성할 수 있습니다.")
+
+        if data["start"] >= data["end"]:
+            raise serializers.ValidationError("start는 end 이전이어야 합니다.")
+
+        return data
+
+
+class TutorClassTemplateSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = TutorClassTemplate
+        fields = ("id", "tutor", "weekday", "start_time", "end_time", "duration")
+        read_only_fields = ["tutor"]
+
+    def validate_weekday(self, value):
+        if value not in range(7):
+            raise serializers.ValidationError("weekday는 0(월) ~ 6(일)이어야 합니다.")
+        return value
+
+    def validate(self, data):
+        start, end = data["start_time"], data["end_time"]
+
+        if start.minute not in (0, 30) or end.minute not in (0, 30):
+            raise serializers.ValidationError("수업 시간은 정각 또는 30분만 가능합니다.")
+
+        if (end.hour * 60 + end.minute) - (start.hour * 60 + start.minute) < data["duration"]:
+            raise serializers.ValidationError("end_time은 start_time 이후 duration 이상이어야 합니다.")
+
+        overlapping = TutorClassTemplate.objects.filter(
+            tutor_id=self.context["request"].user.id,
+            weekday=data["weekday"],
+            start_time__lt=end,
+            end_time__gt=start,
+        )
+        if overlapping.exists():
+            raise serializers.ValidationError({"message": "이미 겹치는 템플릿이 존재합니다."})
+
+        return data
+
+
+def format_datetime(value):
+    """DRF DateTimeField 출력과 같은 형식 (TIME_ZONE 기준 isoformat, UTC이면 Z)"""
+    value = timezone.localtime(value).isoformat()
+    if value.endswith("+00:00"):
+        value = value[:-6] + "Z"
+    return value
+
+
+class ValuesReadSerializer:
+    """
+        목록 조회용 읽기 전용 serializer
+
+        ModelSerializer는 row마다 field 객체의 to_representation을 호출하므로 목록이 길면 CPU를 많이 쓴다.
+        values()로 읽은 dict를 출력 이름으로만 바꾸고, datetime 문자열은 같은 값끼리 한 번만 만든다.
+        출력은 대응하는 ModelSerializer와 같다. (tests.py에서 비교)
+    """
+    fields = ()  # (출력 이름, values() field)
+    datetime_fields = ()
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    @classmethod
+    def values(cls, queryset, *extra):
+        """출력에 필요한 field (+ 페이지네이션 등에 쓰는 extra field)만 읽는 queryset"""
+        return queryset.values(*(field for _, field in cls.fields), *extra)
+
+    @property
+    def data(self):
+        formatted = {}
+
+        def format_value(value):
+            if value is None:
+                return None
+            if value not in formatted:
+                formatted[value] = format_datetime(value)
+            return formatted[value]
+
+        fields = [(name, field, name in self.datetime_fields) for name, field in self.fields]
+        return [
+            {
+                name: format_value(row[field]) if is_datetime else row[field]
+                for name, field, is_datetime in fields
+            }
+            for row in self.rows
+        ]
+
+
+class TutorClassReadSerializer(ValuesReadSerializer):
+    """TutorClassSerializer 출력과 같은 목록 조회용 serializer"""
+    fields = (("id", "id"), ("tutor", "tutor_id"), ("start_time", "start_time"), ("duration", "duration"))
+    datetime_fields = ("start_time",)
+
+
+class StudentClassReadSerializer(ValuesReadSerializer):
+    """StudentClassSerializer 출력과 같은 목록 조회용 serializer"""
+    fields = (
+        ("id", "id"), ("created_at", "created_at"), ("tutor_class", "tutor_class_id"), ("student", "student_id"),
+    )
+    datetime_fields = ("created_at",)
+
+
+class WaitlistEntryReadSerializer(ValuesReadSerializer):
+    """대기 entry 조회용 serializer (WaitlistEntry.objects.for_student()의 position 포함)"""
+    fields = (
+        ("id", "id"), ("start_time", "start_time"), ("duration", "duration"), ("status", "status"),
+        ("position", "position"), ("class_id", "tutor_class_id"), ("created_at", "created_at"),
+    )
+    datetime_fields = ("start_time", "created_at")
@@ -1,19 +1,78 @@
 # study/signals.py
 
+from django.db import models
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
-from .models import TutorClass, StudentClass
+from .models import TutorClass, StudentClass, TutorDayOccupancy, SlotSupply, WaitlistEntry
+from .availability import slot_cell
+from . import cache
 
+from django.contrib.auth import get_user_model
+User = get_user_model()
+
+@receiver(post_save, sender=TutorClass)
+def occupy_tutor_day(sender, instance, created, **kwargs):
+    if created:
+        TutorDayOccupancy.objects.occupy(instance.tutor_id, instance.start_time, instance.duration)
+        SlotSupply.objects.add({
+            (*slot_cell(instance.start_time), instance.duration): (0, 1) if instance.status else (1, 0)
+        })
+        cache.bump_class_dates(instance.start_time, instance.duration)
+        if not instance.status:
+            WaitlistEntry.objects.assign_slots([(instance.start_time, instance.duration)])
+
+@receiver(post_delete, sender=TutorClass)
+def release_tutor_day(sender, instance, **kwargs):
+    TutorDayOccupancy.objects.release(instance.tutor_id, instance.start_time, instance.duration)
+    # 신청 row가 함께 삭제(CASCADE)되면 instance.status가 DB와 다를 수 있으므로 해당 슬롯을 다시 센다.
+    SlotSupply.objects.recount(instance.start_time, instance.duration)
+    cache.bump_class_dates(instance.start_time, instance.duration)
+
+def booking_schedule(instance):
+    """신청한 수업의 (start_time, duration), 수업이 없으면 None"""
+    if StudentClass.tutor_class.is_cached(instance):
+        return (instance.tutor_class.start_time, instance.tutor_class.duration)
+    return TutorClass.objects.filter(pk=instance.tutor_class_id).values_list("start_time", "duration").first()
+
+def bump_booking_cache(instance, schedule):
+    # 신청한 수업 날짜의 신청 가능 목록 + student의 신청 mask 무효화
+    if schedule:
+        cache.bump_class_dates(*schedule)
+    cache.bump(cache.student_scope(instance.student_id))
+
+def move_supply(schedule, opened, booked):
+    start_time, duration = schedule
+    SlotSupply.objects.add({(*slot_cell(start_time), duration): (opened, booked)})
+
+# 수업 신청/취소 시 TutorClass 전체를 save 하지 않고 tutor_class_id로 status 컬럼만 UPDATE 한다.
 @receiver(post_save, sender=StudentClass)
 def update_tutorclass_true(sender, instance, created, **kwargs):
     if created:
-        tutor_class = instance.tutor_class
-        tutor_class.status = True
-        tutor_class.save()
+        claimed = getattr(instance, "status_claimed", False)
+        if not claimed:
+            claimed = TutorClass.objects.filter(pk=instance.tutor_class_id, status=False).update(status=True)
+
+        schedule = booking_schedule(instance)
+        if claimed and schedule:
+            move_supply(schedule, -1, 1)
+        bump_booking_cache(instance, schedule)
+
+def booking_cancelled(instance, origin):
+    """수업 삭제(CASCADE)가 아니라 신청만 삭제된 경우 (신청 취소, student 탈퇴)"""
+    if isinstance(origin, models.QuerySet):
+        return origin.model is StudentClass
+    return isinstance(origin, StudentClass) or (isinstance(origin, User) and origin.pk == instance.student_id)
 
 @receiver(post_delete, sender=StudentClass)
-def update_tutorclass_flase(sender, instance, **kwargs):
-    tutor_class = instance.tutor_class
-    tutor_class.status = False
-    tutor_class.save()
+def update_tutorclass_flase(sender, instance, origin=None, **kwargs):
+    released = TutorClass.objects.filter(pk=instance.tutor_class_id, status=True).update(status=False)
+
+    schedule = booking_schedule(instance)
+    if released and schedule:
+        move_supply(schedule, 1, -1)
+    bump_booking_cache(instance, schedule)
+
+    # 취소된 수업은 같은 transaction 안에서 대기 순서대로 배정
+    if released and schedule and booking_cancelled(instance, origin):
+        WaitlistEntry.objects.assign(*schedule)
 
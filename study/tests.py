@@ -1,3 +1,1146 @@
-from django.test import TestCase
+from django.test import TestCase, SimpleTestCase, AsyncClient
+from asgiref.sync import sync_to_async
+from unittest import skipUnless, mock
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
+from django.core.cache import cache
+from django.core.management import call_command
+from django.apps import apps as django_apps
+
+from django.utils import timezone
+
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from pathlib import Path
+import importlib
+import io
+import json
+import tempfile
+
+from django.contrib.auth import get_user_model
+from rest_framework import serializers
+from rest_framework.test import APIClient
+
+from users.tokens import AccessToken
+
+from .models import TutorClass, StudentClass, TutorDayOccupancy, TutorClassTemplate, SlotSupply, WaitlistEntry
+from .serializers import (
+    TutorClassSerializer, StudentClassSerializer, TutorClassReadSerializer, StudentClassReadSerializer, format_datetime,
+)
+from . import exports
+from . import matching
+from . import cache as availability_cache
+from .timeutils import localize, local_minutes, format_local_minutes, format_slot_indexes
+from .benchmarks import seed, endpoint_cases, measure, QUERY_BUDGETS
+from .availability import (
+    SLOTS_PER_DAY, MAX_BOOKING_DAYS, day_origin, slot_time, occupancy_mask, free_start_indexes, is_free,
+)
+
+User = get_user_model()
 
 # Create your tests here.
+class StudyTestCase(TestCase):
+    """DB는 테스트마다 rollback 되지만 캐시는 남으므로 테스트마다 비운다."""
+
+    def setUp(self):
+        cache.clear()
+
+class AvailabilityEngineTest(SimpleTestCase):
+
+    def setUp(self):
+        self.origin = day_origin(date(2030, 1, 7))
+
+    def test_free_start_indexes_skip_occupied_slots(self):
+        # 13:00 60분 수업 => 12:30 60분, 13:00, 13:30 시작 불가
+        mask = occupancy_mask([(slot_time(26, self.origin), 60)], self.origin)
+
+        free_30 = free_start_indexes(mask, 30)
+        free_60 = free_start_indexes(mask, 60)
+
+        self.assertNotIn(26, free_30)
+        self.assertNotIn(27, free_30)
+        self.assertIn(28, free_30)
+        self.assertNotIn(25, free_60)
+        self.assertIn(24, free_60)
+        self.assertIn(28, free_60)
+
+    def test_free_start_indexes_respect_bounds(self):
+        self.assertEqual(free_start_indexes(0, 60, first=44, last=47), [44, 45])
+
+    def test_class_crossing_midnight(self):
+        # 전날 23:30 60분 수업은 당일 00:00 슬롯을 점유한다.
+        mask = occupancy_mask([(self.origin - timedelta(minutes=30), 60)], self.origin)
+
+        self.assertFalse(is_free(mask, self.origin, 30, self.origin))
+        self.assertTrue(is_free(mask, slot_time(1, self.origin), 30, self.origin))
+
+
+class TimeUtilsTest(SimpleTestCase):
+
+    def per_object(self, indexes, origin):
+        slots = {timezone.localtime(slot_time(i, origin)) for i in indexes}
+        return [slot.strftime("%Y-%m-%d %H:%M") for slot in sorted(slots)]
+
+    def test_batch_formatting_matches_per_object(self):
+        origin = day_origin(date(2025, 6, 7))
+        indexes = [47, 3, 0, 3, 20, 50, -1]
+        self.assertEqual(format_slot_indexes(indexes, origin), self.per_object(indexes, origin))
+
+    def test_localize_naive_as_time_zone(self):
+        value = localize(datetime(2025, 6, 7, 13, 0))
+        self.assertEqual(value.utcoffset(), timedelta(hours=9))
+        self.assertEqual(local_minutes(value), local_minutes(datetime(2025, 6, 7, 4, 0, tzinfo=dt_timezone.utc)))
+        self.assertEqual(format_local_minutes([local_minutes(value)]), ["2025-06-07 13:00"])
+
+
+class TutorDayOccupancyTest(StudyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tutor = User.objects.create_user("tutor@example.com", "test1234", role="tutor")
+        self.day = date(2030, 1, 7)
+        self.origin = day_origin(self.day)
+
+    def test_mask_follows_create_and_delete(self):
+        tutor_class = TutorClass.objects.create(
+            tutor=self.tutor, start_time=slot_time(26, self.origin), duration=60
+        )
+        self.assertEqual(TutorDayOccupancy.objects.masks(self.tutor.id, [self.day])[self.day], 0b11 << 26)
+
+        tutor_class.delete()
+        self.assertEqual(TutorDayOccupancy.objects.masks(self.tutor.id, [self.day])[self.day], 0)
+
+    def test_class_crossing_midnight_occupies_both_days(self):
+        TutorClass.objects.create(tutor=self.tutor, start_time=slot_time(47, self.origin), duration=60)
+        next_day = self.day + timedelta(days=1)
+
+        masks = TutorDayOccupancy.objects.masks(self.tutor.id, [self.day, next_day])
+
+        self.assertEqual(masks, {self.day: 1 << 47, next_day: 1})
+        self.assertTrue(TutorDayOccupancy.objects.conflicts(self.tutor.id, self.origin + timedelta(days=1), 30))
+
+
+class TutorClassBulkAPITest(StudyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tutor = User.objects.create_user("tutor@example.com", "test1234", role="tutor")
+        self.client = APIClient()
+        self.client.force_authenticate(self.tutor)
+
+    def test_bulk_slots_validated_against_existing_and_each_other(self):
+        self.client.post("/study/tutor/", {"start_time": "2030-01-07T13:00:00", "duration": 60}, format="json")
+
+        response = self.client.post("/study/tutor/bulk/", {"slots": [
+            {"start_time": "2030-01-07T13:30:00", "duration": 30},  # 기존 수업과 겹침
+            {"start_time": "2030-01-07T14:00:00", "duration": 60},
+            {"start_time": "2030-01-07T14:30:00", "duration": 30},  # 요청 내 수업과 겹침
+            {"start_time": "2030-01-07T15:10:00", "duration": 30},  # 30분 단위 아님
+        ]}, format="json")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([item["index"] for item in response.data["accepted"]], [1])
+        self.assertEqual([item["index"] for item in response.data["rejected"]], [0, 2, 3])
+        self.assertEqual(TutorClass.objects.filter(tutor=self.tutor).count(), 2)
+        self.assertTrue(TutorDayOccupancy.objects.conflicts(self.tutor.id, slot_time(29, day_origin(date(2030, 1, 7))), 30))
+
+    def test_bulk_query_count_independent_of_slot_count(self):
+        def create(start_date, end):
+            with CaptureQueriesContext(connection) as captured:
+                response = self.client.post("/study/tutor/bulk/", {"recurrence": {
+                    "start_date": start_date, "end_date": start_date, "weekdays": list(range(7)),
+                    "start": "00:00", "end": end, "duration": 30,
+                }}, format="json")
+            self.assertEqual(response.status_code, 201)
+            return len(response.data["accepted"]), len(captured)
+
+        few_slots, few_queries = create("2030-01-07", "02:00")
+        many_slots, many_queries = create("2030-01-08", "23:30")
+
+        self.assertEqual((few_slots, many_slots), (4, 47))
+        self.assertEqual(few_queries, many_queries)
+
+    def test_bulk_recurrence(self):
+        response = self.client.post("/study/tutor/bulk/", {"recurrence": {
+            "start_date": "2030-01-07", "end_date": "2030-01-13", "weekdays": [0, 2],
+            "start": "19:00", "end": "20:00", "duration": 30,
+        }}, format="json")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(response.data["accepted"]), 4)
+        self.assertEqual(TutorClass.objects.filter(tutor=self.tutor).count(), 4)
+
+
+class TutorClassTemplateTest(StudyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tutor = User.objects.create_user("tutor@example.com", "test1234", role="tutor")
+        self.student = User.objects.create_user("student@example.com", "test1234", role="student")
+        self.client = APIClient()
+        self.day = timezone.localdate() + timedelta(days=1)
+
+    def test_template_materialized_only_when_date_is_queried(self):
+        self.client.force_authenticate(self.tutor)
+        self.client.post("/study/tutor/", {"start_time": f"{self.day}T19:30:00", "duration": 30}, format="json")
+        response = self.client.post("/study/tutor/template/", {
+            "weekday": self.day.weekday(), "start_time": "19:00", "end_time": "21:00", "duration": 30,
+        }, format="json")
+        self.assertEqual(response.status_code, 201)
+        self.assertFalse(TutorClass.objects.filter(template__isnull=False).exists())
+
+        self.client.force_authenticate(self.student)
+        response = self.client.get("/study/available-time/", {"date": str(self.day), "duration": 30})
+
+        # 직접 생성한 19:30 수업과 겹치는 시간은 템플릿에서 제외
+        self.assertEqual(response.data["available_times"], [f"{self.day} {hm}" for hm in ("19:00", "19:30", "20:00", "20:30")])
+        self.assertEqual(TutorClass.objects.filter(template__isnull=False).count(), 3)
+
+        # 이미 생성된 날짜는 다시 생성하지 않는다.
+        self.client.get("/study/available-time/", {"date": str(self.day), "duration": 30})
+        self.assertEqual(TutorClass.objects.filter(tutor=self.tutor).count(), 4)
+
+    def test_only_queried_window_is_materialized(self):
+        template = TutorClassTemplate.objects.create(
+            tutor=self.tutor, weekday=self.day.weekday(), start_time=time(19), end_time=time(20), duration=30
+        )
+        later = self.day + timedelta(weeks=4)
+
+        self.client.force_authenticate(self.student)
+        self.client.get("/study/available-time/", {"date": str(later), "duration": 30})
+
+        # 조회한 날짜만 생성 (사이의 주는 생성하지 않는다.)
+        self.assertEqual({timezone.localtime(c.start_time).date() for c in template.classes.all()}, {later})
+
+        # 삭제한 수업은 다시 조회해도 생성하지 않고, 앞의 날짜는 조회할 때 생성
+        template.classes.first().delete()
+        cache.clear()
+        self.client.get("/study/available-time/", {"date": str(later), "duration": 30})
+        self.assertEqual(template.classes.count(), 1)
+        self.client.get("/study/available-time/", {"date": str(self.day), "duration": 30})
+        self.assertEqual(template.classes.count(), 3)
+
+    def test_dates_beyond_horizon_rejected(self):
+        TutorClassTemplate.objects.create(
+            tutor=self.tutor, weekday=self.day.weekday(), start_time=time(19), end_time=time(20), duration=30
+        )
+        far = timezone.localdate() + timedelta(days=MAX_BOOKING_DAYS + 1)
+        last = far - timedelta(days=1)
+
+        self.client.force_authenticate(self.student)
+        requests = [
+            ("/study/available-time/", {"date": str(far), "duration": 30}),
+            ("/study/available-time/range/", {"start_date": str(last), "end_date": str(far), "duration": 30}),
+            ("/study/available-class/", {"start_time": f"{far}T19:00:00", "duration": 30}),
+            ("/study/available-class/search/", {"from": str(last), "to": str(far + timedelta(days=1)), "duration": 30}),
+            ("/study/supply/", {"month": (far.replace(day=1) + timedelta(days=31)).strftime("%Y-%m"), "duration": 30}),
+        ]
+        for path, params in requests:
+            with self.subTest(path=path):
+                self.assertEqual(self.client.get(path, params).status_code, 400)
+        self.assertEqual(
+            self.client.post("/study/student/auto/", {"start_time": f"{far}T19:00:00", "duration": 30}, format="json").status_code, 400
+        )
+        self.assertFalse(TutorClass.objects.exists())
+
+        # 기간 끝까지는 조회 가능
+        self.assertEqual(self.client.get("/study/available-time/", {"date": str(last), "duration": 30}).status_code, 200)
+
+    def test_delete_template_removes_open_future_classes(self):
+        template = TutorClassTemplate.objects.create(
+            tutor=self.tutor, weekday=self.day.weekday(), start_time=time(19), end_time=time(20), duration=30
+        )
+        TutorClassTemplate.objects.materialize(self.day, self.day)
+        self.assertEqual(template.classes.count(), 2)
+
+        self.client.force_authenticate(self.tutor)
+        response = self.client.delete(f"/study/tutor/template/?template_id={template.id}")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(TutorClass.objects.exists())
+        self.assertEqual(TutorDayOccupancy.objects.masks(self.tutor.id, [self.day])[self.day], 0)
+
+
+class StudentClassBookingTest(StudyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        tutor = User.objects.create_user("tutor@example.com", "test1234", role="tutor")
+        self.students = [
+            User.objects.create_user(f"student{i}@example.com", "test1234", role="student") for i in range(2)
+        ]
+        self.tutor_class = TutorClass.objects.create(
+            tutor=tutor, start_time=day_origin(timezone.localdate() + timedelta(days=1)), duration=30
+        )
+        self.client = APIClient()
+
+    def book(self, student, class_id):
+        self.client.force_authenticate(student)
+        return self.client.post("/study/student/", {"class_id": class_id}, format="json")
+
+    def test_second_booking_conflicts(self):
+        self.assertEqual(self.book(self.students[0], self.tutor_class.id).status_code, 201)
+        self.assertEqual(self.book(self.students[1], self.tutor_class.id).status_code, 409)
+
+        self.tutor_class.refresh_from_db()
+        self.assertTrue(self.tutor_class.status)
+        self.assertEqual(StudentClass.objects.get().student, self.students[0])
+
+    def test_unknown_class(self):
+        self.assertEqual(self.book(self.students[0], self.tutor_class.id + 1).status_code, 404)
+
+    def test_book_claims_only_open_class(self):
+        self.assertIsNotNone(StudentClass.objects.book(self.students[0].id, self.tutor_class.id))
+        self.assertIsNone(StudentClass.objects.book(self.students[1].id, self.tutor_class.id))
+
+
+class ReverseTutorRanker:
+    """테스트용 ranker: tutor id가 큰 수업 먼저"""
+
+    def scores(self, candidates, start_time):
+        return [-candidate.tutor_id for candidate in candidates]
+
+
+class AutoBookTest(StudyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tutors = [User.objects.create_user(f"tutor{i}@example.com", "test1234", role="tutor") for i in range(3)]
+        self.students = [User.objects.create_user(f"student{i}@example.com", "test1234", role="student") for i in range(4)]
+        self.origin = day_origin(timezone.localdate() + timedelta(days=1))
+        self.start_time = slot_time(20, self.origin)
+        self.classes = {
+            tutor.id: TutorClass.objects.create(tutor=tutor, start_time=self.start_time, duration=30) for tutor in self.tutors
+        }
+        self.client = APIClient()
+
+    def auto_book(self, student, start_time=None, duration=30):
+        self.client.force_authenticate(student)
+        return self.client.post(
+            "/study/student/auto/",
+            {"start_time": (start_time or self.start_time).strftime("%Y-%m-%dT%H:%M:%S"), "duration": duration},
+            format="json",
+        )
+
+    def test_students_get_distinct_classes(self):
+        responses = [self.auto_book(student) for student in self.students]
+
+        self.assertEqual([response.status_code for response in responses], [201, 201, 201, 404])
+        self.assertEqual({response.data["tutor"] for response in responses[:3]}, {tutor.id for tutor in self.tutors})
+        self.assertEqual(StudentClass.objects.count(), 3)
+
+    def test_least_loaded_tutor_first(self):
+        # tutor0, tutor1은 같은 날 다른 수업이 이미 신청된 상태
+        for tutor in self.tutors[:2]:
+            busy = TutorClass.objects.create(tutor=tutor, start_time=slot_time(10, self.origin), duration=30)
+            StudentClass.objects.book(self.students[3].id, busy.id)
+
+        response = self.auto_book(self.students[0])
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["tutor"], self.tutors[2].id)
+
+    def test_ranker_from_settings_and_taken_candidate_skipped(self):
+        with self.settings(CLASS_MATCHING={"RANKERS": ["study.tests.ReverseTutorRanker"]}):
+            matching.open_candidates(self.start_time, 30)  # 신청 가능 목록 캐시
+
+            # 1순위 수업을 캐시 무효화 없이 선점 => 캐시에는 남아있지만 book()이 실패하고 다음 후보로 넘어간다.
+            TutorClass.objects.filter(id=self.classes[self.tutors[2].id].id).update(status=True)
+            response = self.auto_book(self.students[0])
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["tutor"], self.tutors[1].id)
+
+    def test_overlapping_booking_and_invalid_input(self):
+        other = TutorClass.objects.create(tutor=self.tutors[0], start_time=slot_time(19, self.origin), duration=60)
+        StudentClass.objects.book(self.students[0].id, other.id)
+
+        self.assertEqual(self.auto_book(self.students[0]).status_code, 409)
+        self.assertEqual(self.auto_book(self.students[1], duration=45).status_code, 400)
+        self.assertEqual(self.auto_book(self.students[1], start_time=slot_time(21, self.origin)).status_code, 404)
+        self.assertEqual(self.auto_book(self.tutors[0]).status_code, 403)
+
+
+class WaitlistTest(StudyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tutor = User.objects.create_user("tutor@example.com", "test1234", role="tutor")
+        self.students = [User.objects.create_user(f"student{i}@example.com", "test1234", role="student") for i in range(3)]
+        self.origin = day_origin(timezone.localdate() + timedelta(days=1))
+        self.start_time = slot_time(38, self.origin)
+        self.tutor_class = TutorClass.objects.create(tutor=self.tutor, start_time=self.start_time, duration=30)
+        self.booking = StudentClass.objects.book(self.students[0].id, self.tutor_class.id)
+        self.client = APIClient()
+
+    def join(self, student):
+        self.client.force_authenticate(student)
+        return self.client.post(
+            "/study/waitlist/",
+            {"start_time": self.start_time.strftime("%Y-%m-%dT%H:%M:%S"), "duration": 30},
+            format="json",
+        )
+
+    def entries(self, student):
+        self.client.force_authenticate(student)
+        return self.client.get("/study/waitlist/").data["data"]
+
+    def test_cancel_assigns_first_waiter(self):
+        self.assertEqual(self.join(self.students[1]).data["data"]["position"], 1)
+        self.assertEqual(self.join(self.students[2]).data["data"]["position"], 2)
+
+        self.client.force_authenticate(self.students[0])
+        self.client.delete(f"/study/student/?class_id={self.booking.id}")
+
+        first = self.entries(self.students[1])[0]
+        self.assertEqual((first["status"], first["position"], first["class_id"]), ("assigned", None, self.tutor_class.id))
+        self.assertEqual(StudentClass.objects.get().student, self.students[1])
+        self.assertEqual(self.entries(self.students[2])[0]["position"], 1)
+
+        # 같은 시간에 새 수업이 생기면 다음 대기자에게 배정
+        TutorClass.objects.bulk_open(
+            User.objects.create_user("tutor2@example.com", "test1234", role="tutor").id, [(self.start_time, 30)]
+        )
+        self.assertEqual(self.entries(self.students[2])[0]["status"], "assigned")
+
+    def test_tutor_create_assigns_in_same_transaction(self):
+        self.join(self.students[1])
+        tutor = User.objects.create_user("tutor2@example.com", "test1234", role="tutor")
+        self.client.force_authenticate(tutor)
+        data = {"start_time": self.start_time.strftime("%Y-%m-%dT%H:%M:%S"), "duration": 30}
+
+        # 배정이 실패하면 수업 생성도 rollback
+        with mock.patch.object(type(WaitlistEntry.objects), "assign_slots", side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                self.client.post("/study/tutor/", data, format="json")
+        self.assertFalse(TutorClass.objects.filter(tutor=tutor).exists())
+
+        self.assertEqual(self.client.post("/study/tutor/", data, format="json").status_code, 201)
+        self.assertEqual(self.entries(self.students[1])[0]["status"], "assigned")
+
+    def test_join_and_auto_book_share_validation(self):
+        self.client.force_authenticate(self.students[0])
+        past = (self.start_time - timedelta(days=2)).strftime("%Y-%m-%dT%H:%M:%S")
+        cases = [
+            ({"start_time": "tomorrow", "duration": 30}, 400),
+            ({"start_time": self.start_time.strftime("%Y-%m-%dT%H:%M:%S"), "duration": 45}, 400),
+            ({"start_time": past, "duration": 30}, 400),
+            ({"start_time": self.start_time.strftime("%Y-%m-%dT%H:%M:%S"), "duration": 30}, 409),  # 이미 신청한 수업과 겹침
+        ]
+        for data, status_code in cases:
+            waitlist = self.client.post("/study/waitlist/", data, format="json")
+            auto = self.client.post("/study/student/auto/", data, format="json")
+            self.assertEqual((waitlist.status_code, auto.status_code), (status_code, status_code))
+            self.assertEqual(waitlist.data, auto.data)
+
+    def test_join_with_open_class_books_immediately(self):
+        self.booking.delete()
+
+        response = self.join(self.students[1])
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["data"]["status"], "assigned")
+        self.assertEqual(self.join(self.students[1]).status_code, 409)  # 이미 신청한 수업과 겹침
+
+    def test_deleted_class_not_assigned(self):
+        self.join(self.students[1])
+
+        self.tutor_class.delete()
+
+        self.assertEqual(self.entries(self.students[1])[0]["status"], "waiting")
+        self.assertFalse(StudentClass.objects.exists())
+
+    def test_duplicate_join_and_cancel(self):
+        entry_id = self.join(self.students[1]).data["data"]["id"]
+        self.assertEqual(self.join(self.students[1]).status_code, 409)
+
+        version = self.client.get("/study/waitlist/").data["version"]
+        self.assertEqual(self.client.delete(f"/study/waitlist/?id={entry_id}").status_code, 200)
+        self.assertEqual(self.client.delete(f"/study/waitlist/?id={entry_id}").status_code, 404)
+
+        data = self.client.get("/study/waitlist/").data
+        self.assertEqual(data["data"][0]["status"], "cancelled")
+        self.assertNotEqual(data["version"], version)
+
+    def test_status_poll_is_single_query(self):
+        self.join(self.students[1])
+        self.join(self.students[2])
+
+        self.client.force_authenticate(self.students[2])
+        with self.assertNumQueries(1):
+            self.client.get("/study/waitlist/")
+
+
+class TutorClassStatusSyncTest(StudyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        tutor = User.objects.create_user("tutor@example.com", "test1234", role="tutor")
+        self.student = User.objects.create_user("student@example.com", "test1234", role="student")
+        origin = day_origin(timezone.localdate() + timedelta(days=1))
+        self.classes = [
+            TutorClass.objects.create(tutor=tutor, start_time=slot_time(i, origin), duration=30) for i in range(3)
+        ]
+
+    def test_booking_updates_status_without_full_save(self):
+        # SAVEPOINT, 조건부 UPDATE, INSERT, 캐시 무효화용 수업 시간 조회, 슬롯 현황 UPDATE, RELEASE
+        with self.assertNumQueries(6):
+            StudentClass.objects.book(self.student.id, self.classes[0].id)
+
+        self.classes[0].refresh_from_db()
+        self.assertTrue(self.classes[0].status)
+
+    def test_bulk_delete_resets_status(self):
+        for tutor_class in self.classes:
+            StudentClass.objects.create(student=self.student, tutor_class=tutor_class)
+        self.assertEqual(TutorClass.objects.filter(status=True).count(), 3)
+
+        StudentClass.objects.filter(student=self.student).delete()
+        self.assertFalse(TutorClass.objects.filter(status=True).exists())
+
+        # student 삭제로 인한 cascade 삭제
+        StudentClass.objects.create(student=self.student, tutor_class=self.classes[0])
+        self.student.delete()
+        self.assertFalse(TutorClass.objects.filter(status=True).exists())
+
+    def test_sync_status_repairs_drift(self):
+        StudentClass.objects.create(student=self.student, tutor_class=self.classes[0])
+        TutorClass.objects.update(status=True)
+
+        TutorClass.objects.sync_status()
+
+        self.assertEqual(list(TutorClass.objects.filter(status=True)), [self.classes[0]])
+
+    def test_sync_command_invalidates_changed_dates_only(self):
+        day = timezone.localtime(self.classes[0].start_time).date()
+        other_day = day + timedelta(days=1)
+        cache.set("unrelated", 1)
+        self.assertEqual(len(availability_cache.open_classes(day, 30)), 3)
+        other_version = availability_cache.versions(availability_cache.date_scope(other_day))
+
+        StudentClass.objects.bulk_create([StudentClass(student=self.student, tutor_class=self.classes[0])])  # signal 없이 신청
+        call_command("sync_class_status", stdout=io.StringIO())
+
+        self.assertEqual(len(availability_cache.open_classes(day, 30)), 2)
+        self.assertEqual(SlotSupply.objects.get(date=day, slot=0, duration=30).booked_count, 1)
+        # 다른 날짜 / 다른 key는 그대로
+        self.assertEqual(availability_cache.versions(availability_cache.date_scope(other_day)), other_version)
+        self.assertEqual(cache.get("unrelated"), 1)
+
+
+class StudentAvailableTimeTest(StudyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tutor = User.objects.create_user("tutor@example.com", "test1234", role="tutor")
+        self.student = User.objects.create_user("student@example.com", "test1234", role="student")
+        self.day = timezone.localdate() + timedelta(days=2)
+        self.origin = day_origin(self.day)
+        self.client = APIClient()
+        self.client.force_authenticate(self.student)
+
+        for i in range(4):
+            TutorClass.objects.create(tutor=self.tutor, start_time=slot_time(20 + i, self.origin), duration=30)
+
+    def test_out_of_range_dates(self):
+        # 날짜 계산(하루 뒤, TIME_ZONE 변환)이 datetime 범위를 넘는 입력도 400
+        headers = {"Authorization": f"Bearer {AccessToken.for_user(self.student)}"}
+        requests = [
+            ("/study/available-time/", {"date": "9999-12-31", "duration": 30}),
+            ("/study/async/available-time/", {"date": "9999-12-31", "duration": 30}),
+            ("/study/available-time/range/", {"start_date": "9999-12-01", "end_date": "9999-12-31", "duration": 30}),
+            ("/study/available-class/", {"start_time": "9999-12-31T23:30:00", "duration": 30}),
+            ("/study/async/available-class/", {"start_time": "9999-12-31T23:30:00-12:00", "duration": 30}),
+            ("/study/available-class/search/", {"from": "9999-12-30", "to": "9999-12-31T23:00:00-05:00", "duration": 30}),
+            ("/study/available-class/search/", {"from": "0001-01-01", "to": "0001-01-02", "duration": 30}),
+            ("/study/supply/", {"month": "9999-12", "duration": 30}),
+        ]
+        for path, params in requests:
+            with self.subTest(path=path, params=params):
+                self.assertEqual(self.client.get(path, params, headers=headers).status_code, 400)
+
+        response = self.client.post("/study/student/auto/", {"start_time": "9999-12-31T23:00:00-05:00", "duration": 30}, format="json")
+        self.assertEqual(response.status_code, 400)
+
+    def book_history(self, count, days_ago_from):
+        # 조회 날짜와 상관없는 과거 신청 내역
+        tutor_classes = TutorClass.objects.bulk_open(self.tutor.id, [
+            (slot_time(0, day_origin(self.day - timedelta(days=days_ago_from + i))), 30) for i in range(count)
+        ])
+        for tutor_class in tutor_classes:
+            StudentClass.objects.create(student=self.student, tutor_class=tutor_class)
+
+    def query_count(self):
+        cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/study/available-time/", {"date": str(self.day), "duration": 30})
+        self.assertEqual(response.status_code, 200)
+        return len(queries), response.data["available_times"]
+
+    def test_query_count_independent_of_booking_history(self):
+        self.book_history(1, days_ago_from=1)
+        small_count, small_times = self.query_count()
+
+        self.book_history(30, days_ago_from=10)
+        large_count, large_times = self.query_count()
+
+        self.assertEqual(small_count, large_count)
+        self.assertEqual(small_times, large_times)
+        self.assertEqual(len(large_times), 4)
+
+    def test_booking_on_same_day_blocks_overlapping_classes(self):
+        other_tutor = User.objects.create_user("tutor2@example.com", "test1234", role="tutor")
+        booked = TutorClass.objects.create(tutor=other_tutor, start_time=slot_time(20, self.origin), duration=60)
+        StudentClass.objects.create(student=self.student, tutor_class=booked)
+
+        _, times = self.query_count()
+
+        self.assertEqual(times, [f"{self.day} 11:00", f"{self.day} 11:30"])
+
+
+class AvailableTimeRangeTest(StudyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tutor = User.objects.create_user("tutor@example.com", "test1234", role="tutor")
+        self.student = User.objects.create_user("student@example.com", "test1234", role="student")
+        self.day = timezone.localdate() + timedelta(days=2)
+        self.client = APIClient()
+
+        for i in range(3):
+            origin = day_origin(self.day + timedelta(days=i))
+            TutorClass.objects.create(tutor=self.tutor, start_time=slot_time(20, origin), duration=30)
+
+    def get_range(self, user, days, **params):
+        self.client.force_authenticate(user)
+        response = self.client.get("/study/available-time/range/", {
+            "start_date": str(self.day),
+            "end_date": str(self.day + timedelta(days=days - 1)),
+            "duration": 30,
+            **params,
+        })
+        if response.status_code != 200:
+            return response.status_code, None
+        return response.status_code, json.loads(b"".join(response.streaming_content))["available_times"]
+
+    def test_student_range_matches_single_day_queries(self):
+        booked = TutorClass.objects.create(
+            tutor=User.objects.create_user("tutor2@example.com", "test1234", role="tutor"),
+            start_time=slot_time(20, day_origin(self.day + timedelta(days=1))),
+            duration=60,
+        )
+        StudentClass.objects.create(student=self.student, tutor_class=booked)
+
+        _, times = self.get_range(self.student, 3)
+
+        self.assertEqual(list(times), [str(self.day + timedelta(days=i)) for i in range(3)])
+        for date, day_times in times.items():
+            single = self.client.get("/study/available-time/", {"date": date, "duration": 30})
+            self.assertEqual(day_times, single.data["available_times"])
+        self.assertEqual(times[str(self.day + timedelta(days=1))], [])
+
+    def test_tutor_range_query_count_independent_of_days(self):
+        with CaptureQueriesContext(connection) as short:
+            self.get_range(self.tutor, 2)
+        with CaptureQueriesContext(connection) as long:
+            _, times = self.get_range(self.tutor, 14)
+
+        self.assertEqual(len(short), len(long))
+        self.assertEqual(len(times), 14)
+        self.assertNotIn(f"{self.day} 10:00", times[str(self.day)])
+        self.assertEqual(len(times[str(self.day + timedelta(days=5))]), SLOTS_PER_DAY - 1)
+
+    def test_range_limit(self):
+        status_code, _ = self.get_range(self.student, 32)
+        self.assertEqual(status_code, 400)
+
+    def test_early_morning_uses_local_date(self):
+        # 05:10 KST = 전날 20:10 UTC
+        today = date(2030, 1, 7)
+        now = (day_origin(today) + timedelta(hours=5, minutes=10)).astimezone(dt_timezone.utc)  # timezone.now()처럼 UTC
+        headers = {"Authorization": f"Bearer {AccessToken.for_user(self.tutor)}"}
+        self.client.force_authenticate(self.tutor)
+
+        with mock.patch("django.utils.timezone.now", return_value=now):
+            for path in ("/study/available-time/", "/study/async/available-time/"):
+                with self.subTest(path=path):
+                    response = self.client.get(path, {"date": str(today), "duration": 30}, headers=headers)
+                    self.assertEqual(response.json()["available_times"][0], f"{today} 05:30")
+
+                    response = self.client.get(path, {"date": str(today - timedelta(days=1)), "duration": 30}, headers=headers)
+                    self.assertEqual(response.status_code, 400)
+
+            response = self.client.get("/study/available-time/range/", {
+                "start_date": str(today - timedelta(days=1)), "end_date": str(today), "duration": 30,
+            })
+            self.assertEqual(response.status_code, 400)
+
+
+class AvailableClassSearchTest(StudyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tutor = User.objects.create_user("tutor@example.com", "test1234", role="tutor")
+        self.tutor2 = User.objects.create_user("tutor2@example.com", "test1234", role="tutor")
+        self.student = User.objects.create_user("student@example.com", "test1234", role="student")
+        self.day = timezone.localdate() + timedelta(days=2)
+        self.client = APIClient()
+        self.client.force_authenticate(self.student)
+
+        # 날짜마다 18:30, 19:00, 22:30, 23:00 수업
+        self.classes = {}
+        for i in range(2):
+            origin = day_origin(self.day + timedelta(days=i))
+            for index in (37, 38, 45, 46):
+                tutor = self.tutor2 if index == 45 else self.tutor
+                self.classes[i, index] = TutorClass.objects.create(tutor=tutor, start_time=slot_time(index, origin), duration=30)
+
+    def search(self, **params):
+        response = self.client.get("/study/available-class/search/", {
+            "duration": 30,
+            "from": str(self.day),
+            "to": str(self.day + timedelta(days=2)),
+            **params,
+        })
+        return response.status_code, response.data
+
+    def ids(self, *keys):
+        return [self.classes[key].id for key in keys]
+
+    def test_daily_time_window(self):
+        StudentClass.objects.create(student=self.student, tutor_class=self.classes[1, 38])
+
+        status_code, data = self.search(time_from="19:00", time_to="23:00")
+
+        self.assertEqual(status_code, 200)
+        self.assertEqual([row["id"] for row in data["available_classes"]], self.ids((0, 38), (0, 45), (1, 45)))
+        self.assertEqual(data["available_classes"][0]["start_time"], f"{self.day}T19:00:00+09:00")
+        self.assertIsNone(data["next_cursor"])
+
+    def test_cancel_reopens_class(self):
+        booking = StudentClass.objects.create(student=self.student, tutor_class=self.classes[0, 37])
+        _, data = self.search(to=str(self.day + timedelta(days=1)))
+        self.assertEqual([row["id"] for row in data["available_classes"]], self.ids((0, 38), (0, 45), (0, 46)))
+
+        booking.delete()
+        _, data = self.search(to=str(self.day + timedelta(days=1)))
+        self.assertEqual([row["id"] for row in data["available_classes"]], self.ids((0, 37), (0, 38), (0, 45), (0, 46)))
+
+    def test_tutor_filter_and_cursor(self):
+        _, data = self.search(tutor_id=self.tutor2.id)
+        self.assertEqual([row["id"] for row in data["available_classes"]], self.ids((0, 45), (1, 45)))
+
+        ids = []
+        params = {"limit": 3, "time_from": "22:00"}
+        while True:
+            _, data = self.search(**params)
+            ids += [row["id"] for row in data["available_classes"]]
+            if not data["next_cursor"]:
+                break
+            params["cursor"] = data["next_cursor"]
+        self.assertEqual(ids, self.ids((0, 45), (0, 46), (1, 45), (1, 46)))
+
+    def test_invalid_params(self):
+        self.assertEqual(self.search(to="")[0], 400)
+        self.assertEqual(self.search(to=str(self.day + timedelta(days=40)))[0], 400)
+        self.assertEqual(self.search(time_from="7pm")[0], 400)
+        self.assertEqual(self.search(time_from="19:00", time_to="19:15")[0], 400)
+
+        self.client.force_authenticate(self.tutor)
+        self.assertEqual(self.search()[0], 403)
+
+
+class SlotSupplyTest(StudyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tutor = User.objects.create_user("tutor@example.com", "test1234", role="tutor")
+        self.student = User.objects.create_user("student@example.com", "test1234", role="student")
+        self.day = timezone.localdate() + timedelta(days=2)
+        self.origin = day_origin(self.day)
+
+    def supply(self):
+        return {
+            (row.date, row.slot, row.duration): (row.open_count, row.booked_count)
+            for row in SlotSupply.objects.all()
+            if row.open_count or row.booked_count
+        }
+
+    def assertMatchesRebuild(self):
+        incremental = self.supply()
+        SlotSupply.objects.rebuild()
+        self.assertEqual(incremental, self.supply())
+
+    def test_counts_follow_class_and_booking_writes(self):
+        tutor2 = User.objects.create_user("tutor2@example.com", "test1234", role="tutor")
+        tutor_class = TutorClass.objects.create(tutor=self.tutor, start_time=slot_time(20, self.origin), duration=30)
+        TutorClass.objects.create(tutor=tutor2, start_time=slot_time(20, self.origin), duration=30)
+        TutorClass.objects.bulk_open(tutor2.id, [(slot_time(22, self.origin), 60), (slot_time(24, self.origin), 60)])
+        self.assertEqual(self.supply()[self.day, 20, 30], (2, 0))
+
+        StudentClass.objects.book(self.student.id, tutor_class.id)
+        self.assertEqual(self.supply()[self.day, 20, 30], (1, 1))
+        self.assertMatchesRebuild()
+
+        StudentClass.objects.get().delete()
+        self.assertEqual(self.supply()[self.day, 20, 30], (2, 0))
+
+        StudentClass.objects.create(student=self.student, tutor_class=tutor_class)
+        tutor_class.delete()  # 신청 row도 함께 삭제 (CASCADE)
+        self.assertEqual(self.supply()[self.day, 20, 30], (1, 0))
+        self.assertMatchesRebuild()
+
+    def test_month_heatmap(self):
+        classes = TutorClass.objects.bulk_open(
+            self.tutor.id, [(slot_time(20, self.origin), 30), (slot_time(21, self.origin), 30)]
+        )
+        StudentClass.objects.book(self.student.id, classes[1].id)
+
+        self.client = APIClient()
+        self.client.force_authenticate(self.student)
+        response = self.client.get("/study/supply/", {"month": self.day.strftime("%Y-%m"), "duration": 30})
+
+        self.assertEqual(response.status_code, 200)
+        days = response.data["days"]
+        self.assertEqual(list(days)[0], str(self.day.replace(day=1)))
+        self.assertEqual(days[str(self.day)]["open"][20:22], [1, 0])
+        self.assertEqual(days[str(self.day)]["booked"][20:22], [0, 1])
+        self.assertEqual(self.client.get("/study/supply/", {"month": "2025-13", "duration": 30}).status_code, 400)
+
+    def test_rebuild_command(self):
+        TutorClass.objects.create(tutor=self.tutor, start_time=slot_time(20, self.origin), duration=30)
+        expected = self.supply()
+        SlotSupply.objects.update(open_count=5)
+
+        call_command("rebuild_slot_supply", "--from", str(self.day), stdout=io.StringIO())
+
+        self.assertEqual(self.supply(), expected)
+
+    def test_migration_backfills_existing_classes(self):
+        classes = TutorClass.objects.bulk_open(
+            self.tutor.id, [(slot_time(20, self.origin), 30), (slot_time(47, self.origin), 60)]
+        )
+        StudentClass.objects.book(self.student.id, classes[1].id)
+        expected = self.supply()
+        SlotSupply.objects.all().delete()  # SlotSupply 도입 전에 만들어진 수업
+
+        migration = importlib.import_module("study.migrations.0010_backfill_slot_supply")
+        migration.backfill_slot_supply(django_apps, None)
+        self.assertEqual(self.supply(), expected)
+
+        # backfill 이후의 신청/취소는 0이 아닌 기존 row를 갱신한다.
+        StudentClass.objects.book(self.student.id, classes[0].id)
+        self.assertEqual(self.supply()[self.day, 20, 30], (0, 1))
+        self.assertMatchesRebuild()
+
+
+class ClassListPaginationTest(StudyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tutor = User.objects.create_user("tutor@example.com", "test1234", role="tutor")
+        self.student = User.objects.create_user("student@example.com", "test1234", role="student")
+        self.day = timezone.localdate() + timedelta(days=1)
+        self.client = APIClient()
+
+        self.classes = TutorClass.objects.bulk_open(self.tutor.id, [
+            (slot_time(i * 2, day_origin(self.day + timedelta(days=i // 10))), 30) for i in range(25)
+        ])
+        for tutor_class in self.classes[:12]:
+            StudentClass.objects.create(student=self.student, tutor_class=tutor_class)
+
+    def pages(self, path, user, **params):
+        self.client.force_authenticate(user)
+        ids, cursor, queries = [], None, set()
+        while True:
+            with CaptureQueriesContext(connection) as captured:
+                response = self.client.get(path, {**params, **({"cursor": cursor} if cursor else {})})
+            self.assertEqual(response.status_code, 200)
+            queries.add(len(captured))
+            ids.append([row["id"] for row in response.data["data"]])
+            cursor = response.data["next_cursor"]
+            if cursor is None:
+                return ids, queries
+
+    def test_tutor_pages_follow_start_time(self):
+        pages, queries = self.pages("/study/tutor/", self.tutor, limit=10)
+
+        self.assertEqual([len(page) for page in pages], [10, 10, 5])
+        self.assertEqual(sum(pages, []), [tutor_class.id for tutor_class in self.classes])
+        self.assertEqual(len(queries), 1)
+
+    def test_student_pages_and_window(self):
+        pages, _ = self.pages("/study/student/", self.student, limit=5)
+        self.assertEqual([len(page) for page in pages], [5, 5, 2])
+
+        window, _ = self.pages(
+            "/study/student/", self.student,
+            **{"from": str(self.day + timedelta(days=1)), "to": str(self.day + timedelta(days=2))},
+        )
+        self.assertEqual(len(window[0]), 2)
+
+    def test_upcoming_only_and_invalid_cursor(self):
+        TutorClass.objects.filter(id=self.classes[0].id).update(start_time=timezone.now() - timedelta(days=1))
+        pages, _ = self.pages("/study/tutor/", self.tutor, upcoming_only="true")
+        self.assertEqual(len(pages[0]), 24)
+
+        self.client.force_authenticate(self.tutor)
+        response = self.client.get("/study/tutor/", {"cursor": "invalid"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_invalid_calendar_dates(self):
+        # 형식은 맞지만 없는 날짜
+        requests = [
+            (self.tutor, "/study/tutor/", {"from": "2025-02-30"}),
+            (self.student, "/study/student/", {"to": "2025-13-01T10:00"}),
+            (self.student, "/study/available-class/search/", {"from": "2025-02-30", "to": str(self.day), "duration": 30}),
+            (self.tutor, "/study/export/", {"from": "2025-02-30"}),
+        ]
+        for user, path, params in requests:
+            with self.subTest(path=path):
+                self.client.force_authenticate(user)
+                self.assertEqual(self.client.get(path, params).status_code, 400)
+
+
+class ClassExportTest(StudyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tutor = User.objects.create_user("tutor@example.com", "test1234", role="tutor")
+        self.other_tutor = User.objects.create_user("tutor2@example.com", "test1234", role="tutor")
+        self.student = User.objects.create_user("student@example.com", "test1234", role="student")
+        self.admin = User.objects.create_superuser("admin@example.com", "test1234")
+        self.origin = day_origin(timezone.localdate() + timedelta(days=1))
+        self.client = APIClient()
+
+        classes = TutorClass.objects.bulk_open(self.tutor.id, [(slot_time(i * 2, self.origin), 30) for i in range(5)])
+        TutorClass.objects.bulk_open(self.other_tutor.id, [(slot_time(1, self.origin), 60)])
+        self.booking = StudentClass.objects.create(student=self.student, tutor_class=classes[0])
+
+    def export(self, user, **params):
+        self.client.force_authenticate(user)
+        response = self.client.get("/study/export/", params)
+        self.assertEqual(response.status_code, 200)
+        return b"".join(response.streaming_content).decode()
+
+    def test_tutor_ndjson_contains_only_own_classes_with_booking(self):
+        rows = [json.loads(line) for line in self.export(self.tutor).splitlines()]
+
+        self.assertEqual(len(rows), 5)
+        self.assertEqual({row["tutor_id"] for row in rows}, {self.tutor.id})
+        self.assertEqual(rows[0]["student_id"], self.student.id)
+        self.assertEqual(rows[0]["start_time"], timezone.localtime(slot_time(0, self.origin)).isoformat())
+        self.assertIsNone(rows[1]["student_id"])
+
+    def test_admin_csv_exports_all_tutors(self):
+        lines = self.export(self.admin, export_format="csv").splitlines()
+
+        self.assertEqual(lines[0].split(","), [name for name, _ in exports.COLUMNS])
+        self.assertEqual(len(lines), 1 + 6)
+
+    def test_student_cannot_export(self):
+        self.client.force_authenticate(self.student)
+        self.assertEqual(self.client.get("/study/export/").status_code, 403)
+
+    def test_command_writes_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "classes.ndjson"
+            call_command("export_classes", output=str(path), tutor=self.other_tutor.id, stdout=io.StringIO())
+            rows = [json.loads(line) for line in path.read_text().splitlines()]
+
+        self.assertEqual([row["duration"] for row in rows], [60])
+
+
+class ReadSerializerParityTest(StudyTestCase):
+    """목록 조회용 values() serializer 출력이 ModelSerializer 출력과 같은지 확인"""
+
+    def setUp(self):
+        super().setUp()
+        tutor = User.objects.create_user("tutor@example.com", "test1234", role="tutor")
+        student = User.objects.create_user("student@example.com", "test1234", role="student")
+        origin = day_origin(timezone.localdate() + timedelta(days=1))
+
+        classes = TutorClass.objects.bulk_open(tutor.id, [(slot_time(i, origin), 30) for i in range(0, 48, 3)])
+        for tutor_class in classes[::2]:
+            StudentClass.objects.create(student=student, tutor_class=tutor_class)
+
+    def test_tutor_class_parity(self):
+        queryset = TutorClass.objects.order_by("start_time", "id")
+        self.assertEqual(
+            TutorClassReadSerializer(TutorClassReadSerializer.values(queryset)).data,
+            TutorClassSerializer(queryset, many=True).data,
+        )
+
+    def test_student_class_parity(self):
+        queryset = StudentClass.objects.order_by("id")
+        self.assertEqual(
+            StudentClassReadSerializer(StudentClassReadSerializer.values(queryset)).data,
+            [dict(row) for row in StudentClassSerializer(queryset, many=True).data],
+        )
+
+    def test_utc_formatting_matches(self):
+        value = timezone.now()
+        with timezone.override("UTC"):
+            self.assertEqual(format_datetime(value), serializers.DateTimeField().to_representation(value))
+
+
+class AsyncEndpointTest(StudyTestCase):
+    """async API 응답이 sync API 응답과 같은지 확인"""
+
+    def setUp(self):
+        super().setUp()
+        self.tutor = User.objects.create_user("tutor@example.com", "test1234", role="tutor")
+        self.student = User.objects.create_user("student@example.com", "test1234", role="student")
+        self.day = timezone.localdate() + timedelta(days=1)
+        origin = day_origin(self.day)
+
+        classes = TutorClass.objects.bulk_open(self.tutor.id, [(slot_time(i, origin), 30) for i in range(20, 30, 2)])
+        StudentClass.objects.create(student=self.student, tutor_class=classes[0])
+
+    def headers(self, user):
+        return {"Authorization": f"Bearer {AccessToken.for_user(user)}"}
+
+    async def compare(self, path, user, params):
+        sync_response = await sync_to_async(self.client.get)(f"/study/{path}", params, headers=self.headers(user))
+        async_response = await AsyncClient().get(f"/study/async/{path}", params, headers=self.headers(user))
+
+        self.assertEqual(async_response.status_code, sync_response.status_code)
+        self.assertEqual(async_response.json(), sync_response.json())
+        return async_response.json()
+
+    async def test_list_endpoints_match_sync(self):
+        data = await self.compare("tutor/", self.tutor, {"limit": 3})
+        self.assertEqual(len(data["data"]), 3)
+        await self.compare("student/", self.student, {})
+
+    async def test_available_endpoints_match_sync(self):
+        await self.compare("available-time/", self.tutor, {"date": str(self.day), "duration": 60})
+        data = await self.compare("available-time/", self.student, {"date": str(self.day), "duration": 30})
+        self.assertEqual(len(data["available_times"]), 4)
+        await self.compare("available-class/", self.student, {"start_time": f"{self.day}T11:00:00", "duration": 30})
+        await self.compare("available-time/", self.student, {"date": "2020-01-01", "duration": 30})
+        far = timezone.localdate() + timedelta(days=MAX_BOOKING_DAYS + 1)
+        await self.compare("available-time/", self.tutor, {"date": str(far), "duration": 30})
+        for params in ({}, {"date": "2030-02-30", "duration": 30}, {"date": str(self.day), "duration": 45}):
+            await self.compare("available-time/", self.student, params)
+        for params in ({"duration": 30}, {"start_time": "tomorrow", "duration": 30}, {"start_time": f"{self.day}T11:00:00", "duration": "x"}):
+            await self.compare("available-class/", self.student, params)
+        await self.compare("available-class/", self.student, {"start_time": f"{far}T11:00:00", "duration": 30})
+
+        # 다른 offset의 시간도 TIME_ZONE 날짜/슬롯으로 조회 (11:00 KST = 02:00 UTC)
+        data = await self.compare("available-class/", self.student, {"start_time": f"{self.day}T02:00:00+00:00", "duration": 30})
+        self.assertEqual(len(data["available_classes"]), 1)
+
+    async def test_waitlist_long_poll(self):
+        data = await self.compare("waitlist/", self.student, {})
+
+        # 이전 version이면 바로 응답, 현재 version이면 변경이 없을 때 wait초 뒤 같은 version으로 응답
+        client = AsyncClient()
+        response = await client.get("/study/async/waitlist/", {"version": "old"}, headers=self.headers(self.student))
+        self.assertEqual(response.json()["version"], data["version"])
+
+        response = await client.get(
+            "/study/async/waitlist/", {"version": data["version"], "wait": 0.1}, headers=self.headers(self.student)
+        )
+        self.assertEqual(response.json(), data)
+
+    async def test_requires_token_and_role(self):
+        response = await AsyncClient().get("/study/async/tutor/")
+        self.assertEqual(response.status_code, 401)
+
+        response = await AsyncClient().get("/study/async/tutor/", headers=self.headers(self.student))
+        self.assertEqual(response.status_code, 403)
+
+
+class StudyEndpointQueryBudgetTest(StudyTestCase):
+    """데이터가 늘어나도 endpoint별 query 수가 상한을 넘지 않는지 확인 (N+1 회귀 방지)"""
+
+    ENDPOINTS = (
+        "tutor_list", "student_list", "available_time_tutor", "available_time_student", "available_class", "class_search",
+        "slot_supply", "waitlist",
+    )
+
+    @classmethod
+    def setUpTestData(cls):
+        seed(tutors=20, students=10, classes_per_tutor=40, days=5)
+
+    def test_query_budgets(self):
+        cases = endpoint_cases()
+
+        for name in self.ENDPOINTS:
+            with self.subTest(endpoint=name):
+                result = measure(*cases[name], iterations=2)
+
+                self.assertEqual(result["status_code"], 200)
+                self.assertLessEqual(result["queries"], QUERY_BUDGETS[name])
+
+
+@skipUnless(connection.vendor == "sqlite", "EXPLAIN QUERY PLAN 형식은 SQLite 기준")
+class ClassQueryPlanTest(StudyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.origin = day_origin(date(2030, 1, 7))
+
+    def assertUsesIndex(self, queryset, index_name):
+        plan = queryset.explain()
+        self.assertIn(index_name, plan, plan)
+
+    def test_day_range_uses_open_class_index(self):
+        classes = TutorClass.objects.filter(
+            start_time__gte=self.origin,
+            start_time__lt=self.origin + timedelta(days=1),
+            status=False,
+            duration=30,
+        )
+        self.assertUsesIndex(classes, "study_open_class_idx")
+
+    def test_exact_start_time_uses_open_class_index(self):
+        classes = TutorClass.objects.filter(start_time=self.origin, duration=30, status=False)
+        self.assertUsesIndex(classes, "study_open_class_idx")
+
+    def test_student_bookings_use_covering_index(self):
+        bookings = StudentClass.objects.filter(
+            student_id=1,
+            tutor_class__start_time__gt=self.origin,
+            tutor_class__start_time__lt=self.origin + timedelta(days=1),
+        ).values_list("tutor_class__start_time", "tutor_class__duration")
+        self.assertUsesIndex(bookings, "study_student_class_idx")
+
+    def test_tutor_range_uses_unique_index(self):
+        classes = TutorClass.objects.filter(tutor_id=1, start_time__gte=self.origin, start_time__lt=self.origin + timedelta(days=7))
+        self.assertIn("tutor_id=? AND start_time>? AND start_time<?", classes.explain())
+
+
+class AvailabilityCacheTest(StudyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tutor = User.objects.create_user("tutor@example.com", "test1234", role="tutor")
+        self.student = User.objects.create_user("student@example.com", "test1234", role="student")
+        self.day = timezone.localdate() + timedelta(days=2)
+        self.origin = day_origin(self.day)
+        self.tutor_class = TutorClass.objects.create(tutor=self.tutor, start_time=slot_time(20, self.origin), duration=30)
+        self.client = APIClient()
+        self.client.force_authenticate(self.student)
+
+    def available_times(self):
+        response = self.client.get("/study/available-time/", {"date": str(self.day), "duration": 30})
+        return response.data["available_times"]
+
+    def test_cache_hit_needs_no_database_access(self):
+        self.available_times()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.available_times(), [f"{self.day} 10:00"])
+
+    def test_writes_invalidate_cached_day(self):
+        self.available_times()
+
+        TutorClass.objects.create(tutor=self.tutor, start_time=slot_time(22, self.origin), duration=30)
+        self.assertEqual(self.available_times(), [f"{self.day} 10:00", f"{self.day} 11:00"])
+
+        StudentClass.objects.book(self.student.id, self.tutor_class.id)
+        self.assertEqual(self.available_times(), [f"{self.day} 11:00"])
+
+        StudentClass.objects.get().delete()
+        self.assertEqual(self.available_times(), [f"{self.day} 10:00", f"{self.day} 11:00"])
@@ -0,0 +1,66 @@
+# study/timeutils.py
+
+"""
+TIME_ZONE 변환 / 시간 문자열 변환 공통 함수
+
+tz 객체(zoneinfo)는 한 번만 만들어 재사용하고,
+슬롯 목록은 datetime 대신 TIME_ZONE 기준 epoch 분(1970-01-01 00:00 현지 시각 이후 분, 정수)으로 다룬다.
+availability.py의 slot 계산과 같이 현지 시각 기준으로 세므로 변환/정렬/문자열 변환이 모두 정수 연산이다.
+"""
+
+from datetime import date, timedelta
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+
+from .availability import SLOT_MINUTES
+
+EPOCH_DATE = date(1970, 1, 1)
+MINUTES_PER_DAY = 24 * 60
+
+
+@lru_cache(maxsize=None)
+def _zone(name):
+    return ZoneInfo(name)
+
+
+def local_zone():
+    """settings.TIME_ZONE tz 객체 (캐시)"""
+    return _zone(settings.TIME_ZONE)
+
+
+def localize(value):
+    """naive datetime은 TIME_ZONE 시간으로 간주해 aware datetime으로 변환 (aware는 그대로)"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=local_zone())
+    return value
+
+
+def local_minutes(value):
+    """aware datetime => TIME_ZONE 기준 epoch 분"""
+    value = value.astimezone(local_zone())
+    return (value.date() - EPOCH_DATE).days * MINUTES_PER_DAY + value.hour * 60 + value.minute
+
+
+def slot_minutes(indexes, origin):
+    """origin 기준 slot index 목록 => TIME_ZONE 기준 epoch 분 목록"""
+    base = local_minutes(origin)
+    return [base + SLOT_MINUTES * index for index in indexes]
+
+
+def format_local_minutes(minutes):
+    """TIME_ZONE 기준 epoch 분 목록 => 정렬/중복 제거된 "YYYY-MM-DD HH:MM" 목록 (날짜 문자열은 날짜마다 한 번만 생성)"""
+    days = {}
+    formatted = []
+    for value in sorted(set(minutes)):
+        day, minute = divmod(value, MINUTES_PER_DAY)
+        if day not in days:
+            days[day] = (EPOCH_DATE + timedelta(days=day)).isoformat()
+        formatted.append(f"{days[day]} {minute // 60:02d}:{minute % 60:02d}")
+    return formatted
+
+
+def format_slot_indexes(indexes, origin):
+    """origin 기준 slot index 목록 => 정렬/중복 제거된 "YYYY-MM-DD HH:MM" 목록"""
+    return format_local_minutes(slot_minutes(indexes, origin))
@@ -2,11 +2,30 @@
 
 from django.urls import path
 
-from .apis import TutorClassAPI, StudentClassAPI, available_time, available_classe
+from .apis import (
+    TutorClassAPI, TutorClassBulkAPI, TutorClassTemplateAPI, StudentClassAPI, StudentClassAutoBookAPI, WaitlistAPI,
+    available_time, available_time_range, available_classe, available_class_search, slot_supply, class_export,
+)
+from . import async_apis
 
 urlpatterns = [
     path("tutor/", TutorClassAPI.as_view(), name="tutor_view"),
+    path("tutor/bulk/", TutorClassBulkAPI.as_view(), name="tutor_bulk_view"),
+    path("tutor/template/", TutorClassTemplateAPI.as_view(), name="tutor_template_view"),
     path("student/", StudentClassAPI.as_view(), name="student_view"),
+    path("student/auto/", StudentClassAutoBookAPI.as_view(), name="student_auto_book"),
+    path("waitlist/", WaitlistAPI.as_view(), name="waitlist_view"),
     path("available-time/", available_time, name="available_time"),
+    path("available-time/range/", available_time_range, name="available_time_range"),
     path("available-class/", available_classe, name="available_class"),
+    path("available-class/search/", available_class_search, name="available_class_search"),
+    path("supply/", slot_supply, name="slot_supply"),
+    path("export/", class_export, name="class_export"),
+
+    # async 버전 (ASGI 배포용, study/async_apis.py)
+    path("async/tutor/", async_apis.tutor_class_list, name="async_tutor_view"),
+    path("async/student/", async_apis.student_class_list, name="async_student_view"),
+    path("async/available-time/", async_apis.available_time, name="async_available_time"),
+    path("async/available-class/", async_apis.available_classe, name="async_available_class"),
+    path("async/waitlist/", async_apis.waitlist, name="async_waitlist"),
 ]
\ No newline at end of file
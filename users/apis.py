@@ -1,17 +1,25 @@
 # users/apis.py
 
 from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAuthenticated, IsAdminUser
+from rest_framework.parsers import MultiPartParser
+from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt.views import TokenObtainPairView
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from rest_framework_simplejwt.tokens import RefreshToken, TokenError
+from rest_framework_simplejwt.tokens import TokenError
 
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
 from .serializers import CustomTokenObtainPairSerializer
+from .imports import FORMATS, UserImporter, read_rows
+from .tokens import RefreshToken
+
+import io
+
+from django.conf import settings
 
 from django.contrib.auth import get_user_model
 User = get_user_model()
@@ -46,6 +54,63 @@ class SignupAPIView(APIView):
             return Response({"message":"회원가입 성공"}, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+class UserImportAPI(APIView):
+    authentication_classes = [JWTAuthentication]  # 관리자 권한(is_staff)은 현재 User row로 확인
+    permission_classes = [IsAdminUser]
+    parser_classes = [MultiPartParser]
+
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter("file", openapi.IN_FORM, type=openapi.TYPE_FILE, required=True,
+                              description="CSV(email,password,role 헤더) 또는 NDJSON 파일"),
+            openapi.Parameter("file_format", openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                              description="파일 형식 (csv 또는 ndjson, 없으면 확장자로 판단)"),
+        ],
+        responses={
+            200:openapi.Response(
+                description="일괄 가입 결과",
+                examples={
+                    "application/json": {
+                        "message": "2명 가입, 1개 row 실패",
+                        "created": 2,
+                        "failed": 1,
+                        "errors": [
+                            {"line": 3, "email": "student@example.com", "error": "이미 가입된 이메일입니다."}
+                        ]
+                    }
+                }
+            ),
+            400:"파일 없음 또는 잘못된 형식",
+            403:"관리자가 아님",
+        }
+    )
+    def post(self, request):
+        """
+            사용자 일괄 가입 API (관리자)
+
+            파일을 한 줄씩 읽어 batch 단위로 가입시키며, 잘못된 row는 건너뛰고 errors로 반환합니다.
+        """
+        upload = request.FILES.get("file")
+        if upload is None:
+            return Response({"message": "file이 없습니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        file_format = request.query_params.get("file_format") or (
+            "ndjson" if upload.name.endswith((".ndjson", ".jsonl")) else "csv"
+        )
+        if file_format not in FORMATS:
+            return Response({"message": "file_format은 csv 또는 ndjson만 가능합니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        lines = io.TextIOWrapper(upload.file, encoding="utf-8", newline="")
+        try:
+            result = UserImporter(workers=settings.USER_IMPORT_WORKERS).run(read_rows(lines, file_format))
+        except UnicodeDecodeError:
+            return Response({"message": "UTF-8 파일만 가능합니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(
+            {"message": f"{result['created']}명 가입, {result['failed']}개 row 실패", **result},
+            status=status.HTTP_200_OK,
+        )
+
 class CustomTokenObtainPairAPI(TokenObtainPairView):
     permission_classes = [AllowAny]
 
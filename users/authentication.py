@@ -0,0 +1,33 @@
+# users/authentication.py
+
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.models import TokenUser
+
+from .tokens import USER_CLAIMS
+
+
+class ClaimsUser(TokenUser):
+    """
+        access token의 claim으로 만든 user (DB 조회 없음)
+
+        id, role, is_staff만 사용할 수 있다. User row의 다른 값이 필요한 API는
+        authentication_classes = [JWTAuthentication]으로 직접 지정한다.
+    """
+
+    @property
+    def role(self):
+        return self.token["role"]
+
+
+class JWTClaimsAuthentication(JWTAuthentication):
+    """
+        JWT 인증 (token claim 기반, 요청마다 User 조회 없음)
+
+        role claim이 없는 이전에 발급된 token은 기존처럼 User row를 조회한다.
+        탈퇴/비활성화는 access token이 만료(ACCESS_TOKEN_LIFETIME)된 뒤 반영된다.
+    """
+
+    def get_user(self, validated_token):
+        if any(claim not in validated_token for claim in USER_CLAIMS):
+            return super().get_user(validated_token)
+        return ClaimsUser(validated_token)
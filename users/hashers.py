@@ -0,0 +1,59 @@
+# users/hashers.py
+
+"""
+비밀번호 hash 설정
+
+hash 비용은 settings.PASSWORD_HASHING 값으로 정한다. (manage.py calibrate_hasher로 서버에서 측정한 값 사용)
+PASSWORD_HASHERS의 첫 번째 hasher로 새 비밀번호를 저장하고, 나머지는 이전 hash 검증에만 사용한다.
+로그인 시 비밀번호가 맞으면 User.check_password()가 알고리즘/비용이 다른 이전 hash를 현재 설정으로 다시 저장한다.
+"""
+
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher, ScryptPasswordHasher
+
+DEFAULTS = {
+    "PBKDF2_ITERATIONS": PBKDF2PasswordHasher.iterations,
+    "SCRYPT_WORK_FACTOR": 2 ** 14,
+    "SCRYPT_BLOCK_SIZE": 8,
+    "SCRYPT_PARALLELISM": 1,
+}
+
+
+def hashing_setting(name):
+    return getattr(settings, "PASSWORD_HASHING", {}).get(name, DEFAULTS[name])
+
+
+class TunedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """반복 횟수를 PASSWORD_HASHING["PBKDF2_ITERATIONS"]로 정하는 PBKDF2 (다른 반복 횟수의 hash도 검증 가능)"""
+
+    @property
+    def iterations(self):
+        return hashing_setting("PBKDF2_ITERATIONS")
+
+
+class TunedScryptPasswordHasher(ScryptPasswordHasher):
+    """비용(n, r, p)을 PASSWORD_HASHING["SCRYPT_*"]로 정하는 scrypt"""
+
+    @property
+    def work_factor(self):
+        return hashing_setting("SCRYPT_WORK_FACTOR")
+
+    @property
+    def block_size(self):
+        return hashing_setting("SCRYPT_BLOCK_SIZE")
+
+    @property
+    def parallelism(self):
+        return hashing_setting("SCRYPT_PARALLELISM")
+
+    @property
+    def maxmem(self):
+        """
+            hashlib.scrypt 메모리 상한 (ScryptPasswordHasher.encode / verify에서 사용)
+
+            메모리 사용량은 약 128 * n * r byte => OpenSSL 기본 상한(32MB)보다 큰 설정도 계산할 수 있게 한다.
+            비용을 낮춘 뒤에도 이전 hash를 검증해 다시 저장할 수 있도록 기본 비용 기준보다 작게 하지 않는다.
+        """
+        work_factor = max(self.work_factor, DEFAULTS["SCRYPT_WORK_FACTOR"])
+        block_size = max(self.block_size, DEFAULTS["SCRYPT_BLOCK_SIZE"])
+        return 256 * work_factor * block_size
@@ -0,0 +1,148 @@
+# users/imports.py
+
+"""
+사용자 일괄 가입 (CSV / NDJSON)
+
+파일을 한 줄씩 읽어 batch_size개씩 처리한다.
+    1. 형식 검증 (회원가입 API와 같은 serializer)
+    2. 이메일 중복 확인 (파일 안 중복 + batch 단위 DB 조회 1회)
+    3. 비밀번호 hash (process pool에서 병렬 계산)
+    4. bulk_create
+잘못된 row는 건너뛰고 (줄 번호, 이메일, 오류)를 모아 반환한다.
+"""
+
+import csv
+import json
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+import django
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+
+from .serializers import UserImportRowSerializer
+
+from django.contrib.auth import get_user_model
+User = get_user_model()
+
+FORMATS = ("csv", "ndjson")
+BATCH_SIZE = 1000
+
+
+def read_rows(lines, format="csv"):
+    """텍스트 줄 iterator => (줄 번호, row dict 또는 None, 오류) generator"""
+    if format == "csv":
+        reader = csv.DictReader(lines)
+        for row in reader:
+            yield reader.line_num, row, None
+        return
+
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            yield line_number, None, "JSON 형식이 올바르지 않습니다."
+            continue
+        if not isinstance(row, dict):
+            yield line_number, None, "JSON object여야 합니다."
+            continue
+        yield line_number, row, None
+
+
+def clean_row(row):
+    """(email, password, role) 반환, 잘못된 값이면 ValidationError (회원가입 API와 같은 serializer로 검증)"""
+    # serializer는 숫자를 문자열로 바꿔 받으므로 NDJSON의 숫자 / list 값은 먼저 거른다.
+    for field in ("email", "password", "role"):
+        if not isinstance(row.get(field) or "", str):
+            raise ValidationError(f"{field}는 문자열이어야 합니다.")
+
+    serializer = UserImportRowSerializer(data=row)
+    if not serializer.is_valid():
+        raise ValidationError([str(message) for messages in serializer.errors.values() for message in messages])
+
+    data = serializer.validated_data
+    return User.objects.normalize_email(data["email"]), data["password"], data["role"]
+
+
+def _init_worker():
+    # spawn 방식으로 실행된 process는 Django 설정을 다시 불러와야 한다.
+    django.setup()
+
+
+class UserImporter:
+
+    def __init__(self, batch_size=BATCH_SIZE, workers=0):
+        """workers: 비밀번호 hash process 수 (0이면 현재 process에서 계산, None이면 CPU 수)"""
+        self.batch_size = batch_size
+        self.workers = workers
+        self.created = 0
+        self.errors = []
+        self._seen = set()
+
+    def run(self, rows):
+        """read_rows() 결과를 가입 처리하고 {created, failed, errors} 반환"""
+        executor = ProcessPoolExecutor(self.workers, initializer=_init_worker) if self.workers != 0 else None
+        try:
+            rows = iter(rows)
+            while batch := list(islice(rows, self.batch_size)):
+                self.import_batch(batch, executor)
+        finally:
+            if executor:
+                executor.shutdown()
+
+        return {"created": self.created, "failed": len(self.errors), "errors": self.errors}
+
+    def error(self, line_number, email, message):
+        self.errors.append({"line": line_number, "email": email, "error": message})
+
+    def import_batch(self, batch, executor):
+        valid = []
+        for line_number, row, error in batch:
+            if error:
+                self.error(line_number, None, error)
+                continue
+            try:
+                email, password, role = clean_row(row)
+            except ValidationError as e:
+                self.error(line_number, row.get("email"), " ".join(e.messages))
+                continue
+
+            if email in self._seen:
+                self.error(line_number, email, "파일 안에 중복된 이메일입니다.")
+                continue
+            self._seen.add(email)
+            valid.append((line_number, email, password, role))
+
+        existing = set(User.objects.filter(email__in=[email for _, email, _, _ in valid]).values_list("email", flat=True))
+        pending = []
+        for line_number, email, password, role in valid:
+            if email in existing:
+                self.error(line_number, email, "이미 가입된 이메일입니다.")
+            else:
+                pending.append((line_number, email, password, role))
+
+        passwords = [password for _, _, password, _ in pending]
+        hashes = executor.map(make_password, passwords, chunksize=32) if executor else map(make_password, passwords)
+        users = [
+            (line_number, User(email=email, role=role, password=encoded))
+            for (line_number, email, _, role), encoded in zip(pending, hashes)
+        ]
+        self.insert(users)
+
+    def insert(self, users):
+        try:
+            with transaction.atomic():
+                User.objects.bulk_create([user for _, user in users])
+            self.created += len(users)
+        except IntegrityError:
+            # 확인 후 다른 요청으로 같은 이메일이 가입된 경우 => 한 명씩 저장해 실패한 row만 기록
+            for line_number, user in users:
+                try:
+                    with transaction.atomic():
+                        user.save(force_insert=True)
+                    self.created += 1
+                except IntegrityError:
+                    self.error(line_number, user.email, "이미 가입된 이메일입니다.")
@@ -0,0 +1,41 @@
+# users/management/commands/benchmark_revocation.py
+
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment, override_settings
+
+from users.benchmarks import revocation_benchmark
+from users.revocation import revocation_setting
+
+
+class Command(BaseCommand):
+    help = (
+        "refresh token 폐기 확인 비용(Bloom filter 메모리 / 확인 시간 / 오탐률, RevokedToken 조회 시간)을 "
+        "테스트 DB에서 측정합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tokens", type=int, default=10_000_000, help="Bloom filter에 넣을 폐기 token 수")
+        parser.add_argument("--db-tokens", type=int, default=100_000, help="RevokedToken에 넣을 row 수")
+        parser.add_argument("--lookups", type=int, default=10_000)
+
+    @override_settings(CACHES=settings.ISOLATED_CACHES)  # 임시 DB 기준 캐시 값이 공유 캐시에 섞이지 않도록
+    def handle(self, *args, **options):
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+
+        try:
+            result = revocation_benchmark(
+                tokens=options["tokens"],
+                db_tokens=options["db_tokens"],
+                lookups=options["lookups"],
+                error_rate=revocation_setting("BLOOM_ERROR_RATE"),
+            )
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        self.stdout.write(json.dumps(result, indent=2))
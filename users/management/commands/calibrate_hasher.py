@@ -0,0 +1,84 @@
+# users/management/commands/calibrate_hasher.py
+
+import time as timer
+
+from django.core.management.base import BaseCommand
+
+from users.hashers import TunedPBKDF2PasswordHasher, TunedScryptPasswordHasher
+
+PASSWORD = "calibrate-password"
+SALT = "calibratesalt123"
+
+
+class Command(BaseCommand):
+    help = (
+        "현재 서버에서 비밀번호 hash 시간을 측정하고, 목표 시간(--target-ms)에 맞는 "
+        "settings.PASSWORD_HASHING 값을 제안합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--target-ms", type=float, default=100, help="hash 1회 목표 시간 (ms)")
+        parser.add_argument("--algorithm", choices=("scrypt", "pbkdf2_sha256"), default="scrypt")
+        parser.add_argument("--samples", type=int, default=3, help="설정별 측정 횟수 (가장 짧은 시간 사용)")
+        parser.add_argument("--max-memory-mb", type=int, default=64, help="scrypt hash 1회 최대 메모리 (MB)")
+
+    def handle(self, *args, **options):
+        if options["algorithm"] == "scrypt":
+            suggestion = self.calibrate_scrypt(options)
+        else:
+            suggestion = self.calibrate_pbkdf2(options)
+
+        self.stdout.write(self.style.SUCCESS("config/settings.py 제안 값:"))
+        self.stdout.write("PASSWORD_HASHING = {")
+        self.stdout.write(f'    "ALGORITHM": "{options["algorithm"]}",')
+        for name, value in suggestion.items():
+            self.stdout.write(f'    "{name}": {value},')
+        self.stdout.write("}")
+
+    def measure(self, encode, samples):
+        timings = []
+        for _ in range(samples):
+            started = timer.perf_counter()
+            encode()
+            timings.append((timer.perf_counter() - started) * 1000)
+        return min(timings)
+
+    def calibrate_pbkdf2(self, options):
+        hasher = TunedPBKDF2PasswordHasher()
+
+        # 시간은 반복 횟수에 비례하므로 기준 횟수로 측정한 뒤 목표 시간에 맞게 환산
+        base = 100_000
+        elapsed = self.measure(lambda: hasher.encode(PASSWORD, SALT, iterations=base), options["samples"])
+        iterations = max(base, int(round(base * options["target_ms"] / elapsed, -4)))
+        elapsed = self.measure(lambda: hasher.encode(PASSWORD, SALT, iterations=iterations), options["samples"])
+
+        self.stdout.write(f"pbkdf2_sha256 iterations={iterations:,}: {elapsed:.1f}ms")
+        return {"PBKDF2_ITERATIONS": f"{iterations:_}"}
+
+    def calibrate_scrypt(self, options):
+        hasher = TunedScryptPasswordHasher()
+        block_size, parallelism = 8, 1
+        max_memory = options["max_memory_mb"] * 1024 * 1024
+
+        # n을 2배씩 늘리며 목표 시간 / 메모리 상한 이하인 가장 큰 값을 찾는다.
+        chosen = None
+        work_factor = 2 ** 12
+        while 128 * work_factor * block_size <= max_memory:
+            elapsed = self.measure(
+                lambda: hasher.encode(PASSWORD, SALT, work_factor, block_size, parallelism), options["samples"]
+            )
+            memory_mb = 128 * work_factor * block_size / 1024 / 1024
+            self.stdout.write(f"scrypt n=2**{work_factor.bit_length() - 1} r={block_size}: {elapsed:.1f}ms, {memory_mb:.0f}MB")
+
+            if elapsed > options["target_ms"]:
+                chosen = chosen or work_factor  # 가장 작은 값도 목표 시간을 넘으면 가장 작은 값 사용
+                break
+            chosen = work_factor
+            work_factor *= 2
+
+        chosen = chosen or 2 ** 12
+        return {
+            "SCRYPT_WORK_FACTOR": f"2 ** {chosen.bit_length() - 1}",
+            "SCRYPT_BLOCK_SIZE": block_size,
+            "SCRYPT_PARALLELISM": parallelism,
+        }
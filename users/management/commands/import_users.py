@@ -0,0 +1,48 @@
+# users/management/commands/import_users.py
+
+import json
+import sys
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from users.imports import FORMATS, BATCH_SIZE, UserImporter, read_rows
+
+
+class Command(BaseCommand):
+    help = (
+        "CSV(email,password,role 헤더) 또는 NDJSON 파일로 사용자를 일괄 가입시킵니다. "
+        "잘못된 row는 건너뛰고 마지막에 오류 목록을 출력합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="가입시킬 사용자 파일 경로 (-이면 표준 입력)")
+        parser.add_argument("--format", choices=FORMATS, help="파일 형식 (없으면 확장자로 판단)")
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+        parser.add_argument("--workers", type=int, help="비밀번호 hash process 수 (기본: CPU 수, 0이면 단일 process)")
+        parser.add_argument("--errors", help="오류 row를 NDJSON으로 저장할 경로 (없으면 화면에 출력)")
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        format = options["format"] or ("ndjson" if path.endswith((".ndjson", ".jsonl")) else "csv")
+
+        importer = UserImporter(batch_size=options["batch_size"], workers=options["workers"])
+
+        if path == "-":
+            result = importer.run(read_rows(sys.stdin, format))
+        else:
+            try:
+                with open(path, newline="", encoding="utf-8") as lines:
+                    result = importer.run(read_rows(lines, format))
+            except OSError as e:
+                raise CommandError(f"파일을 읽을 수 없습니다: {e}")
+
+        if options["errors"]:
+            Path(options["errors"]).write_text(
+                "".join(json.dumps(error, ensure_ascii=False) + "\n" for error in result["errors"]), encoding="utf-8"
+            )
+        else:
+            for error in result["errors"]:
+                self.stderr.write(f"{error['line']}번째 줄 ({error['email']}): {error['error']}")
+
+        self.stdout.write(self.style.SUCCESS(f"{result['created']}명 가입, {result['failed']}개 row 실패"))
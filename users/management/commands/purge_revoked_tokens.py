@@ -0,0 +1,26 @@
+# users/management/commands/purge_revoked_tokens.py
+
+from django.core.management.base import BaseCommand
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+from users.models import RevokedToken
+from users.revocation import CHUNK_SIZE, purge_expired
+
+
+class Command(BaseCommand):
+    help = (
+        "만료된 폐기 token(RevokedToken)과 이전 token 목록(OutstandingToken, BlacklistedToken)을 batch 단위로 삭제합니다. "
+        "(cron 등으로 주기적으로 실행)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        revoked = purge_expired(RevokedToken, options["batch_size"])
+        # BlacklistedToken은 OutstandingToken 삭제 시 함께 삭제된다. (CASCADE)
+        outstanding = purge_expired(OutstandingToken, options["batch_size"])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"만료된 폐기 token {revoked}개, 이전 token 목록 {outstanding}개를 삭제했습니다."
+        ))
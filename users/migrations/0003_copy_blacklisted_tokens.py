@@ -0,0 +1,37 @@
+# 배포 전에 폐기(BlacklistedToken)된 refresh token을 RevokedToken으로 옮긴다.
+# (RefreshToken.check_blacklist는 RevokedToken만 확인하므로, 옮기지 않으면 만료 전까지 다시 사용할 수 있다.)
+
+from django.db import migrations
+from django.utils import timezone
+
+BATCH_SIZE = 10_000
+
+
+def copy_blacklisted_tokens(apps, schema_editor):
+    BlacklistedToken = apps.get_model("token_blacklist", "BlacklistedToken")
+    RevokedToken = apps.get_model("users", "RevokedToken")
+
+    rows = (
+        BlacklistedToken.objects.filter(token__expires_at__gt=timezone.now(), token__jti__isnull=False)
+        .values_list("token__jti", "token__expires_at")
+        .iterator(chunk_size=BATCH_SIZE)
+    )
+    batch = []
+    for jti, expires_at in rows:
+        batch.append(RevokedToken(jti=jti, expires_at=expires_at))
+        if len(batch) >= BATCH_SIZE:
+            RevokedToken.objects.bulk_create(batch, ignore_conflicts=True)
+            batch = []
+    RevokedToken.objects.bulk_create(batch, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0002_revokedtoken"),
+        ("token_blacklist", "0012_alter_outstandingtoken_user"),
+    ]
+
+    operations = [
+        migrations.RunPython(copy_blacklisted_tokens, migrations.RunPython.noop),
+    ]
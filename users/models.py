@@ -54,3 +54,15 @@ class User(AbstractBaseUser, PermissionsMixin):
     objects = UserManager()
 
     USERNAME_FIELD = "email"
+
+
+class RevokedToken(models.Model):
+    """
+        로그아웃 등으로 폐기된 refresh token (users/revocation.py)
+
+        만료된 token은 다시 사용할 수 없으므로 manage.py purge_revoked_tokens로 주기적으로 삭제한다.
+    """
+
+    jti = models.CharField(max_length=255, primary_key=True)
+    expires_at = models.DateTimeField(db_index=True)  # 만료 row 일괄 삭제
+    revoked_at = models.DateTimeField(auto_now_add=True, db_index=True)  # process별 Bloom filter 동기화
@@ -8,3 +8,11 @@ class IsTutor(BasePermission):
 class IsStudent(BasePermission):
     def has_permission(self, request, view):
         return bool(request.user and request.user.is_authenticated and request.user.role == "student")
+
+
+class IsTutorOrStaff(BasePermission):
+    def has_permission(self, request, view):
+        return bool(
+            request.user and request.user.is_authenticated
+            and (request.user.role == "tutor" or request.user.is_staff)
+        )
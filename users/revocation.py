@@ -0,0 +1,137 @@
+# users/revocation.py
+
+"""
+refresh token 폐기 목록 (RevokedToken + process별 Bloom filter)
+
+폐기된 jti를 Bloom filter에 담아 두고, filter에 없는 jti(대부분의 정상 token)는 DB 조회 없이 통과시킨다.
+filter에 있는 jti만 RevokedToken(primary key 조회)으로 실제 폐기 여부를 확인한다.
+
+다른 process에서 폐기한 token은 SYNC_SECONDS마다 revoked_at 이후 row만 읽어 filter에 추가하고,
+만료된 jti가 filter에 계속 쌓이지 않도록 REBUILD_SECONDS마다 만료 전 row로 filter를 다시 만든다.
+(다른 process의 로그아웃은 최대 SYNC_SECONDS 뒤에 반영된다.)
+"""
+
+import hashlib
+import math
+import threading
+import time as timer
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from .models import RevokedToken
+
+DEFAULTS = {
+    "BLOOM_CAPACITY": 1_000_000,
+    "BLOOM_ERROR_RATE": 0.001,
+    "SYNC_SECONDS": 5,
+    "REBUILD_SECONDS": 60 * 60,
+}
+# 동기화 시작 시점 이전에 commit 중이던 row를 놓치지 않도록 조금 앞에서부터 다시 읽는다.
+SYNC_OVERLAP = timedelta(seconds=2)
+CHUNK_SIZE = 10_000
+
+
+def revocation_setting(name):
+    return getattr(settings, "TOKEN_REVOCATION", {}).get(name, DEFAULTS[name])
+
+
+class BloomFilter:
+    """capacity개를 넣었을 때 오탐률이 error_rate가 되도록 크기를 정한 Bloom filter"""
+
+    def __init__(self, capacity, error_rate=0.001):
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value):
+        # hash 1회(128bit)를 둘로 나눠 double hashing으로 hash_count개 위치 계산
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * second) % self.size for i in range(self.hash_count))
+
+    def add(self, value):
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+
+class RevocationStore:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.bloom = None
+        self.built_at = 0
+        self.synced_at = 0
+        self.cursor = None
+
+    def revoke(self, jti, expires_at):
+        RevokedToken.objects.get_or_create(jti=jti, defaults={"expires_at": expires_at})
+        if self.bloom is not None:
+            self.bloom.add(jti)
+
+    def is_revoked(self, jti):
+        self.refresh()
+        if jti not in self.bloom:
+            return False
+        return RevokedToken.objects.filter(jti=jti).exists()
+
+    def refresh(self):
+        now = timer.monotonic()
+        if self.bloom is not None and now - self.synced_at < revocation_setting("SYNC_SECONDS"):
+            return
+
+        # 다른 thread가 동기화 중이면 기존 filter를 그대로 사용 (처음 만들 때는 기다린다.)
+        if not self._lock.acquire(blocking=self.bloom is None):
+            return
+        try:
+            if self.bloom is None or now - self.built_at >= revocation_setting("REBUILD_SECONDS"):
+                self.rebuild()
+            elif now - self.synced_at >= revocation_setting("SYNC_SECONDS"):
+                self.sync()
+        finally:
+            self._lock.release()
+
+    def rebuild(self):
+        started = timezone.now()
+        active = RevokedToken.objects.filter(expires_at__gt=started)
+
+        bloom = BloomFilter(
+            max(revocation_setting("BLOOM_CAPACITY"), 2 * active.count()), revocation_setting("BLOOM_ERROR_RATE")
+        )
+        for jti in active.values_list("jti", flat=True).iterator(chunk_size=CHUNK_SIZE):
+            bloom.add(jti)
+
+        self.bloom = bloom
+        self.cursor = started - SYNC_OVERLAP
+        self.built_at = self.synced_at = timer.monotonic()
+
+    def sync(self):
+        started = timezone.now()
+        for jti in RevokedToken.objects.filter(revoked_at__gte=self.cursor).values_list("jti", flat=True):
+            self.bloom.add(jti)
+
+        self.cursor = started - SYNC_OVERLAP
+        self.synced_at = timer.monotonic()
+
+
+store = RevocationStore()
+
+
+def purge_expired(model, batch_size=CHUNK_SIZE):
+    """만료된(expires_at) row를 batch_size개씩 삭제하고 삭제한 개수 반환 (한 번에 긴 lock을 잡지 않는다.)"""
+    expired = model.objects.filter(expires_at__lte=timezone.now())
+    deleted = 0
+    while True:
+        pks = list(expired.values_list("pk", flat=True)[:batch_size])
+        if not pks:
+            return deleted
+        model.objects.filter(pk__in=pks).delete()
+        deleted += len(pks)
@@ -1,9 +1,15 @@
 # users/serializers.py
 
 from rest_framework import serializers
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
 from rest_framework.response import Response
-from rest_framework import status
+from rest_framework import status, exceptions
+from rest_framework_simplejwt.settings import api_settings
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import update_last_login
+
+from .tokens import RefreshToken
 
 from django.contrib.auth import get_user_model
 User = get_user_model()
@@ -33,27 +39,52 @@ class UserSignupSerializer(serializers.ModelSerializer):
 
     def create(self, validated_data):
         return User.objects.create_user(**validated_data)
+
+class UserImportRowSerializer(UserSignupSerializer):
+    """
+        일괄 가입(users/imports.py) row 검증 (회원가입과 같은 규칙)
+
+        이메일 중복은 batch 단위로 한 번에 확인하므로 row마다 DB를 조회하는 unique 검증은 뺀다.
+    """
+
+    class Meta(UserSignupSerializer.Meta):
+        extra_kwargs = {"email": {"validators": []}}
     
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
+    token_class = RefreshToken  # role, is_staff claim 포함
 
     def validate(self, attrs):
+        """
+            사용자 조회 1회 + 비밀번호 hash 검증 1회로 로그인
 
-        # 사용자 인증 시도를 위해 이메일과 비밀번호 가져오기
+            super().validate()는 authenticate()로 사용자 조회와 hash 계산을 한 번 더 하므로 사용하지 않고
+            token만 직접 발급한다.
+        """
         email = attrs.get("email")
         password = attrs.get("password")
 
         user_instance = User.objects.filter(email=email).first()
 
-        # 이메일 존재 여부 확인
+        # 이메일 존재 여부 확인 (없는 이메일도 hash를 한 번 계산해 응답 시간으로 가입 여부를 알 수 없게 한다.)
         if not user_instance:
+            make_password(password)
             return Response({"message":"사용자를 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
 
         # 비밀번호 확인
         if not user_instance.check_password(password):
             return Response({"message":"비밀번호가 틀렸습니다."}, status=status.HTTP_400_BAD_REQUEST)
 
-        # 기본 JWT 토큰 생성 로직 실행
-        tokens = super().validate(attrs)
+        if not user_instance.is_active:
+            raise exceptions.AuthenticationFailed(self.error_messages["no_active_account"], "no_active_account")
+
+        refresh = self.get_token(user_instance)
+        tokens = {
+            "refresh": str(refresh),
+            "access": str(refresh.access_token),
+        }
+
+        if api_settings.UPDATE_LAST_LOGIN:
+            update_last_login(None, user_instance)
 
         # 추가 사용자 정보 포함 (선택)
         tokens["user"] = {
@@ -62,4 +93,8 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
             "role" :user_instance.role
         }
 
-        return Response({"data": tokens}, status=status.HTTP_200_OK)
\ No newline at end of file
+        return Response({"data": tokens}, status=status.HTTP_200_OK)
+
+
+class CustomTokenRefreshSerializer(TokenRefreshSerializer):
+    token_class = RefreshToken  # 폐기 여부를 RevokedToken으로 확인
@@ -1,3 +1,320 @@
-from django.test import TestCase
+import importlib
+import io
+import json
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.auth.hashers import get_hasher, make_password
+from django.apps import apps as django_apps
+from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt import tokens as simplejwt_tokens
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+from study.benchmarks import seed, endpoint_cases, measure, QUERY_BUDGETS
+
+from . import revocation
+from .authentication import ClaimsUser
+from .imports import UserImporter, read_rows
+from .models import RevokedToken
+from .tokens import RefreshToken
+
+from django.contrib.auth import get_user_model
+User = get_user_model()
 
 # Create your tests here.
+class UserEndpointQueryBudgetTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        seed(tutors=5, students=5, classes_per_tutor=5, days=1)
+
+    def test_signup_query_budget(self):
+        result = measure(*endpoint_cases()["signup"], iterations=1)
+
+        self.assertEqual(result["status_code"], 201)
+        self.assertLessEqual(result["queries"], QUERY_BUDGETS["signup"])
+
+    def test_login_query_budget(self):
+        result = measure(*endpoint_cases()["login"], iterations=1)
+
+        self.assertEqual(result["status_code"], 200)
+        self.assertLessEqual(result["queries"], QUERY_BUDGETS["login"])
+
+
+class ClaimsAuthenticationTest(TestCase):
+
+    def setUp(self):
+        self.tutor = User.objects.create_user("tutor@example.com", "test1234", role="tutor")
+        self.client = APIClient()
+
+    def login(self):
+        response = self.client.post("/user/signin/", {"email": "tutor@example.com", "password": "test1234"}, format="json")
+        return response.data["data"]
+
+    def test_login_tokens_carry_role(self):
+        tokens = self.login()
+        access = simplejwt_tokens.AccessToken(tokens["access"])
+
+        self.assertEqual((access["user_id"], access["role"], access["is_staff"]), (self.tutor.id, "tutor", False))
+
+        refreshed = self.client.post("/user/token/refresh", {"refresh": tokens["refresh"]}, format="json")
+        self.assertEqual(simplejwt_tokens.AccessToken(refreshed.data["access"])["role"], "tutor")
+
+    def test_permission_checked_without_user_lookup(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.login()['access']}")
+
+        with self.assertNumQueries(1):  # 수업 목록 조회만
+            response = self.client.get("/study/tutor/")
+        self.assertEqual(response.status_code, 200)
+        self.assertIsInstance(response.wsgi_request.user, ClaimsUser)
+
+        self.assertEqual(self.client.get("/study/student/").status_code, 200)
+        self.assertEqual(self.client.get("/study/available-class/").status_code, 403)
+
+    def test_token_without_claims_falls_back_to_user_row(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {simplejwt_tokens.AccessToken.for_user(self.tutor)}")
+
+        with self.assertNumQueries(2):  # User 조회 + 수업 목록 조회
+            response = self.client.get("/study/tutor/")
+        self.assertEqual(response.status_code, 200)
+        self.assertIsInstance(response.wsgi_request.user, User)
+
+
+class LoginTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user("student@example.com", "test1234", role="student")
+        self.client = APIClient()
+
+    def login(self, email, password):
+        hasher = type(get_hasher())
+        with mock.patch.object(hasher, "encode", autospec=True, side_effect=hasher.encode) as encode:
+            response = self.client.post("/user/signin/", {"email": email, "password": password}, format="json")
+        return response, encode.call_count
+
+    def test_login_hashes_password_once(self):
+        response, hashes = self.login("student@example.com", "test1234")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["data"]["user"]["id"], self.user.id)
+        self.assertEqual(hashes, 1)
+
+    def test_wrong_password_and_unknown_email(self):
+        response, hashes = self.login("student@example.com", "wrong-password")
+        self.assertEqual((response.status_code, hashes), (400, 1))
+
+        # 없는 이메일도 hash를 한 번 계산한다.
+        response, hashes = self.login("nobody@example.com", "test1234")
+        self.assertEqual((response.status_code, hashes), (404, 1))
+
+    def test_inactive_user_cannot_login(self):
+        User.objects.filter(id=self.user.id).update(is_active=False)
+
+        response, _ = self.login("student@example.com", "test1234")
+        self.assertEqual(response.status_code, 401)
+
+
+class PasswordRehashTest(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def login(self):
+        return self.client.post("/user/signin/", {"email": "tutor@example.com", "password": "test1234"}, format="json")
+
+    def test_legacy_pbkdf2_hash_upgraded_on_login(self):
+        user = User.objects.create_user("tutor@example.com", role="tutor")
+        User.objects.filter(id=user.id).update(password=make_password("test1234", hasher="pbkdf2_sha256"))
+
+        self.assertEqual(self.login().status_code, 200)
+
+        user.refresh_from_db()
+        self.assertEqual(user.password.split("$")[0], get_hasher().algorithm)
+        self.assertEqual(self.login().status_code, 200)
+
+    def test_cost_change_rehashes_on_login(self):
+        user = User.objects.create_user("tutor@example.com", "test1234", role="tutor")
+        self.assertEqual(user.password.split("$")[:2], ["scrypt", str(2 ** 14)])
+
+        with self.settings(PASSWORD_HASHING={**settings.PASSWORD_HASHING, "SCRYPT_WORK_FACTOR": 2 ** 12}):
+            self.assertEqual(self.login().status_code, 200)
+
+        user.refresh_from_db()
+        self.assertEqual(user.password.split("$")[:2], ["scrypt", str(2 ** 12)])
+
+    @override_settings(PASSWORD_HASHING={"ALGORITHM": "pbkdf2_sha256", "PBKDF2_ITERATIONS": 10_000})
+    def test_tuned_pbkdf2_iterations(self):
+        self.assertEqual(make_password("test1234", hasher="pbkdf2_sha256").split("$")[1], "10000")
+
+
+class UserImportTest(TestCase):
+
+    CSV = (
+        "email,password,role\n"
+        "tutor1@example.com,test1234,tutor\n"
+        "student1@example.com,test1234,student\n"
+        "student1@example.com,test1234,student\n"  # 파일 안 중복
+        "existing@example.com,test1234,student\n"  # 이미 가입
+        "bad-email,test1234,student\n"
+        "student2@example.com,short,student\n"
+        "student3@example.com,test1234,admin\n"
+    )
+
+    def setUp(self):
+        User.objects.create_user("existing@example.com", "test1234", role="student")
+
+    def test_invalid_rows_reported_without_aborting(self):
+        result = UserImporter(batch_size=2, workers=0).run(read_rows(io.StringIO(self.CSV), "csv"))
+
+        self.assertEqual(result["created"], 2)
+        self.assertEqual([error["line"] for error in result["errors"]], [4, 5, 6, 7, 8])
+        self.assertTrue(User.objects.get(email="tutor1@example.com").check_password("test1234"))
+
+    def test_ndjson_parse_errors(self):
+        lines = [
+            json.dumps({"email": "student1@example.com", "password": "test1234", "role": "student"}),
+            "{not json",
+            "[1, 2]",
+        ]
+        result = UserImporter(workers=0).run(read_rows(io.StringIO("\n".join(lines)), "ndjson"))
+
+        self.assertEqual(result["created"], 1)
+        self.assertEqual([error["line"] for error in result["errors"]], [2, 3])
+
+    def test_ndjson_non_string_fields(self):
+        lines = [
+            json.dumps({"email": 123, "password": "test1234", "role": "student"}),
+            json.dumps({"email": "student2@example.com", "password": 12345678, "role": "student"}),
+            json.dumps({"email": "student3@example.com", "password": "test1234", "role": ["tutor"]}),
+            json.dumps({"email": "student1@example.com", "password": "test1234", "role": "student"}),
+        ]
+        result = UserImporter(workers=0).run(read_rows(io.StringIO("\n".join(lines)), "ndjson"))
+
+        self.assertEqual(result["created"], 1)
+        self.assertEqual([error["line"] for error in result["errors"]], [1, 2, 3])
+
+    def test_rows_validated_like_signup(self):
+        client = APIClient()
+        for row in (
+            {"email": "student2@example.com", "password": "short", "role": "student"},
+            {"email": "student3@example.com", "password": "test1234", "role": "admin"},
+            {"email": "bad-email", "password": "test1234", "role": "student"},
+        ):
+            with self.subTest(row=row):
+                signup = client.post("/user/signup/", row, format="json")
+                result = UserImporter().run(read_rows(io.StringIO(json.dumps(row)), "ndjson"))
+
+                self.assertEqual(signup.status_code, 400)
+                self.assertEqual(result["errors"][0]["error"], " ".join(str(m) for m in sum(signup.data.values(), [])))
+
+    def test_command_hashes_in_process_pool(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "users.csv"
+            path.write_text(self.CSV)
+            errors = Path(directory) / "errors.ndjson"
+
+            call_command("import_users", str(path), workers=2, errors=str(errors), stdout=io.StringIO())
+
+            self.assertEqual(len(errors.read_text().splitlines()), 5)
+        self.assertTrue(User.objects.get(email="student1@example.com").check_password("test1234"))
+
+    def test_endpoint_admin_only(self):
+        admin = User.objects.create_superuser("admin@example.com", "test1234")
+        client = APIClient()
+        upload = lambda: SimpleUploadedFile("users.csv", self.CSV.encode())
+
+        client.force_authenticate(User.objects.get(email="existing@example.com"))
+        self.assertEqual(client.post("/user/import/", {"file": upload()}).status_code, 403)
+
+        client.force_authenticate(admin)
+        with mock.patch("users.imports.ProcessPoolExecutor") as pool:
+            response = client.post("/user/import/", {"file": upload()})
+        pool.assert_not_called()  # 기본값은 요청 process에서 hash 계산
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.data["created"], response.data["failed"]), (2, 5))
+
+
+class TokenRevocationTest(TestCase):
+
+    def setUp(self):
+        revocation.store.reset()
+        self.user = User.objects.create_user("student@example.com", "test1234", role="student")
+        self.client = APIClient()
+
+    def login(self):
+        response = self.client.post("/user/signin/", {"email": "student@example.com", "password": "test1234"}, format="json")
+        return response.data["data"]
+
+    def refresh(self, token):
+        return self.client.post("/user/token/refresh", {"refresh": token}, format="json")
+
+    def test_bloom_filter_has_no_false_negatives(self):
+        bloom = revocation.BloomFilter(1000, 0.01)
+        for i in range(1000):
+            bloom.add(f"jti-{i}")
+
+        self.assertTrue(all(f"jti-{i}" in bloom for i in range(1000)))
+        self.assertLess(sum(f"other-{i}" in bloom for i in range(10000)), 300)
+
+    def test_logout_revokes_refresh_token(self):
+        tokens = self.login()
+        self.assertFalse(OutstandingToken.objects.exists())
+        self.assertEqual(self.refresh(tokens["refresh"]).status_code, 200)
+
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        response = self.client.post("/user/logout/", {"refresh": tokens["refresh"]}, format="json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.refresh(tokens["refresh"]).status_code, 401)
+        self.assertEqual(self.refresh(self.login()["refresh"]).status_code, 200)
+
+    def test_token_blacklisted_before_migration_stays_revoked(self):
+        # 변경 전 방식(OutstandingToken + BlacklistedToken)으로 폐기된 token
+        legacy = simplejwt_tokens.RefreshToken.for_user(self.user)
+        legacy.blacklist()
+        expired = simplejwt_tokens.RefreshToken.for_user(self.user)
+        expired.set_exp(lifetime=-timedelta(minutes=1))
+        OutstandingToken.objects.filter(jti=expired["jti"]).update(expires_at=timezone.now() - timedelta(minutes=1))
+        expired.blacklist()
+
+        migration = importlib.import_module("users.migrations.0003_copy_blacklisted_tokens")
+        migration.copy_blacklisted_tokens(django_apps, None)
+
+        self.assertEqual(list(RevokedToken.objects.values_list("jti", flat=True)), [legacy["jti"]])
+        self.assertEqual(self.refresh(str(legacy)).status_code, 401)
+
+    def test_active_token_checked_without_query(self):
+        token = RefreshToken.for_user(self.user)
+        revocation.store.refresh()
+
+        with self.assertNumQueries(0):
+            token.check_blacklist()
+
+    @override_settings(TOKEN_REVOCATION={"SYNC_SECONDS": 0})
+    def test_revocation_from_other_process_synced(self):
+        token = RefreshToken.for_user(self.user)
+        token.check_blacklist()  # filter 생성
+
+        # 다른 process의 로그아웃 (현재 process의 filter에는 추가되지 않음)
+        RevokedToken.objects.create(jti=token["jti"], expires_at=timezone.now() + timedelta(days=1))
+
+        with self.assertRaises(TokenError):
+            token.check_blacklist()
+
+    def test_purge_command_deletes_expired_rows(self):
+        now = timezone.now()
+        RevokedToken.objects.create(jti="expired", expires_at=now - timedelta(minutes=1))
+        RevokedToken.objects.create(jti="active", expires_at=now + timedelta(days=1))
+
+        call_command("purge_revoked_tokens", batch_size=1, stdout=io.StringIO())
+
+        self.assertEqual(list(RevokedToken.objects.values_list("jti", flat=True)), ["active"])
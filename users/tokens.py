@@ -0,0 +1,52 @@
+# users/tokens.py
+
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt import tokens
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from . import revocation
+
+# 요청마다 User row를 조회하지 않고 권한을 확인할 수 있도록 token에 담는 사용자 정보
+USER_CLAIMS = ("role", "is_staff")
+
+
+def add_user_claims(token, user):
+    for claim in USER_CLAIMS:
+        token[claim] = getattr(user, claim)
+    return token
+
+
+class AccessToken(tokens.AccessToken):
+
+    @classmethod
+    def for_user(cls, user):
+        return add_user_claims(super().for_user(user), user)
+
+
+class RefreshToken(tokens.RefreshToken):
+    """
+        refresh token
+
+        발급 시 token 목록(OutstandingToken)을 저장하지 않고,
+        폐기(로그아웃)된 token만 RevokedToken에 저장해 확인한다. (users/revocation.py)
+    """
+    access_token_class = AccessToken
+
+    @classmethod
+    def for_user(cls, user):
+        # BlacklistMixin.for_user(OutstandingToken 저장)를 건너뛰고 Token.for_user로 발급
+        token = super(tokens.BlacklistMixin, cls).for_user(user)
+        # refresh token의 claim은 access token 발급 시 그대로 복사된다.
+        return add_user_claims(token, user)
+
+    def outstand(self):
+        pass
+
+    def check_blacklist(self):
+        if revocation.store.is_revoked(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self):
+        revocation.store.revoke(self.payload[api_settings.JTI_CLAIM], datetime_from_epoch(self.payload["exp"]))
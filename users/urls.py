@@ -4,10 +4,11 @@ from django.urls import path, include
 
 from rest_framework_simplejwt.views import TokenRefreshView
 
-from .apis import SignupAPIView, CustomTokenObtainPairAPI, logout_api
+from .apis import SignupAPIView, UserImportAPI, CustomTokenObtainPairAPI, logout_api
 
 urlpatterns = [
     path("signup/", SignupAPIView.as_view(), name="signup"),
+    path("import/", UserImportAPI.as_view(), name="user_import"),
     path("signin/", CustomTokenObtainPairAPI.as_view(), name="signin"),
     path("token/refresh", TokenRefreshView.as_view(), name="token_refresh"),
     path("logout/", logout_api, name="logout"),